@@ -0,0 +1,251 @@
+/*
+ * PokeAkane サービスワーカー
+ * - precache_manifest.json（tools/utilities/build_precache_manifest.py で生成）のファイルを install 時に取得し、
+ *   以降はローカルのキャッシュから返す。前回の一覧と内容ハッシュが同じファイルは取り直さない
+ *   （サーバーに無いファイル（404）は飛ばし、次の更新時にまた取得を試みる）
+ * - pokemon_images/ の画像は表示したときにキャッシュし、合計サイズが上限を超えたら
+ *   最後に使った時刻の古いものから削除する（LRU）。縮小版・アトラスの一覧 JSON はファイル名にハッシュが無いので
+ *   ネットワーク優先で、つながらないときだけキャッシュを返す
+ * - 元画像の内容が変わったら（image_assets.json のハッシュが変わったら）その画像のキャッシュを捨てる
+ * - /api/ などそれ以外のリクエストはそのままネットワークへ
+ *
+ * PRECACHE_REVISION は生成ツールが書き換える（ファイルが変わるとブラウザが新しいワーカーを install する）
+ */
+const PRECACHE_REVISION = 'ff50524c09';
+
+const MANIFEST_URL = 'precache_manifest.json';
+const PRECACHE = 'pokeakane-precache';
+const STAGING = `pokeakane-staging-${PRECACHE_REVISION}`;
+const RUNTIME = 'pokeakane-images';
+// キャッシュ内の管理用エントリ（実在しないパス）
+const STATE_KEY = '__precache_state__';
+const LRU_KEY = '__image_lru__';
+const DEFAULT_RUNTIME = { prefixes: ['pokemon_images/'], max_bytes: 64 * 1024 * 1024, image_assets: null };
+// install 時の同時ダウンロード数
+const FETCH_CONCURRENCY = 6;
+// LRU の使用時刻を保存するまでの待ち時間（連続表示をまとめて1回で書く）
+const LRU_SAVE_DELAY = 2000;
+
+const MATCH_OPTIONS = { ignoreSearch: true, ignoreVary: true };
+
+const scopeUrl = path => new URL(path, self.registration.scope).href;
+
+async function readJson(cacheName, key) {
+    const cache = await caches.open(cacheName);
+    const response = await cache.match(scopeUrl(key), MATCH_OPTIONS);
+    return response ? response.json() : null;
+}
+
+async function writeJson(cacheName, key, value) {
+    const cache = await caches.open(cacheName);
+    await cache.put(scopeUrl(key), new Response(JSON.stringify(value), {
+        headers: { 'Content-Type': 'application/json' },
+    }));
+}
+
+// image_assets.json の内容 → 画像のパス → ハッシュ
+async function imageHashes(cache, path) {
+    if (!path) return null;
+    const response = await cache.match(scopeUrl(path), MATCH_OPTIONS);
+    if (!response) return null;
+    const assets = await response.json();
+    const hashes = new Map();
+    Object.values(assets.pokemon).forEach(entry => {
+        Object.entries(entry.images).forEach(([image, info]) => hashes.set(scopeUrl(assets.root + image), info[3]));
+    });
+    return hashes;
+}
+
+// 変わったファイルだけを STAGING に取得（有効化されるまで現在のキャッシュには触らない）
+self.addEventListener('install', event => {
+    event.waitUntil((async () => {
+        const response = await fetch(MANIFEST_URL, { cache: 'no-cache' });
+        if (!response.ok) throw new Error(`${MANIFEST_URL}: HTTP ${response.status}`);
+        const manifest = await response.json();
+        if (manifest.version !== 1) throw new Error(`${MANIFEST_URL}: 未対応の version ${manifest.version}`);
+
+        const previous = (await readJson(PRECACHE, STATE_KEY)) || { files: {} };
+        const current = await caches.open(PRECACHE);
+        const staging = await caches.open(STAGING);
+        const pending = [];
+        for (const [path, hash] of Object.entries(manifest.precache)) {
+            if (previous.files[path] === hash && await current.match(scopeUrl(path), MATCH_OPTIONS)) continue;
+            pending.push(path);
+        }
+
+        // 404 のファイルは記録から外す（一覧を作った環境にしか無いファイルで install 全体を失敗させない）
+        const files = { ...manifest.precache };
+        const missing = [];
+        const download = async () => {
+            while (pending.length) {
+                const path = pending.pop();
+                const fileResponse = await fetch(scopeUrl(path), { cache: 'no-cache' });
+                if (fileResponse.status === 404) {
+                    missing.push(path);
+                    delete files[path];
+                    continue;
+                }
+                if (!fileResponse.ok) throw new Error(`${path}: HTTP ${fileResponse.status}`);
+                await staging.put(scopeUrl(path), fileResponse);
+            }
+        };
+        const count = pending.length;
+        await Promise.all(Array.from({ length: FETCH_CONCURRENCY }, download));
+        await writeJson(STAGING, STATE_KEY, {
+            revision: manifest.revision,
+            files,
+            runtime: { ...DEFAULT_RUNTIME, ...manifest.runtime },
+        });
+        console.log(`[service_worker] ${manifest.revision}: ${count - missing.length} / ${Object.keys(manifest.precache).length} ファイルを取得`);
+        if (missing.length) console.warn('[service_worker] サーバーに無いため飛ばしたファイル:', missing);
+        await self.skipWaiting();
+    })());
+});
+
+// STAGING を現在のキャッシュへ反映し、一覧から消えたファイルと内容の変わった画像を捨てる
+self.addEventListener('activate', event => {
+    event.waitUntil((async () => {
+        const state = (await caches.has(STAGING)) ? await readJson(STAGING, STATE_KEY) : null;
+        if (state) {
+            const current = await caches.open(PRECACHE);
+            const staging = await caches.open(STAGING);
+            const previous = (await readJson(PRECACHE, STATE_KEY)) || { files: {} };
+            const oldHashes = await imageHashes(current, previous.runtime && previous.runtime.image_assets);
+
+            for (const request of await staging.keys()) {
+                await current.put(request, await staging.match(request));
+            }
+            for (const path of Object.keys(previous.files)) {
+                if (!(path in state.files)) await current.delete(scopeUrl(path), MATCH_OPTIONS);
+            }
+
+            const newHashes = await imageHashes(current, state.runtime.image_assets);
+            if (oldHashes && newHashes) {
+                const runtime = await caches.open(RUNTIME);
+                const index = await loadLru();
+                for (const [url, hash] of oldHashes) {
+                    if (newHashes.get(url) === hash) continue;
+                    await runtime.delete(url, MATCH_OPTIONS);
+                    index.delete(url);
+                }
+                await saveLru();
+            }
+            runtimeConfig = state.runtime;
+        }
+        for (const name of await caches.keys()) {
+            if (name.startsWith('pokeakane-staging-')) await caches.delete(name);
+        }
+        await self.clients.claim();
+    })());
+});
+
+// 画像キャッシュの設定（ワーカーが再起動されたら読み直す）
+let runtimeConfig = null;
+
+async function loadRuntimeConfig() {
+    if (!runtimeConfig) {
+        const state = await readJson(PRECACHE, STATE_KEY);
+        runtimeConfig = (state && state.runtime) || DEFAULT_RUNTIME;
+    }
+    return runtimeConfig;
+}
+
+// 画像の URL → [バイト数, 最後に使った時刻]（Map の順序は問わない）
+let lruIndex = null;
+let lruSave = null;
+
+async function loadLru() {
+    if (!lruIndex) {
+        const saved = await readJson(RUNTIME, LRU_KEY);
+        lruIndex = new Map(saved ? saved.entries : []);
+    }
+    return lruIndex;
+}
+
+async function saveLru() {
+    if (lruIndex) await writeJson(RUNTIME, LRU_KEY, { entries: [...lruIndex] });
+}
+
+// 保存をまとめる（待っている間の更新も同じ書き込みに含まれる）
+function scheduleLruSave() {
+    if (!lruSave) {
+        lruSave = new Promise(resolve => setTimeout(resolve, LRU_SAVE_DELAY))
+            .then(saveLru)
+            .finally(() => { lruSave = null; });
+    }
+    return lruSave;
+}
+
+async function evictImages(cache, index, maxBytes) {
+    let total = 0;
+    index.forEach(([bytes]) => { total += bytes; });
+    if (total <= maxBytes) return;
+    const oldest = [...index.entries()].sort((a, b) => a[1][1] - b[1][1]);
+    for (const [url, [bytes]] of oldest) {
+        if (total <= maxBytes) break;
+        await cache.delete(url, MATCH_OPTIONS);
+        index.delete(url);
+        total -= bytes;
+    }
+}
+
+async function cachedImage(event, config) {
+    const key = event.request.url.split('?')[0];
+    const cache = await caches.open(RUNTIME);
+    const index = await loadLru();
+    const hit = await cache.match(key, MATCH_OPTIONS);
+    if (hit) {
+        index.set(key, [index.has(key) ? index.get(key)[0] : 0, Date.now()]);
+        event.waitUntil(scheduleLruSave());
+        return hit;
+    }
+
+    const response = await fetch(event.request);
+    if (response.status === 200 && response.type === 'basic') {
+        const length = Number(response.headers.get('Content-Length'));
+        const bytes = length || (await response.clone().blob()).size;
+        event.waitUntil((async () => {
+            await cache.put(key, response.clone());
+            index.set(key, [bytes, Date.now()]);
+            await evictImages(cache, index, config.max_bytes);
+            await scheduleLruSave();
+        })());
+    }
+    return response;
+}
+
+// 内容が更新される一覧 JSON（縮小版の manifest.json・アトラスの座標）はネットワーク優先
+async function freshJson(event) {
+    const key = event.request.url.split('?')[0];
+    const cache = await caches.open(RUNTIME);
+    try {
+        const response = await fetch(event.request);
+        if (response.status === 200) event.waitUntil(cache.put(key, response.clone()));
+        return response;
+    } catch (error) {
+        const cached = await cache.match(key, MATCH_OPTIONS);
+        if (cached) return cached;
+        throw error;
+    }
+}
+
+async function respond(event, path) {
+    const precached = await caches.match(event.request, { ...MATCH_OPTIONS, cacheName: PRECACHE });
+    if (precached) return precached;
+    const config = await loadRuntimeConfig();
+    if (config.prefixes.some(prefix => path.startsWith(prefix))) {
+        return path.endsWith('.json') ? freshJson(event) : cachedImage(event, config);
+    }
+    return fetch(event.request);
+}
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET' || request.headers.has('Range')) return;
+    const url = new URL(request.url);
+    const scope = new URL(self.registration.scope);
+    if (url.origin !== scope.origin || !url.pathname.startsWith(scope.pathname)) return;
+    const path = url.pathname.slice(scope.pathname.length);
+    if (path.startsWith('api/') || path === MANIFEST_URL || path === 'service_worker.js') return;
+    event.respondWith(respond(event, path));
+});
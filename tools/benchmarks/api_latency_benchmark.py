@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+検索 API（/api/pokemon）のレイテンシベンチマーク
+- 内蔵エンジンを同じプロセス内で起動し、代表的な絞り込み・並び替えクエリを複数クライアントから keep-alive で繰り返し取得
+- クエリごとの p50 / p99 レイテンシ・req/s・転送量（gzip）を表示
+  （応答キャッシュに当たる2回目以降と、毎回 URL を変えてキャッシュを外した場合の両方）
+- 比較用に、従来どおり端末側で絞り込む場合に必要な転送量（世代別JSON 9ファイル + 図鑑構造、gzip）も表示
+
+使い方:
+  python tools/benchmarks/api_latency_benchmark.py
+  python tools/benchmarks/api_latency_benchmark.py --clients 8 --requests 500
+"""
+
+import argparse
+import gzip
+import http.client
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / 'tools'))
+
+from server_engine import create_server  # noqa: E402
+
+QUERIES = [
+    ('全国図鑑 1ページ目', '/api/pokemon?limit=50'),
+    ('全国図鑑 最終ページ', '/api/pokemon?limit=50&offset=1000'),
+    ('キタカミ × ほのお × 素早さ順', '/api/pokemon?dex=20&type=fire&sort=speed&limit=50'),
+    ('全国 × みず × 合計順', '/api/pokemon?type=water&sort=total&limit=50'),
+    ('複合タイプ + 世代 + 進化段階', '/api/pokemon?type=dragon,flying&gen=3&evolution=final'),
+    ('名前検索（部分一致）', '/api/pokemon?q=%E3%81%B4%E3%81%8B&limit=50'),
+    ('1匹取得', '/api/pokemon/25'),
+    ('1匹取得（日本語名）', '/api/pokemon/%E3%83%94%E3%82%AB%E3%83%81%E3%83%A5%E3%82%A6'),
+]
+HEADERS = {'Accept-Encoding': 'gzip'}
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_query(port, url, clients, requests_per_client, cached=True):
+    latencies = []
+    sizes = []
+    errors = []
+    lock = threading.Lock()
+
+    def client():
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        local = []
+        try:
+            for i in range(requests_per_client):
+                # 未知のパラメータは無視されるので、付けると応答キャッシュを通らない
+                target = url if cached else f"{url}{'&' if '?' in url else '?'}_={threading.get_ident()}-{i}"
+                started = time.perf_counter()
+                conn.request('GET', target, headers=HEADERS)
+                resp = conn.getresponse()
+                body = resp.read()
+                local.append(time.perf_counter() - started)
+                if resp.status != 200:
+                    errors.append(resp.status)
+            with lock:
+                latencies.extend(local)
+                sizes.append(len(body))
+        finally:
+            conn.close()
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+    return {
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'rps': len(latencies) / elapsed,
+        'bytes': max(sizes) if sizes else 0,
+        'errors': len(errors),
+    }
+
+
+def client_side_bytes(dex_id):
+    """端末側で絞り込む場合に取得する JSON（世代別9ファイル + 図鑑構造）の gzip 後サイズ"""
+    paths = [ROOT / 'data' / f'gen{gen}_pokemon.json' for gen in range(1, 10)]
+    paths.append(ROOT / 'data' / 'pokedex_structures' / f'{dex_id}.json')
+    return sum(len(gzip.compress(p.read_bytes(), compresslevel=5)) for p in paths if p.exists())
+
+
+def main():
+    ap = argparse.ArgumentParser(description='検索 API のレイテンシベンチマーク')
+    ap.add_argument('--clients', type=int, default=4, help='同時クライアント数')
+    ap.add_argument('--requests', type=int, default=200, help='クライアントあたりのリクエスト数')
+    args = ap.parse_args()
+
+    started = time.perf_counter()
+    httpd = create_server(0)
+    index_ms = (time.perf_counter() - started) * 1000
+    port = httpd.server_address[1]
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+
+    print(f"🚀 検索 API ベンチマーク: {args.clients} クライアント × {args.requests} リクエスト / クエリ"
+          f"（索引の作成 {index_ms:.0f}ms）")
+    print("=" * 96)
+    print(f"{'query':<30}{'cache':>8}{'p50(ms)':>10}{'p99(ms)':>10}{'req/s':>10}{'bytes(gz)':>12}{'errors':>8}")
+    try:
+        for label, url in QUERIES:
+            for cached in (False, True):
+                r = run_query(port, url, args.clients, args.requests, cached)
+                print(f"{label if not cached else '':<30}{'hit' if cached else 'miss':>8}{r['p50_ms']:>10.2f}"
+                      f"{r['p99_ms']:>10.2f}{r['rps']:>10.0f}{r['bytes']:>12,}{r['errors']:>8}")
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+    print("-" * 96)
+    print(f"参考: 端末側で絞り込む場合の取得量（世代別JSON 9ファイル + キタカミ図鑑構造, gzip）: "
+          f"{client_side_bytes(20):,} bytes")
+
+
+if __name__ == '__main__':
+    main()
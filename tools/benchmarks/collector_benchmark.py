@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PokeAPI 収集ツールのベンチマーク
+- fake_pokeapi.py の偽サーバー（応答遅延つき）に対して pokemon_data_collector を実行
+- 逐次（従来相当: 5回/秒）/ 並列 / キャッシュありの再実行 / 条件付きGETでの再検証 を比較
+- 取得結果が data/gen*_pokemon.json の名前・タイプ・種族値と、偽サーバーの進化チェーンの前後と一致するかも確認
+
+使い方:
+  python tools/benchmarks/collector_benchmark.py
+  python tools/benchmarks/collector_benchmark.py --end 151 --workers 16 --rate 50 --latency-ms 80
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / 'tools'))
+sys.path.insert(0, str(ROOT / 'tools' / 'data_processors'))
+
+from fake_pokeapi import FakePokeAPIServer  # noqa: E402
+from net_utils import HttpClient, ResponseCache  # noqa: E402
+from pokemon_data_collector import LookupMemo, PokemonDataCollector  # noqa: E402
+
+COMPARED_FIELDS = ('name', 'name_en', 'types', 'types_en', 'abilities', 'stats', 'height', 'weight', 'generation')
+
+
+def run(server, start, end, workers, rate, cache_dir, workdir, revalidate=False):
+    server.requests.clear()
+    client = HttpClient(rate=rate, concurrency=workers, cache=ResponseCache(cache_dir) if cache_dir else None,
+                        revalidate=revalidate, backoff=0.1)
+    lookups = LookupMemo(cache_dir.parent / 'lookups.json' if cache_dir else None, load=not revalidate)
+    collector = PokemonDataCollector(base_url=server.base_url, client=client, lookups=lookups)
+    started = time.perf_counter()
+    # 中間保存（pokemon_data_backup_*.json）は作業用の一時ディレクトリに出す
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.chdir(workdir):
+        collector.collect_all_pokemon_data(start, end, workers=workers)
+    elapsed = time.perf_counter() - started
+    return collector, elapsed, sum(server.requests.values())
+
+
+def verify(server, collected, start, end):
+    mismatches = []
+    for pid in range(start, end + 1):
+        expected = server.api.pokemon.get(pid)
+        got = collected.get(str(pid))
+        if expected is None:
+            continue
+        if got is None:
+            mismatches.append(f'#{pid} 未取得')
+            continue
+        for field in COMPARED_FIELDS:
+            if got.get(field) != expected.get(field):
+                mismatches.append(f'#{pid} {field}: {got.get(field)!r} != {expected.get(field)!r}')
+        # 進化は prev から組み立てたチェーン（偽サーバーが返すもの）と比較
+        parent = server.api.parent.get(pid)
+        evolution = {'prev': parent if parent in server.api.pokemon else None,
+                     'next': server.api.children.get(pid, [])}
+        if got.get('evolution') != evolution:
+            mismatches.append(f"#{pid} evolution: {got.get('evolution')!r} != {evolution!r}")
+    return mismatches
+
+
+def main():
+    ap = argparse.ArgumentParser(description='PokeAPI 収集ツールの逐次/並列/キャッシュ比較')
+    ap.add_argument('--start', type=int, default=1)
+    ap.add_argument('--end', type=int, default=151)
+    ap.add_argument('--workers', type=int, default=16)
+    ap.add_argument('--rate', type=float, default=100.0, help='並列時の1秒あたり最大リクエスト数')
+    ap.add_argument('--latency-ms', type=float, default=50.0, help='偽サーバーの応答遅延')
+    ap.add_argument('--skip-sequential', action='store_true', help='逐次実行（時間がかかる）を省略')
+    args = ap.parse_args()
+
+    server = FakePokeAPIServer(latency=args.latency_ms / 1000).start()
+    count = args.end - args.start + 1
+    print(f"🚀 収集ベンチマーク: #{args.start}〜#{args.end} ({count}匹) / 偽PokeAPI 遅延 {args.latency_ms:.0f}ms")
+    print("=" * 78)
+    print(f"{'scenario':<28}{'time(s)':>10}{'requests':>10}{'cache hits':>12}{'304':>8}{'memo hits':>11}")
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp) / 'pokeapi'
+            scenarios = []
+            if not args.skip_sequential:
+                scenarios.append(('逐次 (5 req/s, 従来相当)', 1, 5.0, None, False))
+            scenarios += [
+                (f'並列 x{args.workers} (初回)', args.workers, args.rate, cache_dir, False),
+                (f'並列 x{args.workers} (キャッシュ再実行)', args.workers, args.rate, cache_dir, False),
+                (f'並列 x{args.workers} (再検証)', args.workers, args.rate, cache_dir, True),
+            ]
+            for label, workers, rate, cache, revalidate in scenarios:
+                collector, elapsed, requests = run(server, args.start, args.end, workers, rate, cache, tmp, revalidate)
+                stats = collector.client.stats
+                mismatches = verify(server, collector.pokemon_data, args.start, args.end)
+                print(f"{label:<28}{elapsed:>10.2f}{requests:>10}{stats['cache_hits']:>12}"
+                      f"{stats['not_modified']:>8}{collector.lookups.hits:>11}  {'✅' if not mismatches else '❌'}")
+                for line in mismatches[:5]:
+                    print(f"    {line}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ローカル偽 PokeAPI サーバー
+- data/gen*_pokemon.json から PokeAPI と同じ形の JSON を組み立てて返す
+  （/api/v2/pokemon/{id}/、/pokemon-species/{id}/、/ability/{id}/、/evolution-chain/{id}/）
+- 本物の回線を模した応答遅延（--latency-ms）を入れられる
+- ETag を返し、If-None-Match が一致すれば 304
+- パスごとのリクエスト数を数える（収集ツールの通信回数の検証用）
+
+使い方:
+  python tools/benchmarks/fake_pokeapi.py --port 8765 --latency-ms 50
+  python tools/data_processors/pokemon_data_collector.py --base-url http://127.0.0.1:8765/api/v2/
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+DATA_DIR = ROOT / 'data'
+
+STAT_NAMES = {
+    'hp': 'hp',
+    'attack': 'attack',
+    'defense': 'defense',
+    'special_attack': 'special-attack',
+    'special_defense': 'special-defense',
+    'speed': 'speed',
+}
+HIDDEN_SUFFIX = '(隠れ)'
+
+PATH_PATTERN = re.compile(r'^/api/v2/(pokemon|pokemon-species|ability|evolution-chain)/(\d+)/?$')
+
+
+def load_pokemon():
+    pokemon = {}
+    for gen in range(1, 10):
+        path = DATA_DIR / f'gen{gen}_pokemon.json'
+        if path.exists():
+            for info in json.loads(path.read_text(encoding='utf-8')).values():
+                pokemon[info['id']] = info
+    return pokemon
+
+
+class FakePokeAPI:
+    """ローカルデータから PokeAPI 形式のレスポンスを組み立てる"""
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip('/') + '/'
+        self.pokemon = load_pokemon()
+
+        # 特性は日本語名ごとに通し番号を振る
+        self.ability_ids = {}
+        for info in self.pokemon.values():
+            for ability in info.get('abilities', []):
+                name = ability.removesuffix(HIDDEN_SUFFIX)
+                self.ability_ids.setdefault(name, len(self.ability_ids) + 1)
+        self.ability_names = {i: name for name, i in self.ability_ids.items()}
+
+        # 進化チェーンは prev をたどった先頭のポケモンの番号を ID にする
+        self.parent = {pid: (info.get('evolution') or {}).get('prev') for pid, info in self.pokemon.items()}
+        self.children = {}
+        for pid, prev in sorted(self.parent.items()):
+            if prev in self.pokemon:
+                self.children.setdefault(prev, []).append(pid)
+
+    def url(self, kind, ident):
+        return f'{self.base_url}{kind}/{ident}/'
+
+    def chain_root(self, pid):
+        seen = set()
+        while self.parent.get(pid) in self.pokemon and pid not in seen:
+            seen.add(pid)
+            pid = self.parent[pid]
+        return pid
+
+    def build(self, kind, ident):
+        if kind == 'pokemon' and ident in self.pokemon:
+            info = self.pokemon[ident]
+            return {
+                'id': ident,
+                'name': info['name_en'],
+                'height': round(info['height'] * 10),
+                'weight': round(info['weight'] * 10),
+                'species': {'name': info['name_en'], 'url': self.url('pokemon-species', ident)},
+                'types': [{'slot': i + 1, 'type': {'name': t}} for i, t in enumerate(info['types_en'])],
+                'abilities': [
+                    {
+                        'ability': {'url': self.url('ability', self.ability_ids[a.removesuffix(HIDDEN_SUFFIX)])},
+                        'is_hidden': a.endswith(HIDDEN_SUFFIX),
+                        'slot': i + 1,
+                    }
+                    for i, a in enumerate(info.get('abilities', []))
+                ],
+                'stats': [
+                    {'base_stat': info['stats'].get(key, 0), 'stat': {'name': name}}
+                    for key, name in STAT_NAMES.items()
+                ],
+            }
+        if kind == 'pokemon-species' and ident in self.pokemon:
+            info = self.pokemon[ident]
+            return {
+                'id': ident,
+                'name': info['name_en'],
+                'names': [
+                    {'language': {'name': 'ja-Hrkt'}, 'name': info['name']},
+                    {'language': {'name': 'en'}, 'name': info['name_en'].capitalize()},
+                ],
+                'evolution_chain': {'url': self.url('evolution-chain', self.chain_root(ident))},
+            }
+        if kind == 'ability' and ident in self.ability_names:
+            name = self.ability_names[ident]
+            return {'id': ident, 'name': f'ability-{ident}', 'names': [{'language': {'name': 'ja-Hrkt'}, 'name': name}]}
+        if kind == 'evolution-chain' and ident in self.pokemon and self.chain_root(ident) == ident:
+            return {'id': ident, 'chain': self.chain_link(ident, set())}
+        return None
+
+    def chain_link(self, pid, seen):
+        seen.add(pid)
+        return {
+            'species': {'name': self.pokemon[pid]['name_en'], 'url': self.url('pokemon-species', pid)},
+            'evolves_to': [self.chain_link(c, seen) for c in self.children.get(pid, []) if c not in seen],
+        }
+
+
+class FakePokeAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        server.count(self.path)
+        if server.latency:
+            time.sleep(server.latency)
+
+        match = PATH_PATTERN.match(self.path.split('?')[0])
+        body = server.api.build(match.group(1), int(match.group(2))) if match else None
+        if body is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        etag = '"' + hashlib.blake2b(data, digest_size=8).hexdigest() + '"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakePokeAPIServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port=0, latency=0.0):
+        super().__init__(('127.0.0.1', port), FakePokeAPIHandler)
+        self.latency = latency
+        self.base_url = f'http://127.0.0.1:{self.server_address[1]}/api/v2/'
+        self.api = FakePokeAPI(self.base_url)
+        self.requests = Counter()
+        self.lock = threading.Lock()
+
+    def count(self, path):
+        kind = path.split('/')[3] if path.count('/') >= 3 else path
+        with self.lock:
+            self.requests[kind] += 1
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+def main():
+    ap = argparse.ArgumentParser(description='ローカル偽 PokeAPI サーバー')
+    ap.add_argument('--port', type=int, default=8765)
+    ap.add_argument('--latency-ms', type=float, default=50.0, help='1リクエストあたりの応答遅延')
+    args = ap.parse_args()
+
+    server = FakePokeAPIServer(args.port, args.latency_ms / 1000)
+    print(f"🧪 偽 PokeAPI: {server.base_url} （{len(server.api.pokemon)} 匹 / 遅延 {args.latency_ms:.0f}ms）")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"📊 リクエスト数: {dict(server.requests)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+初回描画（time-to-first-render）ベンチマーク
+- pokemon_gallery.html が最初のカードを描画するまでに順番に待つリソース
+  （HTML → 図鑑インデックス → 世代JSON×9 → 図鑑構造、またはバンドル1本）を内蔵エンジンから取得
+- 非圧縮 / gzip / brotli ごとに転送バイト数を実測し、
+  回線モデル（RTT + 帯域）で初回描画までの時間を見積もる
+
+事前に tools/utilities/precompress_assets.py を実行しておいてください。
+
+使い方:
+  python tools/benchmarks/first_render_benchmark.py
+  python tools/benchmarks/first_render_benchmark.py --rtt-ms 100 --mbps 5
+"""
+
+import argparse
+import gzip
+import http.client
+import threading
+import sys
+import time
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / 'tools'))
+
+from server_engine import create_server  # noqa: E402
+
+
+def critical_path_urls(bundled=False):
+    """ギャラリーが順番に await するリソース（並列取得されない）
+
+    bundled=True はデータバンドル（dataset_bundler.py）がある場合の読み込み順
+    """
+    urls = ['/pokemon_gallery.html']
+    if bundled:
+        urls += ['/data/bundle/national.min.json']
+    else:
+        urls += ['/data/pokedex_index.json']
+        urls += [f'/data/gen{gen}_pokemon.json' for gen in range(1, 10)]
+    urls += ['/data/pokedex_structures/0.json']
+    return urls
+
+
+def decode(body, encoding):
+    if encoding == 'gzip':
+        return gzip.decompress(body)
+    if encoding == 'br':
+        return brotli.decompress(body)
+    return body
+
+
+def measure(port, urls, accept_encoding, rtt, bytes_per_sec):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    total_bytes = 0
+    local_time = 0.0
+    modeled = 0.0
+    encodings = set()
+    for url in urls:
+        started = time.perf_counter()
+        conn.request('GET', url, headers={'Accept-Encoding': accept_encoding})
+        resp = conn.getresponse()
+        body = resp.read()
+        encoding = resp.getheader('Content-Encoding')
+        decode(body, encoding)
+        elapsed = time.perf_counter() - started
+        if encoding:
+            encodings.add(encoding)
+        total_bytes += len(body)
+        local_time += elapsed
+        modeled += rtt + len(body) / bytes_per_sec + elapsed
+    conn.close()
+    return total_bytes, local_time, modeled, encodings
+
+
+def main():
+    ap = argparse.ArgumentParser(description='ギャラリー初回描画までの転送量・時間の比較')
+    ap.add_argument('--rtt-ms', type=float, default=60.0, help='往復遅延（ミリ秒）')
+    ap.add_argument('--mbps', type=float, default=10.0, help='下り帯域（Mbps）')
+    args = ap.parse_args()
+
+    rtt = args.rtt_ms / 1000
+    bytes_per_sec = args.mbps * 1_000_000 / 8
+
+    httpd = create_server(0)
+    port = httpd.server_address[1]
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+
+    scenarios = [('identity', 'identity'), ('gzip', 'gzip')]
+    if brotli is not None:
+        scenarios.append(('br', 'br, gzip'))
+    layouts = [('個別JSON', critical_path_urls())]
+    if (ROOT / 'data' / 'bundle' / 'national.min.json').exists():
+        layouts.append(('バンドル', critical_path_urls(bundled=True)))
+
+    print(f"🚀 ギャラリー初回描画ベンチマーク (回線モデル: RTT {args.rtt_ms:.0f}ms / {args.mbps:.0f}Mbps)")
+    print("=" * 84)
+    print(f"{'layout':<10}{'reqs':>6}{'encoding':>10}{'bytes':>14}{'local(ms)':>12}{'modeled TTFR(ms)':>20}")
+    baseline = None
+    try:
+        for layout, urls in layouts:
+            for label, accept in scenarios:
+                total_bytes, local_time, modeled, encodings = measure(port, urls, accept, rtt, bytes_per_sec)
+                if baseline is None:
+                    baseline = modeled
+                print(f"{layout:<8}{len(urls):>8}{label:>10}{total_bytes:>14,}{local_time * 1000:>12.1f}"
+                      f"{modeled * 1000:>20.0f}  ({(1 - modeled / baseline) * 100:.0f}% 短縮)")
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
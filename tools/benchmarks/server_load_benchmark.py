@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+サーバー負荷ベンチマーク
+- pokemon_gallery.html の全国図鑑表示1回分（HTML + 図鑑/世代JSON + タイプ画像 + 通常画像1025枚）を
+  複数ブラウザ相当のクライアントから同時に取得し、requests/sec と p99 レイテンシを計測
+- 従来の python -m http.server（legacy）と内蔵エンジン（builtin）を比較
+
+使い方:
+  python tools/benchmarks/server_load_benchmark.py
+  python tools/benchmarks/server_load_benchmark.py --browsers 8 --engines builtin
+"""
+
+import argparse
+import http.client
+import queue
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+TOOLS = ROOT / 'tools'
+
+# ブラウザの1ホストあたり同時接続数
+CONNECTIONS_PER_BROWSER = 6
+
+
+def gallery_page_urls():
+    """ギャラリー初回表示で取得されるURL一覧（全国図鑑）"""
+    urls = ['/pokemon_gallery.html', '/data/pokedex_index.json']
+    urls += [f'/data/gen{gen}_pokemon.json' for gen in range(1, 10)]
+    urls += ['/data/pokedex_hierarchy.json', '/data/pokedex_structures/0.json']
+    urls += [f'/type_images/{p.name}' for p in sorted((ROOT / 'type_images').glob('*.png'))]
+    urls += [f'/pokemon_images/normal/{p.name}' for p in sorted((ROOT / 'pokemon_images' / 'normal').glob('*.png'))]
+    return urls
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_engine(engine, port):
+    if engine == 'legacy':
+        cmd = [sys.executable, '-m', 'http.server', str(port), '--bind', '127.0.0.1', '--directory', str(ROOT)]
+    else:
+        cmd = [sys.executable, str(TOOLS / 'server_engine.py'), str(port), '--bind', '127.0.0.1', '--directory', str(ROOT)]
+    process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.2):
+                return process
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError(f'{engine} サーバーが起動しませんでした')
+
+
+def run_browser(port, urls, latencies, errors, headers=None):
+    """1ブラウザ分: 6本の接続でページ内の全URLを取得"""
+    work = queue.Queue()
+    for url in urls:
+        work.put(url)
+
+    def connection_worker():
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        try:
+            while True:
+                try:
+                    url = work.get_nowait()
+                except queue.Empty:
+                    return
+                started = time.perf_counter()
+                try:
+                    conn.request('GET', url, headers=headers or {})
+                    resp = conn.getresponse()
+                    resp.read()
+                    if resp.status >= 400:
+                        errors.append(url)
+                except (OSError, http.client.HTTPException):
+                    errors.append(url)
+                    conn.close()
+                    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+                latencies.append(time.perf_counter() - started)
+        finally:
+            conn.close()
+
+    threads = [threading.Thread(target=connection_worker) for _ in range(CONNECTIONS_PER_BROWSER)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def benchmark(engine, browsers, rounds, headers=None):
+    port = free_port()
+    process = start_engine(engine, port)
+    urls = gallery_page_urls()
+    latencies, errors, page_times = [], [], []
+    try:
+        started = time.perf_counter()
+        for _ in range(rounds):
+            round_started = time.perf_counter()
+            threads = [threading.Thread(target=run_browser, args=(port, urls, latencies, errors, headers))
+                       for _ in range(browsers)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            page_times.append(time.perf_counter() - round_started)
+        elapsed = time.perf_counter() - started
+    finally:
+        process.terminate()
+        process.wait(timeout=5)
+
+    return {
+        'engine': engine,
+        'requests': len(latencies),
+        'errors': len(errors),
+        'rps': len(latencies) / elapsed,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'page_load_s': sum(page_times) / len(page_times),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description='PokeAkane サーバー負荷ベンチマーク')
+    ap.add_argument('--browsers', type=int, default=4, help='同時にページを開くブラウザ数')
+    ap.add_argument('--rounds', type=int, default=3, help='ページ読み込みの繰り返し回数')
+    ap.add_argument('--engines', nargs='+', default=['legacy', 'builtin'], choices=['legacy', 'builtin'])
+    args = ap.parse_args()
+
+    urls = gallery_page_urls()
+    print(f"🚀 ギャラリー1ページ = {len(urls)} リクエスト × {args.browsers} ブラウザ × {args.rounds} 回")
+    print("=" * 80)
+    print(f"{'engine':<10}{'requests':>10}{'errors':>8}{'req/s':>10}{'p50(ms)':>10}{'p99(ms)':>10}{'page(s)':>10}")
+    for engine in args.engines:
+        r = benchmark(engine, args.browsers, args.rounds)
+        print(f"{r['engine']:<10}{r['requests']:>10}{r['errors']:>8}{r['rps']:>10.0f}"
+              f"{r['p50_ms']:>10.2f}{r['p99_ms']:>10.2f}{r['page_load_s']:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
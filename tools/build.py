@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PokeAkane 派生データ 差分ビルド
+- 図鑑インデックス・バンドル・検索インデックスなどの派生ファイルを依存関係順に生成
+- 入力ファイルの更新時刻・サイズ・SHA-256 を .build_state.json に記録し、
+  入力が変わったターゲットだけを再生成（変更なしなら stat だけで終了）
+- 更新時刻だけ変わった（内容は同じ）ファイルはハッシュで判定して再生成しない
+
+使い方:
+  python tools/build.py                 # 変更のあったターゲットのみ
+  python tools/build.py bundle          # 指定ターゲット（と依存先）のみ
+  python tools/build.py --force         # 全ターゲットを再生成
+  python tools/build.py --dry-run       # 再生成が必要なものを表示するだけ
+  python tools/build.py --list          # ターゲット一覧
+  python tools/build.py --with-network  # PokeAPI を使うターゲットも対象にする
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+TOOLS = ROOT / 'tools'
+STATE_FILE = ROOT / '.build_state.json'
+STATE_VERSION = 1
+
+GEN_FILES = [f'data/gen{gen}_pokemon.json' for gen in range(1, 10)]
+
+
+def load_tool(relpath):
+    """tools/ 配下のスクリプトをモジュールとして読み込む"""
+    path = TOOLS / relpath
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    # ProcessPoolExecutor を使うスクリプトは、ワーカーに渡す関数をモジュール名で引けるようにしておく
+    # （spawn で起動する子プロセスは sys.path を引き継いで同じ名前で import する）
+    sys.modules[path.stem] = module
+    if str(path.parent) not in sys.path:
+        sys.path.append(str(path.parent))
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_pokedex_index():
+    load_tool('utilities/build_pokedex_index.py').main()
+
+
+def run_pokedex_buttons():
+    # create_pokedex_buttons.py はカレントディレクトリに出力する
+    subprocess.run([sys.executable, str(TOOLS / 'utilities' / 'create_pokedex_buttons.py')],
+                   cwd=ROOT / 'data', check=True)
+
+
+def run_bundle():
+    load_tool('data_processors/dataset_bundler.py').write_bundle()
+
+
+def run_stats_columns():
+    load_tool('data_processors/stats_columnar_builder.py').main()
+
+
+def run_search_index():
+    load_tool('utilities/build_search_index.py').write_index()
+
+
+def run_pokedex_db():
+    load_tool('data_processors/pokedex_db.py').build()
+
+
+def run_image_derivatives():
+    load_tool('utilities/build_image_derivatives.py').build()
+
+
+def run_sprite_atlas():
+    load_tool('utilities/build_sprite_atlas.py').build()
+
+
+def run_asset_manifest():
+    load_tool('utilities/build_asset_manifest.py').write_manifest()
+
+
+def run_type_matrix():
+    load_tool('type_matrix.py').write_table()
+
+
+def run_evolution_graph():
+    load_tool('evolution_graph.py').write_index()
+
+
+def run_precache_manifest():
+    load_tool('utilities/build_precache_manifest.py').write_manifest()
+
+
+def run_precompress():
+    results = load_tool('utilities/precompress_assets.py').precompress()
+    print(f"事前圧縮: {len(results)} ファイル")
+
+
+class Target:
+    """派生ファイル1組の生成ルール
+
+    inputs / outputs は ROOT からの glob。スクリプト自身も自動で入力に含める。
+    """
+
+    def __init__(self, name, script, inputs, outputs, action, deps=(), network=False):
+        self.name = name
+        self.script = script
+        self.inputs = inputs
+        self.outputs = outputs
+        self.action = action
+        self.deps = deps
+        self.network = network
+
+    def input_paths(self):
+        return expand([f'tools/{self.script}', *self.inputs])
+
+    def output_paths(self):
+        return expand(self.outputs)
+
+
+TARGETS = [
+    Target('pokedex_index', 'utilities/build_pokedex_index.py',
+           ['data/pokedex_structures/*.json'],
+           ['data/pokedex_index.json'],
+           run_pokedex_index),
+    Target('pokedex_buttons', 'utilities/create_pokedex_buttons.py',
+           [],
+           ['data/pokedex_button_data.json'],
+           run_pokedex_buttons, network=True),
+    Target('bundle', 'data_processors/dataset_bundler.py',
+           [*GEN_FILES, 'data/pokedex_index.json', 'data/pokedex_hierarchy.json'],
+           ['data/bundle/national.min.json', 'data/bundle/national.*.min.json'],
+           run_bundle, deps=('pokedex_index',)),
+    Target('stats_columns', 'data_processors/stats_columnar_builder.py',
+           GEN_FILES,
+           ['data/bundle/stats.bin'],
+           run_stats_columns),
+    Target('search_index', 'utilities/build_search_index.py',
+           [*GEN_FILES, 'data/pokedex_structures/*.json'],
+           ['data/bundle/search_index.json'],
+           run_search_index),
+    Target('pokedex_db', 'data_processors/pokedex_db.py',
+           [*GEN_FILES, 'data/pokedex_structures/*.json', 'config/pokeapi_regional_dex_data.json',
+            'pokemon_images/*/*.png'],
+           ['data/pokedex.sqlite'],
+           run_pokedex_db),
+    Target('asset_manifest', 'utilities/build_asset_manifest.py',
+           ['pokemon_images/*/*.png'],
+           ['data/bundle/image_assets.json'],
+           run_asset_manifest),
+    Target('image_derivatives', 'utilities/build_image_derivatives.py',
+           ['pokemon_images/*/*.png'],
+           ['pokemon_images/derived/manifest.json'],
+           run_image_derivatives),
+    Target('sprite_atlas', 'utilities/build_sprite_atlas.py',
+           ['data/pokedex_structures/*.json', 'pokemon_images/normal/*.png', 'pokemon_images/derived/manifest.json'],
+           ['pokemon_images/derived/atlas/*.json'],
+           run_sprite_atlas, deps=('image_derivatives',)),
+    Target('type_matrix', 'type_matrix.py',
+           GEN_FILES,
+           ['data/bundle/type_defense.json'],
+           run_type_matrix),
+    Target('evolution_graph', 'evolution_graph.py',
+           GEN_FILES,
+           ['data/bundle/evolution_index.json'],
+           run_evolution_graph),
+    # プリキャッシュするファイルを生成するターゲットの後に実行
+    Target('precache_manifest', 'utilities/build_precache_manifest.py',
+           ['*.html', 'data/bundle/*.json', 'data/bundle/stats.bin', 'data/pokedex_index.json',
+            'data/pokedex_hierarchy.json', 'data/pokedex_structures/*.json', 'type_images/*.png', 'region_icons/*.png'],
+           ['precache_manifest.json', 'service_worker.js'],
+           run_precache_manifest,
+           deps=('pokedex_index', 'bundle', 'stats_columns', 'search_index', 'asset_manifest', 'type_matrix',
+                 'evolution_graph')),
+    # 他ターゲットの出力も圧縮するため最後に実行
+    Target('precompress', 'utilities/precompress_assets.py',
+           ['*.html', '*.js', 'data/**/*.json', 'pokemon_images/derived/manifest.json'],
+           [],
+           run_precompress,
+           deps=('pokedex_index', 'bundle', 'search_index', 'asset_manifest', 'image_derivatives', 'type_matrix',
+                 'evolution_graph', 'precache_manifest')),
+]
+TARGETS_BY_NAME = {t.name: t for t in TARGETS}
+
+
+def expand(patterns):
+    paths = set()
+    for pattern in patterns:
+        if any(c in pattern for c in '*?['):
+            paths.update(p for p in ROOT.glob(pattern) if p.is_file())
+        else:
+            p = ROOT / pattern
+            if p.is_file():
+                paths.add(p)
+    return sorted(str(p.relative_to(ROOT)).replace(os.sep, '/') for p in paths)
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FingerprintCache:
+    """前回記録した (mtime_ns, size, sha256) を使い、変わったファイルだけハッシュする"""
+
+    def __init__(self, previous):
+        self.previous = previous
+        self.current = {}
+
+    def fingerprint(self, relpath):
+        if relpath in self.current:
+            return self.current[relpath]
+        st = os.stat(ROOT / relpath)
+        old = self.previous.get(relpath)
+        if old and old[0] == st.st_mtime_ns and old[1] == st.st_size:
+            fp = old
+        else:
+            fp = [st.st_mtime_ns, st.st_size, file_hash(ROOT / relpath)]
+        self.current[relpath] = fp
+        return fp
+
+    def digests(self, relpaths):
+        return {p: self.fingerprint(p)[2] for p in relpaths}
+
+
+def load_state():
+    if STATE_FILE.exists():
+        try:
+            state = json.loads(STATE_FILE.read_text(encoding='utf-8'))
+            if state.get('version') == STATE_VERSION:
+                return state
+        except (OSError, ValueError):
+            pass
+    return {'version': STATE_VERSION, 'files': {}, 'targets': {}}
+
+
+def save_state(state):
+    tmp = STATE_FILE.with_suffix('.tmp')
+    tmp.write_text(json.dumps(state, ensure_ascii=False, indent=1, sort_keys=True), encoding='utf-8')
+    os.replace(tmp, STATE_FILE)
+
+
+def outdated_reason(target, record, fingerprints):
+    """再生成が必要なら理由を返す（不要なら None）"""
+    if record is None:
+        return '初回ビルド'
+    inputs = fingerprints.digests(target.input_paths())
+    if set(inputs) != set(record['inputs']):
+        return '入力ファイルの追加・削除'
+    changed = [p for p, digest in inputs.items() if record['inputs'][p] != digest]
+    if changed:
+        return f'入力変更: {changed[0]}' + (f' ほか{len(changed) - 1}件' if len(changed) > 1 else '')
+    outputs = fingerprints.digests(target.output_paths())
+    if set(outputs) != set(record['outputs']) or any(record['outputs'][p] != d for p, d in outputs.items()):
+        return '出力ファイルの欠落・変更'
+    return None
+
+
+def resolve(names):
+    """指定ターゲットと依存先を TARGETS の定義順で返す"""
+    wanted = set()
+
+    def visit(name):
+        if name not in TARGETS_BY_NAME:
+            raise SystemExit(f"❌ 不明なターゲット: {name}（--list で一覧表示）")
+        if name in wanted:
+            return
+        wanted.add(name)
+        for dep in TARGETS_BY_NAME[name].deps:
+            visit(dep)
+
+    for name in names:
+        visit(name)
+    return [t for t in TARGETS if t.name in wanted]
+
+
+def main():
+    ap = argparse.ArgumentParser(description='派生データの差分ビルド')
+    ap.add_argument('targets', nargs='*', help='ビルドするターゲット（省略時は全て）')
+    ap.add_argument('--force', action='store_true', help='変更の有無に関わらず再生成')
+    ap.add_argument('--dry-run', action='store_true', help='再生成が必要なターゲットを表示するだけ')
+    ap.add_argument('--list', action='store_true', help='ターゲット一覧を表示')
+    ap.add_argument('--with-network', action='store_true', help='PokeAPI を使うターゲットも対象にする')
+    args = ap.parse_args()
+
+    if args.list:
+        for t in TARGETS:
+            note = '（ネットワーク）' if t.network else ''
+            print(f"  {t.name:<16} {', '.join(t.outputs) or '(各ファイルの .gz/.br)'} {note}")
+        return
+
+    started = time.perf_counter()
+    state = load_state()
+    fingerprints = FingerprintCache(state['files'])
+    targets = resolve(args.targets) if args.targets else [t for t in TARGETS if args.with_network or not t.network]
+
+    built = 0
+    for target in targets:
+        reason = '--force' if args.force else outdated_reason(target, state['targets'].get(target.name), fingerprints)
+        if reason is None:
+            continue
+        print(f"🔨 {target.name}: {reason}")
+        if args.dry_run:
+            continue
+        t0 = time.perf_counter()
+        target.action()
+        # 生成後のファイルは mtime が変わるので記録し直す
+        for p in target.output_paths():
+            fingerprints.current.pop(p, None)
+        state['targets'][target.name] = {
+            'inputs': fingerprints.digests(target.input_paths()),
+            'outputs': fingerprints.digests(target.output_paths()),
+        }
+        print(f"   ✅ {target.name} 完了 ({(time.perf_counter() - t0) * 1000:.0f}ms)")
+        built += 1
+
+    if not args.dry_run:
+        state['files'] = {**state['files'], **fingerprints.current}
+        save_state(state)
+
+    elapsed = (time.perf_counter() - started) * 1000
+    if built or args.dry_run:
+        print(f"🎉 ビルド完了: {built}/{len(targets)} ターゲットを再生成 ({elapsed:.0f}ms)")
+    else:
+        print(f"✨ すべて最新です ({elapsed:.1f}ms)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+全国データセット バンドル生成スクリプト
+ギャラリーが起動時に個別取得している JSON をまとめ、1リクエストで読めるようにします
+
+入力:
+- data/gen1_pokemon.json 〜 gen9_pokemon.json
+- data/pokedex_index.json
+- data/pokedex_hierarchy.json
+
+出力:
+- data/bundle/national.min.json          (固定名・ギャラリーが読む)
+- data/bundle/national.<hash>.min.json   (内容ハッシュ名・長期キャッシュ用)
+- data/bundle/manifest.json              (ハッシュ名・サイズ・入力ファイルの対応表)
+
+※ external_links は ID から再生成できるため同梱しません
+
+使用方法:
+python tools/data_processors/dataset_bundler.py
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+DATA_DIR = ROOT / 'data'
+BUNDLE_DIR = DATA_DIR / 'bundle'
+MANIFEST = BUNDLE_DIR / 'manifest.json'
+
+BUNDLE_NAME = 'national'
+# バンドルから除外するフィールド（ギャラリー未使用・IDから再生成可能）
+DROPPED_FIELDS = ('external_links',)
+
+
+def source_files():
+    """バンドルに含める入力ファイル一覧"""
+    files = [DATA_DIR / f'gen{gen}_pokemon.json' for gen in range(1, 10)]
+    files += [DATA_DIR / 'pokedex_index.json', DATA_DIR / 'pokedex_hierarchy.json']
+    return files
+
+
+def build_bundle():
+    """バンドルの中身（dict）を組み立てる"""
+    pokemon = {}
+    for gen in range(1, 10):
+        path = DATA_DIR / f'gen{gen}_pokemon.json'
+        gen_data = json.loads(path.read_text(encoding='utf-8'))
+        for pokemon_id, info in gen_data.items():
+            pokemon[pokemon_id] = {k: v for k, v in info.items() if k not in DROPPED_FIELDS}
+
+    return {
+        'pokemon': pokemon,
+        'pokedex_index': json.loads((DATA_DIR / 'pokedex_index.json').read_text(encoding='utf-8')),
+        'pokedex_hierarchy': json.loads((DATA_DIR / 'pokedex_hierarchy.json').read_text(encoding='utf-8')),
+    }
+
+
+def minify(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def write_if_changed(path: Path, data: bytes):
+    """内容が同じなら書き込まない（mtime を変えず ETag/差分ビルドを無駄に崩さない）"""
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.write_bytes(data)
+    return True
+
+
+def write_bundle():
+    BUNDLE_DIR.mkdir(parents=True, exist_ok=True)
+    payload = minify(build_bundle())
+    digest = hashlib.sha256(payload).hexdigest()
+    hashed_name = f'{BUNDLE_NAME}.{digest[:10]}.min.json'
+
+    write_if_changed(BUNDLE_DIR / f'{BUNDLE_NAME}.min.json', payload)
+    write_if_changed(BUNDLE_DIR / hashed_name, payload)
+
+    # 古いハッシュ名のバンドルを削除
+    for old in BUNDLE_DIR.glob(f'{BUNDLE_NAME}.*.min.json'):
+        if old.name != hashed_name:
+            old.unlink()
+
+    manifest = json.loads(MANIFEST.read_text(encoding='utf-8')) if MANIFEST.exists() else {}
+    manifest[BUNDLE_NAME] = {
+        'file': hashed_name,
+        'stable': f'{BUNDLE_NAME}.min.json',
+        'sha256': digest,
+        'bytes': len(payload),
+        'sources': [str(p.relative_to(ROOT)).replace('\\', '/') for p in source_files()],
+    }
+    write_if_changed(MANIFEST, json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'))
+    return manifest[BUNDLE_NAME]
+
+
+def main():
+    print("📦 全国データセットをバンドル中...")
+    entry = write_bundle()
+
+    source_bytes = sum(p.stat().st_size for p in source_files())
+    print(f"  入力: {len(entry['sources'])} ファイル / {source_bytes:,} bytes")
+    print(f"  出力: data/bundle/{entry['stable']} / {entry['bytes']:,} bytes "
+          f"({(1 - entry['bytes'] / source_bytes) * 100:.1f}% 削減)")
+    print(f"  ハッシュ名: data/bundle/{entry['file']}")
+    print("✅ バンドル生成完了！ギャラリーは1リクエストで全データを読み込めます")
+
+
+if __name__ == "__main__":
+    main()
@@ -173,17 +173,19 @@ def main():
         pokemon_data['792']['evolution'] = {'prev': 790, 'next': []}
         print("コスモウム系統の分岐進化を修正: コスモッグ → コスモウム → ソルガレオ & ルナアーラ")
     
-    # カジッチュ系統の修正 (840: カジッチュ → 841: アップリュー & 842: タルップル & 1011: カミッチュ)
-    if '840' in pokemon_data and '841' in pokemon_data and '842' in pokemon_data and '1011' in pokemon_data:
+    # カジッチュ系統の修正 (840: カジッチュ → 841: アップリュー & 842: タルップル & 1011: カミッチュ → 1019: カミツオロチ)
+    if all(str(i) in pokemon_data for i in [840, 841, 842, 1011, 1019]):
         # カジッチュ: 分岐進化 → アップリュー & タルップル & カミッチュ
         pokemon_data['840']['evolution'] = {'prev': None, 'next': [841, 842, 1011]}
         # アップリュー: 最終進化
         pokemon_data['841']['evolution'] = {'prev': 840, 'next': []}
         # タルップル: 最終進化
         pokemon_data['842']['evolution'] = {'prev': 840, 'next': []}
-        # カミッチュ: 最終進化
-        pokemon_data['1011']['evolution'] = {'prev': 840, 'next': []}
-        print("カジッチュ系統の分岐進化を修正: カジッチュ → アップリュー & タルップル & カミッチュ")
+        # カミッチュ: 中間進化 → カミツオロチ
+        pokemon_data['1011']['evolution'] = {'prev': 840, 'next': [1019]}
+        # カミツオロチ: 最終進化
+        pokemon_data['1019']['evolution'] = {'prev': 1011, 'next': []}
+        print("カジッチュ系統の分岐進化を修正: カジッチュ → アップリュー & タルップル & カミッチュ → カミツオロチ")
     
     # ケムッソ系統の修正 (265: ケムッソ → 266: カラサリス → 267: アゲハント & 268: マユルド → 269: ドクケイル)
     if all(str(i) in pokemon_data for i in [265, 266, 267, 268, 269]):
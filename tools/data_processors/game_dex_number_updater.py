@@ -3,176 +3,272 @@
 """
 ゲームタイトル別図鑑番号取得・更新ツール
 各ポケモンデータに各ゲームタイトルの図鑑番号を追加する
+
+取得（scrape）と解析（parse）を分けて実行できる:
+- scrape: yakkun.com の図鑑ページを生の HTML のまま .cache/yakkun/ に gzip 圧縮で保存
+          （--workers 並列、全体で --rate 回/秒まで。保存済みのページは通信しない）
+- parse : 保存済みのページだけを CPU コア数ぶんのプロセスで解析（通信なし）
+          lxml があれば lxml、無ければ BeautifulSoup（html.parser）で解析
+          解析ルールを直したら parse だけやり直せばよい
+
+使い方:
+  python tools/data_processors/game_dex_number_updater.py                 # 対話モード
+  python tools/data_processors/game_dex_number_updater.py scrape --workers 4 --rate 2
+  python tools/data_processors/game_dex_number_updater.py parse --jobs 4  # pokemon_data.json に書き込む
+  python tools/data_processors/game_dex_number_updater.py parse --dry-run # 解析結果の件数だけ表示
+  python tools/data_processors/game_dex_number_updater.py update          # scrape → parse をまとめて実行
+
+依存:
+  pip install requests beautifulsoup4
+  pip install lxml   # 任意（解析が速くなる）
 """
 
+import argparse
 import json
 import requests
+import sys
 import time
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, UnicodeDammit
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from json_store import JsonStore, write_json  # noqa: E402
+from net_utils import DEFAULT_CACHE_DIR, HttpClient, PageCache  # noqa: E402
+
+PAGE_URL = "https://yakkun.com/sv/zukan/n{}"
+PAGE_CACHE_DIR = DEFAULT_CACHE_DIR / 'yakkun'
+BROWSER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# 対象ゲームタイトル（yakkun.comで使用されている名前）
+GAME_TITLES = {
+    'red_green': '赤・緑',
+    'gold_silver': '金・銀',
+    'ruby_sapphire': 'ルビー・サファイア',
+    'diamond_pearl': 'ダイヤモンド・パール',
+    'black_white': 'ブラック・ホワイト',
+    'x_y': 'X・Y',
+    'sun_moon': 'サン・ムーン',
+    'sword_shield': 'ソード・シールド',
+    'scarlet_violet': 'スカーレット・バイオレット'
+}
+
+
+def table_rows(html):
+    """図鑑番号の表（table.zukan_table）の各行のセルの文字列 [[列1, 列2, ...], ...]
+
+    セル内の文字列は BeautifulSoup の get_text(strip=True) と同じく、断片ごとに前後の空白を除いて連結する。
+    """
+    if lxml is not None:
+        # 文字コードの判定は BeautifulSoup と同じ規則にそろえる（meta charset → UTF-8 → その他）
+        root = lxml.html.fromstring(UnicodeDammit(html, is_html=True).unicode_markup)
+        tables = root.xpath('//table[contains(concat(" ", normalize-space(@class), " "), " zukan_table ")]')
+        if not tables:
+            return []
+        return [[''.join(text.strip() for text in cell.itertext()) for cell in row.iter('td', 'th')]
+                for row in tables[0].iter('tr')]
+
+    soup = BeautifulSoup(html, 'html.parser')
+    dex_table = soup.find('table', class_='zukan_table')
+    if not dex_table:
+        return []
+    return [[cell.get_text(strip=True) for cell in row.find_all(['td', 'th'])]
+            for row in dex_table.find_all('tr')]
+
+
+def parse_dex_numbers(html, game_titles=GAME_TITLES):
+    """図鑑ページの HTML から {ゲームキー: 図鑑番号}（見つからないゲームは None）"""
+    # 各ゲームタイトルの図鑑番号を初期化（nullで）
+    dex_numbers = {game_key: None for game_key in game_titles}
+
+    # 図鑑番号の表を探す
+    # yakkun.comの構造に応じて調整が必要
+    for cols in table_rows(html):
+        if len(cols) >= 2:
+            game_name = cols[0]
+            dex_num_text = cols[1]
+
+            # 数字のみ抽出
+            dex_num_match = re.search(r'\d+', dex_num_text)
+            if dex_num_match:
+                dex_num = int(dex_num_match.group())
+
+                # ゲーム名をキーにマッピング
+                for game_key, game_title in game_titles.items():
+                    if game_title in game_name or game_name in game_title:
+                        dex_numbers[game_key] = dex_num
+                        break
+
+    return dex_numbers
+
+
+def _parse_cached(job):
+    """保存済みページ1件を解析（ワーカープロセスで実行）。未取得なら (ID, None)"""
+    cache_dir, pokemon_id, game_titles = job
+    entry = PageCache(cache_dir).get(PAGE_URL.format(pokemon_id))
+    if entry is None:
+        return pokemon_id, None
+    return pokemon_id, parse_dex_numbers(entry['body'], game_titles)
+
 
 class GameDexNumberUpdater:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        
+    def __init__(self, workers=4, rate=2.0, cache_dir=PAGE_CACHE_DIR, refresh=False):
+        self.workers = workers
+        self.cache_dir = Path(cache_dir)
+        # refresh=True なら保存済みのページも取り直す（条件付き GET で変更が無ければ本文は再取得しない）
+        self.client = HttpClient(rate=rate, concurrency=workers, cache=PageCache(self.cache_dir),
+                                 revalidate=refresh, timeout=10, user_agent=BROWSER_USER_AGENT)
+
         # 対象ゲームタイトル（yakkun.comで使用されている名前）
-        self.game_titles = {
-            'red_green': '赤・緑',
-            'gold_silver': '金・銀',
-            'ruby_sapphire': 'ルビー・サファイア', 
-            'diamond_pearl': 'ダイヤモンド・パール',
-            'black_white': 'ブラック・ホワイト',
-            'x_y': 'X・Y',
-            'sun_moon': 'サン・ムーン',
-            'sword_shield': 'ソード・シールド',
-            'scarlet_violet': 'スカーレット・バイオレット'
-        }
-    
+        self.game_titles = GAME_TITLES
+
     def get_pokemon_dex_numbers(self, pokemon_id, pokemon_name):
         """
-        指定されたポケモンの各ゲームタイトルでの図鑑番号を取得
+        指定されたポケモンの各ゲームタイトルでの図鑑番号を取得（保存済みのページがあれば通信しない）
         """
         print(f"🔍 {pokemon_name} (ID: {pokemon_id}) の図鑑番号を取得中...")
-        
+
         try:
             # yakkun.comのポケモン詳細ページにアクセス
-            url = f"https://yakkun.com/sv/zukan/n{pokemon_id}"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 図鑑番号情報を格納する辞書
-            dex_numbers = {}
-            
-            # 各ゲームタイトルの図鑑番号を初期化（nullで）
-            for game_key in self.game_titles.keys():
-                dex_numbers[game_key] = None
-            
-            # 図鑑番号の表を探す
-            # yakkun.comの構造に応じて調整が必要
-            dex_table = soup.find('table', class_='zukan_table')
-            if dex_table:
-                rows = dex_table.find_all('tr')
-                for row in rows:
-                    cols = row.find_all(['td', 'th'])
-                    if len(cols) >= 2:
-                        game_name = cols[0].get_text(strip=True)
-                        dex_num_text = cols[1].get_text(strip=True)
-                        
-                        # 数字のみ抽出
-                        dex_num_match = re.search(r'\d+', dex_num_text)
-                        if dex_num_match:
-                            dex_num = int(dex_num_match.group())
-                            
-                            # ゲーム名をキーにマッピング
-                            for game_key, game_title in self.game_titles.items():
-                                if game_title in game_name or game_name in game_title:
-                                    dex_numbers[game_key] = dex_num
-                                    break
-            
+            html = self.client.get_bytes(PAGE_URL.format(pokemon_id))
+            dex_numbers = parse_dex_numbers(html, self.game_titles)
+
             print(f"✅ {pokemon_name} の図鑑番号取得完了")
             return dex_numbers
-            
+
         except Exception as e:
             print(f"❌ {pokemon_name} の図鑑番号取得に失敗: {e}")
             # エラーの場合は全てNullで返す
             return {game_key: None for game_key in self.game_titles.keys()}
-    
+
+    def scrape(self, pokemon_ids):
+        """図鑑ページを並列に取得してキャッシュに保存（解析はしない）。取得できなかった ID のリストを返す"""
+        pokemon_ids = list(pokemon_ids)
+        print(f"🌐 図鑑ページ取得: {len(pokemon_ids)} 件（{self.workers} 並列）→ {self.cache_dir}")
+        started = time.perf_counter()
+        failed = []
+
+        def fetch(pokemon_id):
+            try:
+                self.client.get_bytes(PAGE_URL.format(pokemon_id))
+                return None
+            except (requests.RequestException, OSError) as e:
+                return pokemon_id, e
+
+        with ThreadPoolExecutor(max_workers=max(1, self.workers)) as pool:
+            for done, error in enumerate(pool.map(fetch, pokemon_ids), 1):
+                if error:
+                    failed.append(error[0])
+                    print(f"❌ ID {error[0]} の取得に失敗: {error[1]}")
+                if done % 50 == 0:
+                    print(f"📊 進捗: {done}/{len(pokemon_ids)} ({done/len(pokemon_ids)*100:.1f}%)")
+
+        print(f"✅ 取得完了 ({time.perf_counter() - started:.1f}秒) {self.client.summary()}")
+        return failed
+
+    def parse_cached(self, pokemon_ids, jobs=None):
+        """保存済みのページをプロセス並列で解析（通信なし）。{ID: 図鑑番号}（未取得の ID は含まない）"""
+        pokemon_ids = list(pokemon_ids)
+        started = time.perf_counter()
+        jobs_list = [(str(self.cache_dir), pokemon_id, self.game_titles) for pokemon_id in pokemon_ids]
+        results = {}
+        missing = []
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for pokemon_id, dex_numbers in pool.map(_parse_cached, jobs_list, chunksize=32):
+                if dex_numbers is None:
+                    missing.append(pokemon_id)
+                else:
+                    results[pokemon_id] = dex_numbers
+
+        elapsed = time.perf_counter() - started
+        found = sum(1 for dex_numbers in results.values() if any(v is not None for v in dex_numbers.values()))
+        print(f"🧩 解析完了: {len(results)} ページ（図鑑番号あり {found} 件）"
+              f" {elapsed:.1f}秒 / パーサー: {'lxml' if lxml is not None else 'html.parser'}")
+        if missing:
+            print(f"⚠️ 未取得のページ {len(missing)} 件（先に scrape を実行）: "
+                  f"{', '.join(map(str, missing[:10]))}{' ...' if len(missing) > 10 else ''}")
+        return results
+
     def test_few_pokemon(self, count=3):
         """
         テスト用：少数のポケモンで動作確認
         """
         print(f"🧪 {count}匹のポケモンでテスト開始...")
-        
+
         # pokemon_data.jsonを読み込み
         with open('pokemon_data.json', 'r', encoding='utf-8') as f:
             pokemon_data = json.load(f)
-        
+
         test_results = {}
         processed_count = 0
-        
+
         for pokemon_id, pokemon_info in pokemon_data.items():
             if processed_count >= count:
                 break
-                
+
             pokemon_name = pokemon_info['name']
             dex_numbers = self.get_pokemon_dex_numbers(int(pokemon_id), pokemon_name)
-            
+
             test_results[pokemon_id] = {
                 'name': pokemon_name,
                 'dex_numbers': dex_numbers
             }
-            
+
             processed_count += 1
-            time.sleep(1)  # レート制限対策
-        
+
         # テスト結果を保存
-        with open('test_dex_numbers.json', 'w', encoding='utf-8') as f:
-            json.dump(test_results, f, ensure_ascii=False, indent=2)
-        
+        write_json('test_dex_numbers.json', test_results)
+
         print(f"✅ テスト完了！結果をtest_dex_numbers.jsonに保存")
         return test_results
-    
-    def update_pokemon_data_with_dex_numbers(self, batch_size=50):
+
+    def update_pokemon_data_with_dex_numbers(self, data_file='pokemon_data.json', jobs=None,
+                                             fetch=True, dry_run=False):
         """
-        pokemon_data.jsonの全ポケモンに図鑑番号を追加
+        pokemon_data.jsonの全ポケモンに図鑑番号を追加（fetch=False なら保存済みのページだけで解析）
         """
         print("🚀 全ポケモンデータの更新開始...")
-        
-        # pokemon_data.jsonを読み込み
-        with open('pokemon_data.json', 'r', encoding='utf-8') as f:
-            pokemon_data = json.load(f)
-        
-        total_pokemon = len(pokemon_data)
-        processed_count = 0
-        
-        for pokemon_id, pokemon_info in pokemon_data.items():
-            pokemon_name = pokemon_info['name']
-            
-            # 図鑑番号を取得
-            dex_numbers = self.get_pokemon_dex_numbers(int(pokemon_id), pokemon_name)
-            
-            # pokemon_dataに追加
-            pokemon_data[pokemon_id]['game_dex_numbers'] = dex_numbers
-            
-            processed_count += 1
-            
-            # 進捗表示
-            if processed_count % 10 == 0:
-                print(f"📊 進捗: {processed_count}/{total_pokemon} ({processed_count/total_pokemon*100:.1f}%)")
-            
-            # バッチごとに保存
-            if processed_count % batch_size == 0:
-                print(f"💾 中間保存中... ({processed_count}匹完了)")
-                with open('pokemon_data.json', 'w', encoding='utf-8') as f:
-                    json.dump(pokemon_data, f, ensure_ascii=False, indent=2)
-            
-            time.sleep(1)  # レート制限対策
-        
-        # 最終保存
-        with open('pokemon_data.json', 'w', encoding='utf-8') as f:
-            json.dump(pokemon_data, f, ensure_ascii=False, indent=2)
-        
-        print(f"🎉 全ポケモンデータの更新完了！{total_pokemon}匹処理")
 
-def main():
-    updater = GameDexNumberUpdater()
-    
+        # pokemon_data.jsonを読み込み（前回中断していればジャーナルから途中経過を復元）
+        store = JsonStore(data_file)
+        pokemon_ids = sorted(int(pokemon_id) for pokemon_id in store)
+
+        if fetch:
+            self.scrape(pokemon_ids)
+        results = self.parse_cached(pokemon_ids, jobs)
+        if dry_run:
+            return results
+
+        # 該当ポケモンだけ更新（解析はやり直しが速いので、取得できなかったポケモンはそのまま残す）
+        changed = sum(store.patch(pokemon_id, {'game_dex_numbers': dex_numbers})
+                      for pokemon_id, dex_numbers in results.items())
+
+        # 最終保存（ファイル全体を一時ファイル経由で1回だけ書き出す）
+        store.commit()
+
+        print(f"🎉 全ポケモンデータの更新完了！{len(results)}/{len(pokemon_ids)}匹処理（変更 {changed} 匹）")
+        return results
+
+
+def interactive(updater):
     print("🎮 ゲームタイトル別図鑑番号更新ツール")
     print("=" * 50)
-    
+
     while True:
         print("\n選択してください:")
         print("1. テスト実行（3匹のポケモンで確認）")
         print("2. 全ポケモンデータ更新")
         print("3. 終了")
-        
+
         choice = input("選択 (1-3): ").strip()
-        
+
         if choice == "1":
             updater.test_few_pokemon(3)
         elif choice == "2":
@@ -187,5 +283,42 @@ def main():
         else:
             print("無効な選択です。")
 
+
+def main():
+    ap = argparse.ArgumentParser(description='ゲームタイトル別図鑑番号の取得・更新')
+    ap.add_argument('--cache-dir', type=Path, default=PAGE_CACHE_DIR, help='図鑑ページの保存先')
+    sub = ap.add_subparsers(dest='command')
+    p = sub.add_parser('scrape', help='図鑑ページを取得して保存するだけ（解析しない）')
+    p.add_argument('--start', type=int, default=1, help='開始 ID')
+    p.add_argument('--end', type=int, default=1025, help='終了 ID')
+    p.add_argument('--workers', type=int, default=4, help='並列取得数')
+    p.add_argument('--rate', type=float, default=2.0, help='1秒あたりの最大リクエスト数（全体）')
+    p.add_argument('--refresh', action='store_true', help='保存済みのページも取り直す')
+    for name, help_text in (('parse', '保存済みのページを解析して pokemon_data.json に書き込む（通信なし）'),
+                            ('update', 'scrape と parse をまとめて実行')):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument('--data', default='pokemon_data.json', help='更新するデータファイル')
+        p.add_argument('--jobs', type=int, default=None, help='解析の並列プロセス数（既定: CPU コア数）')
+        p.add_argument('--dry-run', action='store_true', help='解析するだけで書き込まない')
+        if name == 'update':
+            p.add_argument('--workers', type=int, default=4, help='並列取得数')
+            p.add_argument('--rate', type=float, default=2.0, help='1秒あたりの最大リクエスト数（全体）')
+    args = ap.parse_args()
+
+    if args.command is None:
+        interactive(GameDexNumberUpdater(cache_dir=args.cache_dir))
+    elif args.command == 'scrape':
+        updater = GameDexNumberUpdater(args.workers, args.rate, args.cache_dir, args.refresh)
+        failed = updater.scrape(range(args.start, args.end + 1))
+        if failed:
+            sys.exit(1)
+    elif args.command == 'parse':
+        GameDexNumberUpdater(cache_dir=args.cache_dir).update_pokemon_data_with_dex_numbers(
+            args.data, args.jobs, fetch=False, dry_run=args.dry_run)
+    elif args.command == 'update':
+        GameDexNumberUpdater(args.workers, args.rate, args.cache_dir).update_pokemon_data_with_dex_numbers(
+            args.data, args.jobs, dry_run=args.dry_run)
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -6,9 +6,13 @@ PokeAPIから取得したキタカミ（ID:32）とブルーベリー（ID:33）
 """
 
 import json
-import requests
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pokedex_core  # noqa: E402
+
 # キタカミ図鑑データ (PokeAPIから取得済み)
 kitakami_pokemon = [
     {"entry_number": 1, "name": "spinarak"},
@@ -461,25 +465,18 @@ blueberry_pokemon = [
 ]
 
 def load_pokemon_data():
-    """pokemon_data.jsonから全ポケモンデータを読み込む"""
-    with open('pokemon_data.json', 'r', encoding='utf-8') as f:
-        return json.load(f)
+    """全ポケモンデータ（索引付き）を読み込む"""
+    return pokedex_core.load()
 
-def get_pokemon_id_by_name(pokemon_data, name_en):
+def get_pokemon_id_by_name(pokedex, name_en):
     """英語名からpokemon_idを取得"""
-    for pokemon_id, pokemon_info in pokemon_data.items():
-        if pokemon_info.get('name_en') == name_en:
-            return int(pokemon_id)
-    return None
+    return pokedex.id_by_slug(name_en)
 
-def get_japanese_name(pokemon_data, name_en):
+def get_japanese_name(pokedex, name_en):
     """英語名から日本語名を取得"""
-    for pokemon_id, pokemon_info in pokemon_data.items():
-        if pokemon_info.get('name_en') == name_en:
-            return pokemon_info.get('name')
-    return name_en  # 見つからない場合は英語名をそのまま返す
+    return pokedex.japanese_name(name_en, default=name_en)  # 見つからない場合は英語名をそのまま返す
 
-def create_pokedex_data(pokemon_list, pokemon_data, dex_id, dex_name, dex_key):
+def create_pokedex_data(pokemon_list, pokedex, dex_id, dex_name, dex_key):
     """図鑑データを作成"""
     pokedex_entry = {
         "id": dex_id,
@@ -493,13 +490,13 @@ def create_pokedex_data(pokemon_list, pokemon_data, dex_id, dex_name, dex_key):
         name_en = entry["name"]
         
         # pokemon_idを取得
-        pokemon_id = get_pokemon_id_by_name(pokemon_data, name_en)
+        pokemon_id = get_pokemon_id_by_name(pokedex, name_en)
         if pokemon_id is None:
-            print(f"Warning: Pokemon {name_en} not found in pokemon_data.json")
+            print(f"Warning: Pokemon {name_en} not found in gen*_pokemon.json")
             continue
             
         # 日本語名を取得
-        japanese_name = get_japanese_name(pokemon_data, name_en)
+        japanese_name = get_japanese_name(pokedex, name_en)
         
         pokedex_entry["pokemon"][str(entry_num)] = {
             "pokemon_id": pokemon_id,
@@ -513,9 +510,9 @@ def main():
     """メイン処理"""
     print("🌟 キタカミ・ブルーベリー図鑑データ処理開始っちゃ〜♪")
     
-    # pokemon_data.jsonを読み込み
-    print("📖 pokemon_data.jsonを読み込み中...")
-    pokemon_data = load_pokemon_data()
+    # 全ポケモンデータを読み込み
+    print("📖 ポケモンデータを読み込み中...")
+    pokedex = load_pokemon_data()
     
     # pokedex_structure.jsonを読み込み
     print("📖 pokedex_structure.jsonを読み込み中...")
@@ -526,7 +523,7 @@ def main():
     print("🏔️ キタカミ図鑑を作成中...")
     kitakami_dex = create_pokedex_data(
         kitakami_pokemon, 
-        pokemon_data, 
+        pokedex, 
         20, 
         "キタカミ図鑑", 
         "kitakami"
@@ -536,7 +533,7 @@ def main():
     print("🫐 ブルーベリー図鑑を作成中...")
     blueberry_dex = create_pokedex_data(
         blueberry_pokemon, 
-        pokemon_data, 
+        pokedex, 
         21, 
         "ブルーベリー図鑑", 
         "blueberry"
@@ -7,8 +7,14 @@ pokeapi_regional_dex_data.jsonから取得したデータで全ポケモンフ
 
 import json
 import os
+import sys
+from pathlib import Path
 from typing import Dict, Any
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from json_store import JsonStore  # noqa: E402
+
 class PokeAPIDataUpdater:
     def __init__(self):
         self.pokeapi_data_file = "pokeapi_regional_dex_data.json"
@@ -59,14 +65,11 @@ class PokeAPIDataUpdater:
                 print(f"⚠️  {filename} が見つかりません")
                 return False
             
-            # ファイルを読み込み
-            with open(filename, "r", encoding="utf-8") as f:
-                pokemon_data = json.load(f)
-            
+            store = JsonStore(filename)
             updated_count = 0
             
             # 各ポケモンを更新（辞書形式）
-            for pokemon_id, pokemon in pokemon_data.items():
+            for pokemon_id in list(store):
                 
                 if pokemon_id in self.pokeapi_data:
                     # 基本構造をコピー
@@ -84,13 +87,13 @@ class PokeAPIDataUpdater:
                             self.stats["software_stats"][software] += 1
                             self.stats["total_updates"] += 1
                     
-                    # game_dex_numbersを更新
-                    pokemon["game_dex_numbers"] = updated_game_dex
+                    # game_dex_numbersを更新（値が変わったポケモンだけ書き換え対象になる）
+                    store.patch(pokemon_id, {"game_dex_numbers": updated_game_dex})
                     updated_count += 1
             
-            # ファイルに書き戻し
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(pokemon_data, f, ensure_ascii=False, indent=2)
+            # ファイルに書き戻し（一時ファイル経由・内容が同じなら書かない）
+            if not store.commit():
+                print(f"➖ {filename}: 変更なし")
             
             print(f"✅ {filename}: {updated_count}匹のポケモンを更新")
             self.stats["updated_pokemon"] += updated_count
@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+図鑑データの SQLite データベース（data/pokedex.sqlite）の生成・書き出しツール
+- data/gen*_pokemon.json / data/pokedex_structures/*.json / config/pokeapi_regional_dex_data.json /
+  pokemon_images/ を1つのデータベースにまとめ、索引つきのテーブルで横断検索できるようにする
+- export でデータベースからギャラリーが読む JSON をバイト単位で同じ形に書き戻す
+  （内容が変わらないファイルは書き換えない）
+
+テーブル:
+  species             : 全国図鑑番号・名前・世代・高さ・重さ・進化前（evolves_from）
+  types               : タイプ（英語名 ⇔ 日本語名）
+  species_types       : ポケモン × タイプ（slot 順）
+  species_abilities   : ポケモン × 特性（slot 順、is_hidden）
+  stats               : 種族値（合計 total つき）
+  evolution_edges     : 進化先（from_id → to_id、gen*.json の next の並び順）
+  external_links      : 攻略サイトへのリンク
+  dexes / dex_entries : 図鑑と図鑑番号ごとの登録内容
+  regional_dex_numbers: PokeAPI の地方図鑑番号
+  forms / image_assets: フォーム・画像ファイル
+
+使い方:
+  python tools/data_processors/pokedex_db.py build
+  python tools/data_processors/pokedex_db.py export            # data/・config/ に JSON を書き戻す
+  python tools/data_processors/pokedex_db.py export --check    # 書き戻した結果が今のファイルと一致するか確認
+  python tools/data_processors/pokedex_db.py find --dex kitakami --type fire --sort speed
+  python tools/data_processors/pokedex_db.py query "SELECT name, total FROM species JOIN stats ON id = pokemon_id ORDER BY total DESC LIMIT 10"
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from json_store import encode, write_text_atomic  # noqa: E402
+from pokedex_core import FORM_IMAGE_DIRS, form_key  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[2]
+DATA_DIR = ROOT / 'data'
+CONFIG_DIR = ROOT / 'config'
+IMAGE_DIR = ROOT / 'pokemon_images'
+DB_PATH = DATA_DIR / 'pokedex.sqlite'
+SCHEMA_VERSION = 1
+
+HIDDEN_SUFFIX = '(隠れ)'
+STAT_KEYS = ['hp', 'attack', 'defense', 'special_attack', 'special_defense', 'speed']
+IMAGE_FILE_PATTERN = re.compile(r'^(\d+)(?:_(.+))?$')
+
+SCHEMA = """
+CREATE TABLE meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE species (
+    id           INTEGER PRIMARY KEY,
+    name         TEXT NOT NULL,
+    name_en      TEXT NOT NULL,
+    generation   INTEGER NOT NULL,
+    height       REAL NOT NULL,
+    weight       REAL NOT NULL,
+    evolves_from INTEGER
+);
+CREATE TABLE types (
+    name_en TEXT PRIMARY KEY,
+    name_ja TEXT NOT NULL UNIQUE
+);
+CREATE TABLE species_types (
+    pokemon_id INTEGER NOT NULL REFERENCES species(id),
+    slot       INTEGER NOT NULL,
+    type_en    TEXT NOT NULL REFERENCES types(name_en),
+    PRIMARY KEY (pokemon_id, slot)
+);
+CREATE TABLE species_abilities (
+    pokemon_id INTEGER NOT NULL REFERENCES species(id),
+    slot       INTEGER NOT NULL,
+    ability    TEXT NOT NULL,
+    is_hidden  INTEGER NOT NULL,
+    PRIMARY KEY (pokemon_id, slot)
+);
+CREATE TABLE stats (
+    pokemon_id      INTEGER PRIMARY KEY REFERENCES species(id),
+    hp              INTEGER NOT NULL,
+    attack          INTEGER NOT NULL,
+    defense         INTEGER NOT NULL,
+    special_attack  INTEGER NOT NULL,
+    special_defense INTEGER NOT NULL,
+    speed           INTEGER NOT NULL,
+    total           INTEGER NOT NULL
+);
+CREATE TABLE evolution_edges (
+    from_id  INTEGER NOT NULL REFERENCES species(id),
+    to_id    INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (from_id, to_id)
+);
+CREATE TABLE external_links (
+    pokemon_id INTEGER NOT NULL REFERENCES species(id),
+    site       TEXT NOT NULL,
+    url        TEXT NOT NULL,
+    position   INTEGER NOT NULL,
+    PRIMARY KEY (pokemon_id, site)
+);
+CREATE TABLE dexes (
+    id   INTEGER PRIMARY KEY,
+    key  TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL
+);
+CREATE TABLE dex_entries (
+    dex_id      INTEGER NOT NULL REFERENCES dexes(id),
+    number      INTEGER NOT NULL,
+    pokemon_id  INTEGER,
+    name        TEXT NOT NULL,
+    name_en     TEXT,
+    field_order TEXT NOT NULL,
+    PRIMARY KEY (dex_id, number)
+);
+CREATE TABLE regional_dex_numbers (
+    pokemon_id     INTEGER NOT NULL,
+    game           TEXT NOT NULL,
+    number         INTEGER,
+    entry_position INTEGER NOT NULL,
+    game_position  INTEGER NOT NULL,
+    PRIMARY KEY (pokemon_id, game)
+);
+CREATE TABLE forms (
+    form_key   TEXT PRIMARY KEY,
+    pokemon_id INTEGER NOT NULL,
+    form       TEXT NOT NULL,
+    folder     TEXT NOT NULL
+);
+CREATE TABLE image_assets (
+    path       TEXT PRIMARY KEY,
+    pokemon_id INTEGER NOT NULL,
+    folder     TEXT NOT NULL,
+    form_key   TEXT,
+    shiny      INTEGER NOT NULL,
+    bytes      INTEGER NOT NULL
+);
+
+CREATE INDEX idx_species_name ON species(name);
+CREATE INDEX idx_species_name_en ON species(name_en);
+CREATE INDEX idx_species_generation ON species(generation);
+CREATE INDEX idx_species_types_type ON species_types(type_en, pokemon_id);
+CREATE INDEX idx_species_abilities_ability ON species_abilities(ability);
+CREATE INDEX idx_stats_speed ON stats(speed);
+CREATE INDEX idx_stats_total ON stats(total);
+CREATE INDEX idx_evolution_edges_to ON evolution_edges(to_id);
+CREATE INDEX idx_dex_entries_pokemon ON dex_entries(pokemon_id, dex_id);
+CREATE INDEX idx_regional_dex_numbers_game ON regional_dex_numbers(game, number);
+CREATE INDEX idx_forms_pokemon ON forms(pokemon_id);
+CREATE INDEX idx_image_assets_pokemon ON image_assets(pokemon_id, folder);
+"""
+
+
+def read_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dex_files(data_dir):
+    return sorted((data_dir / 'pokedex_structures').glob('*.json'), key=lambda p: int(p.stem))
+
+
+# --- 生成 ---
+
+def insert_species(conn, data_dir):
+    type_names = {}
+    for gen in range(1, 10):
+        path = data_dir / f'gen{gen}_pokemon.json'
+        if not path.exists():
+            continue
+        for key, info in read_json(path).items():
+            pid = info['id']
+            if str(pid) != key or info['generation'] != gen:
+                raise ValueError(f"{path.name}: #{key} の id / generation がファイルと一致しません")
+            conn.execute('INSERT INTO species VALUES (?, ?, ?, ?, ?, ?, ?)',
+                         (pid, info['name'], info['name_en'], gen, info['height'], info['weight'],
+                          info['evolution']['prev']))
+            for slot, (name_ja, name_en) in enumerate(zip(info['types'], info['types_en']), 1):
+                if type_names.setdefault(name_en, name_ja) != name_ja:
+                    raise ValueError(f"#{pid}: タイプ {name_en} の日本語名が一致しません")
+                conn.execute('INSERT INTO species_types VALUES (?, ?, ?)', (pid, slot, name_en))
+            for slot, ability in enumerate(info['abilities'], 1):
+                hidden = ability.endswith(HIDDEN_SUFFIX)
+                conn.execute('INSERT INTO species_abilities VALUES (?, ?, ?, ?)',
+                             (pid, slot, ability.removesuffix(HIDDEN_SUFFIX), int(hidden)))
+            stats = [info['stats'][k] for k in STAT_KEYS]
+            conn.execute('INSERT INTO stats VALUES (?, ?, ?, ?, ?, ?, ?, ?)', (pid, *stats, sum(stats)))
+            for position, to_id in enumerate(info['evolution']['next']):
+                conn.execute('INSERT INTO evolution_edges VALUES (?, ?, ?)', (pid, to_id, position))
+            for position, (site, url) in enumerate(info.get('external_links', {}).items()):
+                conn.execute('INSERT INTO external_links VALUES (?, ?, ?, ?)', (pid, site, url, position))
+    conn.executemany('INSERT INTO types VALUES (?, ?)', sorted(type_names.items()))
+
+
+def insert_dexes(conn, data_dir):
+    for path in dex_files(data_dir):
+        dex = read_json(path)
+        conn.execute('INSERT INTO dexes VALUES (?, ?, ?)', (dex['id'], dex['key'], dex['name']))
+        for number, entry in dex['pokemon'].items():
+            if str(int(number)) != number:
+                raise ValueError(f"{path.name}: 図鑑番号 {number!r} は整数表記ではありません")
+            conn.execute('INSERT INTO dex_entries VALUES (?, ?, ?, ?, ?, ?)',
+                         (dex['id'], int(number), entry.get('pokemon_id'), entry['name'],
+                          entry.get('name_en'), ','.join(entry)))
+
+
+def insert_regional_numbers(conn, config_dir):
+    path = config_dir / 'pokeapi_regional_dex_data.json'
+    if not path.exists():
+        return
+    for entry_position, (pid, games) in enumerate(read_json(path).items()):
+        for game_position, (game, number) in enumerate(games.items()):
+            conn.execute('INSERT INTO regional_dex_numbers VALUES (?, ?, ?, ?, ?)',
+                         (int(pid), game, number, entry_position, game_position))
+
+
+def insert_images(conn, image_dir, root):
+    if not image_dir.is_dir():
+        return
+    for folder in sorted(p for p in image_dir.iterdir() if p.is_dir()):
+        for path in sorted(folder.glob('*.png')):
+            stem = path.stem.removesuffix('_shiny')
+            match = IMAGE_FILE_PATTERN.match(stem)
+            if not match:
+                continue
+            pid = int(match.group(1))
+            key = form_key(match.group(2)) if match.group(2) else None
+            relpath = path.relative_to(root).as_posix()
+            conn.execute('INSERT INTO image_assets VALUES (?, ?, ?, ?, ?, ?)',
+                         (relpath, pid, folder.name, key, int(path.stem != stem), path.stat().st_size))
+            if key and folder.name in FORM_IMAGE_DIRS and path.stem == stem:
+                base = conn.execute('SELECT name_en FROM species WHERE id = ?', (pid,)).fetchone()
+                form = key[len(base[0]) + 1:] if base and key.startswith(base[0] + '-') else key
+                conn.execute('INSERT OR IGNORE INTO forms VALUES (?, ?, ?, ?)', (key, pid, form, folder.name))
+
+
+def build(db_path=DB_PATH, data_dir=DATA_DIR, config_dir=CONFIG_DIR, image_dir=IMAGE_DIR, root=ROOT):
+    """JSON・画像フォルダからデータベースを作り直す（一時ファイルに作ってから置き換え）"""
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = db_path.with_name(f'.{db_path.name}.{os.getpid()}.tmp')
+    if tmp.exists():
+        tmp.unlink()
+    conn = sqlite3.connect(tmp)
+    try:
+        conn.executescript(SCHEMA)
+        with conn:
+            insert_species(conn, data_dir)
+            insert_dexes(conn, data_dir)
+            insert_regional_numbers(conn, config_dir)
+            insert_images(conn, image_dir, root)
+            conn.executemany('INSERT INTO meta VALUES (?, ?)', [
+                ('schema_version', str(SCHEMA_VERSION)),
+                ('built_at', time.strftime('%Y-%m-%dT%H:%M:%S')),
+            ])
+        conn.execute('ANALYZE')
+        conn.close()
+        os.replace(tmp, db_path)
+    finally:
+        conn.close()
+        if tmp.exists():
+            tmp.unlink()
+    return db_path
+
+
+def connect(db_path=DB_PATH):
+    if not Path(db_path).exists():
+        raise SystemExit(f"❌ {db_path} がありません。先に build を実行してください")
+    conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+# --- 書き出し ---
+
+def export_generation(conn, gen):
+    """gen{gen}_pokemon.json と同じ形の dict"""
+    def grouped(sql):
+        result = {}
+        for row in conn.execute(sql, (gen,)):
+            result.setdefault(row[0], []).append(row[1:])
+        return result
+
+    types = grouped('SELECT t.pokemon_id, t.type_en, ty.name_ja FROM species_types t '
+                    'JOIN types ty ON ty.name_en = t.type_en JOIN species s ON s.id = t.pokemon_id '
+                    'WHERE s.generation = ? ORDER BY t.pokemon_id, t.slot')
+    abilities = grouped('SELECT a.pokemon_id, a.ability, a.is_hidden FROM species_abilities a '
+                        'JOIN species s ON s.id = a.pokemon_id WHERE s.generation = ? ORDER BY a.pokemon_id, a.slot')
+    evolutions = grouped('SELECT e.from_id, e.to_id FROM evolution_edges e '
+                         'JOIN species s ON s.id = e.from_id WHERE s.generation = ? ORDER BY e.from_id, e.position')
+    links = grouped('SELECT l.pokemon_id, l.site, l.url FROM external_links l '
+                    'JOIN species s ON s.id = l.pokemon_id WHERE s.generation = ? ORDER BY l.pokemon_id, l.position')
+
+    result = {}
+    rows = conn.execute('SELECT s.*, st.* FROM species s JOIN stats st ON st.pokemon_id = s.id '
+                        'WHERE s.generation = ? ORDER BY s.id', (gen,))
+    for row in rows:
+        pid = row['id']
+        record = {
+            'id': pid,
+            'name': row['name'],
+            'name_en': row['name_en'],
+            'types': [name_ja for _, name_ja in types.get(pid, [])],
+            'types_en': [name_en for name_en, _ in types.get(pid, [])],
+            'abilities': [name + (HIDDEN_SUFFIX if hidden else '') for name, hidden in abilities.get(pid, [])],
+            'stats': {key: row[key] for key in STAT_KEYS},
+            'height': row['height'],
+            'weight': row['weight'],
+            'generation': row['generation'],
+            'evolution': {'prev': row['evolves_from'], 'next': [to_id for (to_id,) in evolutions.get(pid, [])]},
+        }
+        if pid in links:
+            record['external_links'] = {site: url for site, url in links[pid]}
+        result[str(pid)] = record
+    return result
+
+
+def export_dex(conn, dex_id):
+    """pokedex_structures/{dex_id}.json と同じ形の dict"""
+    dex = conn.execute('SELECT * FROM dexes WHERE id = ?', (dex_id,)).fetchone()
+    pokemon = {}
+    for row in conn.execute('SELECT * FROM dex_entries WHERE dex_id = ? ORDER BY number', (dex_id,)):
+        pokemon[str(row['number'])] = {field: row[field] for field in row['field_order'].split(',')}
+    return {'id': dex['id'], 'name': dex['name'], 'key': dex['key'], 'pokemon': pokemon}
+
+
+def export_regional_numbers(conn):
+    result = {}
+    for row in conn.execute('SELECT * FROM regional_dex_numbers ORDER BY entry_position, game_position'):
+        result.setdefault(str(row['pokemon_id']), {})[row['game']] = row['number']
+    return result
+
+
+def export_files(conn):
+    """(ROOT からの相対パス, JSON 文字列) の一覧"""
+    gens = [g for (g,) in conn.execute('SELECT DISTINCT generation FROM species ORDER BY generation')]
+    for gen in gens:
+        yield f'data/gen{gen}_pokemon.json', encode(export_generation(conn, gen))
+    for (dex_id,) in conn.execute('SELECT id FROM dexes ORDER BY id').fetchall():
+        yield f'data/pokedex_structures/{dex_id}.json', encode(export_dex(conn, dex_id))
+    if conn.execute('SELECT 1 FROM regional_dex_numbers LIMIT 1').fetchone():
+        yield 'config/pokeapi_regional_dex_data.json', encode(export_regional_numbers(conn))
+
+
+def export(conn, out_root=ROOT, check=False):
+    """JSON を書き戻す（check=True なら書かずに差分のあるファイルを返す）"""
+    changed = []
+    for relpath, text in export_files(conn):
+        path = Path(out_root) / relpath
+        if check:
+            if not path.exists() or path.read_bytes() != text.encode('utf-8'):
+                changed.append(relpath)
+        elif write_text_atomic(path, text):
+            changed.append(relpath)
+    return changed
+
+
+# --- 検索 ---
+
+def find(conn, dex=None, type_en=None, sort='speed', limit=None):
+    """図鑑・タイプで絞り込んで種族値順に並べる（例: キタカミ図鑑のほのおタイプを素早さ順）"""
+    if sort not in (*STAT_KEYS, 'total'):
+        raise ValueError(f'並び替えに使えない項目です: {sort}')
+    sql = ['SELECT DISTINCT s.id, s.name, st.*, {number} AS dex_number FROM species s',
+           'JOIN stats st ON st.pokemon_id = s.id']
+    params = []
+    number = 'NULL'
+    if dex is not None:
+        sql.append('JOIN dex_entries de ON de.pokemon_id = s.id JOIN dexes d ON d.id = de.dex_id AND d.key = ?')
+        params.append(dex)
+        number = 'de.number'
+    if type_en is not None:
+        sql.append('JOIN species_types t ON t.pokemon_id = s.id AND t.type_en = ?')
+        params.append(type_en)
+    sql.append(f'ORDER BY st.{sort} DESC, s.id')
+    if limit:
+        sql.append('LIMIT ?')
+        params.append(limit)
+    return conn.execute(' '.join(sql).format(number=number), params).fetchall()
+
+
+def main():
+    ap = argparse.ArgumentParser(description='図鑑データの SQLite データベース生成・JSON 書き出し')
+    ap.add_argument('--db', type=Path, default=DB_PATH, help='データベースファイル')
+    sub = ap.add_subparsers(dest='command', required=True)
+    sub.add_parser('build', help='JSON・画像フォルダからデータベースを作り直す')
+    p = sub.add_parser('export', help='データベースからギャラリー用 JSON を書き戻す')
+    p.add_argument('--out', type=Path, default=ROOT, help='書き出し先（既定: リポジトリ直下の data/・config/）')
+    p.add_argument('--check', action='store_true', help='書き込まずに今のファイルとの差分だけ表示')
+    p = sub.add_parser('find', help='図鑑・タイプで絞り込んで種族値順に表示')
+    p.add_argument('--dex', help='図鑑キー（kitakami, sv, national など）')
+    p.add_argument('--type', dest='type_en', help='タイプ（英語: fire, water など）')
+    p.add_argument('--sort', default='speed', help='並び替える種族値（既定: speed）')
+    p.add_argument('--limit', type=int)
+    p = sub.add_parser('query', help='任意の SQL を実行（読み取り専用）')
+    p.add_argument('sql')
+    args = ap.parse_args()
+
+    started = time.perf_counter()
+    if args.command == 'build':
+        build(args.db)
+        conn = connect(args.db)
+        counts = {t: conn.execute(f'SELECT COUNT(*) FROM {t}').fetchone()[0]
+                  for t in ('species', 'dex_entries', 'evolution_edges', 'forms', 'image_assets')}
+        print(f"✅ {args.db.relative_to(ROOT) if args.db.is_relative_to(ROOT) else args.db} を生成 "
+              f"({', '.join(f'{t} {n}' for t, n in counts.items())} / {time.perf_counter() - started:.2f}秒)")
+        return
+
+    conn = connect(args.db)
+    if args.command == 'export':
+        changed = export(conn, args.out, check=args.check)
+        if args.check:
+            print("✅ データベースと JSON は一致しています" if not changed else "⚠️ 内容が異なるファイル:")
+        else:
+            print(f"✅ 書き出し完了: {len(changed)} ファイルを更新" + ("（変更なし）" if not changed else ":"))
+        for relpath in changed:
+            print(f"  - {relpath}")
+        if args.check and changed:
+            sys.exit(1)
+    elif args.command == 'find':
+        rows = find(conn, args.dex, args.type_en, args.sort, args.limit)
+        for row in rows:
+            number = f"No.{row['dex_number']:03d} " if row['dex_number'] is not None else ''
+            print(f"  {number}#{row['id']:04d} {row['name']:<8} {args.sort}: {row[args.sort]}")
+        print(f"📊 {len(rows)} 匹 ({(time.perf_counter() - started) * 1000:.1f}ms)")
+    elif args.command == 'query':
+        cursor = conn.execute(args.sql)
+        print('\t'.join(d[0] for d in cursor.description))
+        for row in cursor:
+            print('\t'.join('' if v is None else str(v) for v in row))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,20 +1,99 @@
 """
 PokeAkane データ収集ツール - 最強版 🔥
 PokeAPIから全ポケモンの詳細データを収集してJSONデータベースを構築
+
+- --workers で並列取得（全スレッド合計で --rate 回/秒までに制限）
+- 取得したレスポンスは .cache/pokeapi/ に URL 単位で保存し、再実行時は通信しない
+- 特性名・進化チェーンは URL ごとに1度だけ取得・解析し、.cache/pokeapi_lookups.json に保存して次回も再利用
+- --base-url でローカルの偽 PokeAPI（tools/benchmarks/fake_pokeapi.py）に向けられる
+
+使い方:
+  python tools/data_processors/pokemon_data_collector.py
+  python tools/data_processors/pokemon_data_collector.py --workers 8 --rate 20
+  python tools/data_processors/pokemon_data_collector.py --revalidate   # 条件付きGETで変更分だけ再取得
 """
 
-import requests
+import argparse
 import json
+import sys
+import threading
 import time
-from urllib.parse import urljoin
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from net_utils import DEFAULT_CACHE_DIR, HttpClient, ResponseCache  # noqa: E402
+
+DEFAULT_BASE_URL = "https://pokeapi.co/api/v2/"
+DEFAULT_LOOKUP_FILE = DEFAULT_CACHE_DIR / 'pokeapi_lookups.json'
+
+
+class LookupMemo:
+    """URL → 解析済みの値 のメモ（特性名・進化チェーン）
+
+    実行中は全スレッドで共有し、同じ URL を複数スレッドが同時に求めても取得は1回だけ。
+    path を指定すると保存・読み込みして次回の実行でも再利用します（load=False なら読み込まず上書き）。
+    """
+
+    TABLES = ('abilities', 'chains')
+
+    def __init__(self, path=None, load=True):
+        self.path = Path(path) if path else None
+        self.tables = {name: {} for name in self.TABLES}
+        self.lock = threading.Lock()
+        self.key_locks = {}
+        self.hits = 0
+        self.misses = 0
+        if load and self.path and self.path.exists():
+            try:
+                saved = json.loads(self.path.read_text(encoding='utf-8'))
+                for name in self.TABLES:
+                    self.tables[name].update(saved.get(name, {}))
+            except (OSError, ValueError) as e:
+                print(f"⚠️ メモファイルを読み込めません（作り直します）: {e}")
+
+    def get(self, table, key, compute):
+        """メモにあれば返し、無ければ compute() の結果を登録して返す（例外時は登録しない）"""
+        values = self.tables[table]
+        if key in values:
+            self.hits += 1
+            return values[key]
+        with self.lock:
+            key_lock = self.key_locks.setdefault((table, key), threading.Lock())
+        with key_lock:
+            if key in values:
+                self.hits += 1
+                return values[key]
+            value = compute()
+            values[key] = value
+            self.misses += 1
+            return value
+
+    def save(self):
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        with self.lock:
+            data = {name: dict(values) for name, values in self.tables.items()}
+        tmp.write_text(json.dumps(data, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+        os.replace(tmp, self.path)
+
 
 class PokemonDataCollector:
-    def __init__(self):
-        self.base_url = "https://pokeapi.co/api/v2/"
+    def __init__(self, base_url=DEFAULT_BASE_URL, client=None, lookups=None):
+        self.base_url = base_url.rstrip('/') + '/'
+        # 指定がなければ従来どおり逐次・約5回/秒・キャッシュあり
+        self.client = client or HttpClient(rate=5, concurrency=1,
+                                           cache=ResponseCache(DEFAULT_CACHE_DIR / 'pokeapi'))
+        # 特性名・進化チェーンのメモ（URL がキー）
+        self.lookups = lookups or LookupMemo(DEFAULT_LOOKUP_FILE)
         self.pokemon_data = {}
         self.type_data = {}
-        self.evolution_chains = {}
         
         # 世代別範囲定義
         self.generations = {
@@ -43,17 +122,15 @@ class PokemonDataCollector:
         try:
             # 基本情報取得
             url = f"{self.base_url}pokemon/{pokemon_id}"
-            response = requests.get(url, timeout=30)
-            if response.status_code != 200:
-                print(f"❌ #{pokemon_id:03d} 取得失敗: {response.status_code}")
+            try:
+                pokemon = self.client.get_json(url)
+            except requests.HTTPError as e:
+                print(f"❌ #{pokemon_id:03d} 取得失敗: {e.response.status_code}")
                 return None
-                
-            pokemon = response.json()
             
             # ポケモン種族情報取得
             species_url = pokemon['species']['url']
-            species_response = requests.get(species_url, timeout=30)
-            species = species_response.json()
+            species = self.client.get_json(species_url)
             
             # 日本語名取得
             japanese_name = "Unknown"
@@ -137,18 +214,19 @@ class PokemonDataCollector:
         return [type_translation.get(t, t) for t in types_en]
 
     def get_ability_japanese_name(self, ability_url):
-        """特性の日本語名取得"""
+        """特性の日本語名取得（URL ごとに1回だけ取得）"""
         try:
-            response = requests.get(ability_url, timeout=10)
-            ability_data = response.json()
-            
-            for name in ability_data['names']:
-                if name['language']['name'] == 'ja-Hrkt':
-                    return name['name']
-            return ability_data['name']  # フォールバック
-        except:
+            return self.lookups.get('abilities', ability_url, lambda: self.fetch_ability_japanese_name(ability_url))
+        except Exception:
             return "Unknown"
 
+    def fetch_ability_japanese_name(self, ability_url):
+        ability_data = self.client.get_json(ability_url)
+        for name in ability_data['names']:
+            if name['language']['name'] == 'ja-Hrkt':
+                return name['name']
+        return ability_data['name']  # フォールバック
+
     def get_generation(self, pokemon_id):
         """ポケモンIDから世代を判定"""
         for gen, (start, end) in self.generations.items():
@@ -157,89 +235,94 @@ class PokemonDataCollector:
         return 9  # デフォルト
 
     def get_evolution_data(self, evolution_chain_url, pokemon_id):
-        """進化チェーンデータ取得"""
+        """進化チェーンデータ取得
+
+        チェーンは URL ごとに1回だけ取得し、全メンバーの {prev, next} にまとめてメモする
+        （3段進化なら3匹目以降は通信も解析もしない）
+        """
         try:
-            response = requests.get(evolution_chain_url, timeout=10)
-            chain_data = response.json()
-            
-            # 進化チェーンを平坦化
-            evolution_list = []
-            self.flatten_evolution_chain(chain_data['chain'], evolution_list)
-            
-            # 該当ポケモンの前後を特定
-            prev_pokemon = None
-            next_pokemon = []
-            
-            for i, evo in enumerate(evolution_list):
-                if evo['id'] == pokemon_id:
-                    if i > 0:
-                        prev_pokemon = evolution_list[i-1]['id']
-                    if i < len(evolution_list) - 1:
-                        next_pokemon = [evolution_list[i+1]['id']]
-                    break
-            
-            return {
-                "prev": prev_pokemon,
-                "next": next_pokemon
-            }
-            
+            evolution_map = self.lookups.get(
+                'chains', evolution_chain_url,
+                lambda: self.build_evolution_map(self.client.get_json(evolution_chain_url)['chain']))
         except Exception as e:
             print(f"進化データ取得エラー: {e}")
             return {"prev": None, "next": []}
 
-    def flatten_evolution_chain(self, chain, result):
-        """進化チェーンを再帰的に平坦化"""
-        # ポケモンIDを取得
-        pokemon_url = chain['species']['url']
-        pokemon_id = int(pokemon_url.split('/')[-2])
-        
-        result.append({
-            'id': pokemon_id,
-            'name': chain['species']['name']
-        })
-        
-        # 次の進化があれば再帰
-        for evolution in chain['evolves_to']:
-            self.flatten_evolution_chain(evolution, result)
+        entry = evolution_map.get(str(pokemon_id))
+        if entry is None:
+            return {"prev": None, "next": []}
+        return {"prev": entry['prev'], "next": list(entry['next'])}
 
-    def collect_all_pokemon_data(self, start=1, end=1025):
-        """全ポケモンデータ収集"""
-        print(f"🚀 ポケモンデータ収集開始 (#{start:03d} ～ #{end:03d})")
+    def build_evolution_map(self, chain, prev=None, result=None):
+        """進化チェーンの木をたどって {ポケモンID: {prev, next}} を作る
+
+        枝分かれ（イーブイなど）は next に全ての進化先が入り、各進化先の prev は分岐元になる
+        """
+        if result is None:
+            result = {}
+        pokemon_id = int(chain['species']['url'].rstrip('/').split('/')[-1])
+        children = chain.get('evolves_to', [])
+        result[str(pokemon_id)] = {
+            'prev': prev,
+            'next': [int(c['species']['url'].rstrip('/').split('/')[-1]) for c in children],
+        }
+        for evolution in children:
+            self.build_evolution_map(evolution, pokemon_id, result)
+        return result
+
+    def collect_one(self, pokemon_id):
+        """1匹分を取得（3回まで試行）"""
+        for attempt in range(3):  # 3回まで試行
+            try:
+                return self.get_pokemon_basic_data(pokemon_id)
+            except Exception as e:
+                print(f"⚠️ #{pokemon_id:03d} 試行{attempt+1}回目失敗: {e}")
+                if attempt < 2:  # 最後の試行でなければ待機
+                    time.sleep(2)
+                else:
+                    print(f"❌ #{pokemon_id:03d} 3回試行して失敗 - スキップ")
+        return None
+
+    def collect_all_pokemon_data(self, start=1, end=1025, workers=1):
+        """全ポケモンデータ収集（workers > 1 でスレッド並列）
+
+        API制限対策の待機は self.client のレート制限が全スレッド共通で行う
+        """
+        print(f"🚀 ポケモンデータ収集開始 (#{start:03d} ～ #{end:03d}, {workers} 並列)")
         
+        pending = []
         for pokemon_id in range(start, end + 1):
             # 既にデータがあればスキップ
             if str(pokemon_id) in self.pokemon_data:
                 print(f"⏭️ #{pokemon_id:03d} は既に存在 - スキップ")
                 continue
-                
-            # リトライロジック
-            for attempt in range(3):  # 3回まで試行
-                try:
-                    pokemon_data = self.get_pokemon_basic_data(pokemon_id)
-                    if pokemon_data:
-                        self.pokemon_data[str(pokemon_id)] = pokemon_data
-                        break
-                except Exception as e:
-                    print(f"⚠️ #{pokemon_id:03d} 試行{attempt+1}回目失敗: {e}")
-                    if attempt < 2:  # 最後の試行でなければ待機
-                        time.sleep(2)
-                    else:
-                        print(f"❌ #{pokemon_id:03d} 3回試行して失敗 - スキップ")
-            
-            # API制限対策
-            time.sleep(0.2)
-            
-            # 100件ごとに中間保存
-            if pokemon_id % 100 == 0:
-                self.save_data(f"pokemon_data_backup_{pokemon_id}.json")
-                print(f"💾 #{pokemon_id} まで中間保存完了")
+            pending.append(pokemon_id)
+
+        done = 0
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = {pool.submit(self.collect_one, pokemon_id): pokemon_id for pokemon_id in pending}
+            for future in as_completed(futures):
+                pokemon_data = future.result()
+                if pokemon_data:
+                    self.pokemon_data[str(futures[future])] = pokemon_data
+                done += 1
+                # 100件ごとに中間保存
+                if done % 100 == 0:
+                    self.save_data(f"pokemon_data_backup_{done}.json")
+                    self.lookups.save()
+                    print(f"💾 {done}/{len(pending)} 件まで中間保存完了")
         
+        self.lookups.save()
         print("🎉 全ポケモンデータ収集完了！")
+        print(f"📡 {self.client.summary()}")
+        print(f"🧠 特性・進化チェーンのメモ: 再利用 {self.lookups.hits} 回 / 新規 {self.lookups.misses} 件")
 
     def save_data(self, filename="pokemon_data.json"):
         """データをJSONファイルに保存"""
+        # 並列取得では完了順がばらばらなので図鑑番号順に並べて保存
+        ordered = dict(sorted(self.pokemon_data.items(), key=lambda kv: int(kv[0])))
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.pokemon_data, f, ensure_ascii=False, indent=2)
+            json.dump(ordered, f, ensure_ascii=False, indent=2)
         print(f"💾 {filename} に保存完了")
 
     def load_existing_data(self, filename="pokemon_data.json"):
@@ -250,20 +333,40 @@ class PokemonDataCollector:
             print(f"📂 既存データ {len(self.pokemon_data)} 件読み込み完了")
 
 def main():
+    parser = argparse.ArgumentParser(description='PokeAPI からポケモンデータを収集')
+    parser.add_argument('--start', type=int, default=1, help='開始する全国図鑑番号')
+    parser.add_argument('--end', type=int, default=1025, help='終了する全国図鑑番号')
+    parser.add_argument('--workers', type=int, default=1, help='並列取得数（既定: 1 = 逐次）')
+    parser.add_argument('--rate', type=float, default=5.0, help='1秒あたりの最大リクエスト数（全体）')
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL, help='PokeAPI のベースURL')
+    parser.add_argument('--cache-dir', type=Path, default=DEFAULT_CACHE_DIR / 'pokeapi',
+                        help='レスポンスキャッシュの保存先')
+    parser.add_argument('--no-cache', action='store_true', help='レスポンスキャッシュ・特性/進化チェーンのメモを使わない')
+    parser.add_argument('--revalidate', action='store_true',
+                        help='キャッシュ済みのURLも条件付きGETで確認し、変更分だけ再取得')
+    parser.add_argument('--output', default='pokemon_data.json', help='保存先JSON')
+    args = parser.parse_args()
+
     print("🌟 PokeAkane 最強データ収集ツール起動！")
     
-    collector = PokemonDataCollector()
+    client = HttpClient(rate=args.rate, concurrency=args.workers,
+                        cache=None if args.no_cache else ResponseCache(args.cache_dir),
+                        revalidate=args.revalidate)
+    # 再検証時はメモも作り直す（特性名・進化チェーンの変更を拾うため）
+    lookups = LookupMemo(None if args.no_cache else args.cache_dir.parent / DEFAULT_LOOKUP_FILE.name,
+                         load=not args.revalidate)
+    collector = PokemonDataCollector(base_url=args.base_url, client=client, lookups=lookups)
     
     # 既存データがあれば読み込み
-    collector.load_existing_data()
+    collector.load_existing_data(args.output)
     
     # データ収集実行
-    collector.collect_all_pokemon_data(1, 1025)  # 全ポケモン収集！
+    collector.collect_all_pokemon_data(args.start, args.end, workers=args.workers)
     
     # 最終保存
-    collector.save_data()
+    collector.save_data(args.output)
     
-    print("✨ データ収集完了！pokemon_data.json をチェックしてね〜")
+    print(f"✨ データ収集完了！{args.output} をチェックしてね〜")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -2,18 +2,58 @@
 # -*- coding: utf-8 -*-
 """
 ポケモンZA 図鑑画面からポケモン画像を抽出するツール
+- 引数なしで起動すると対話モード（カレントディレクトリの画像から1枚選んで抽出）
+- --batch でフォルダ内のスクリーンショットをまとめて処理（CPU コア数ぶん並列）
+    - 画像のデコードと HSV・グレースケール変換は1枚につき1回だけ行い、全手法で使い回す
+    - 3手法（色範囲・エッジ検出・固定領域）の結果に信頼度をつけ、最も高いものだけを保存
+    - 処理速度（枚/秒）と手法ごとの採用数を表示
+
+使い方:
+  python tools/data_processors/pokemon_extractor.py
+  python tools/data_processors/pokemon_extractor.py --batch screenshots/ --output extracted_pokemon --jobs 4
+  python tools/data_processors/pokemon_extractor.py --batch screenshots/ --save-all   # 3手法すべて保存（従来の auto と同じ）
 """
 
+import argparse
 import cv2
 import numpy as np
 from PIL import Image, ImageEnhance
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+IMAGE_EXTENSIONS = ['.png', '.jpg', '.jpeg', '.bmp']
+
+# 図鑑の青い背景（HSV）。薄い青 [100-130, 50+, 50+] と広範囲の青 [90-140, 30+, 30+] の和
+BACKGROUND_HUE = (90, 140)
+BACKGROUND_MIN_SATURATION = 30
+BACKGROUND_MIN_VALUE = 30
+
+# 固定領域（画面に対する割合）: 中央やや右寄り、テキスト領域を避ける
+FIXED_REGION = (0.35, 0.15, 0.95, 0.75)   # (左, 上, 右, 下)
+# 固定領域は常に何かを切り出せるので、他の手法が信頼できないときの保険として低めの一定値
+FIXED_REGION_CONFIDENCE = 0.25
+# 抽出した領域が画面に占める割合がこの範囲ならポケモンらしい大きさとみなす
+PLAUSIBLE_COVERAGE = (0.03, 0.6)
+
 class PokemonExtractor:
-    def __init__(self, output_dir="extracted_pokemon"):
+    def __init__(self, output_dir="extracted_pokemon", verbose=True):
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.verbose = verbose
+
+    def _log(self, message):
+        if self.verbose:
+            print(message)
+
+    @staticmethod
+    def _prepare(image):
+        """全手法で使う変換結果（1枚につき1回だけ計算）"""
+        return {
+            'hsv': cv2.cvtColor(image, cv2.COLOR_BGR2HSV),
+            'gray': cv2.cvtColor(image, cv2.COLOR_BGR2GRAY),
+        }
         
     def extract_pokemon_from_pokedex(self, image_path, pokemon_name=None, method="auto"):
         """
@@ -22,15 +62,15 @@ class PokemonExtractor:
         Args:
             image_path: 入力画像のパス
             pokemon_name: 保存時の名前（Noneの場合は自動生成）
-            method: 抽出方法 ("auto", "manual", "color_range")
+            method: 抽出方法 ("auto", "manual", "color_range", "edge_detection", "fixed_region")
         """
         # 画像読み込み
         image = cv2.imread(str(image_path))
         if image is None:
-            print(f"❌ 画像が読み込めません: {image_path}")
+            self._log(f"❌ 画像が読み込めません: {image_path}")
             return None
             
-        print(f"📸 画像読み込み成功: {image.shape}")
+        self._log(f"📸 画像読み込み成功: {image.shape}")
         
         if method == "auto":
             return self._extract_auto(image, pokemon_name, image_path)
@@ -38,143 +78,202 @@ class PokemonExtractor:
             return self._extract_manual(image, pokemon_name, image_path)
         elif method == "color_range":
             return self._extract_color_range(image, pokemon_name, image_path)
+        elif method == "edge_detection":
+            return self._extract_edge_detection(image, pokemon_name, image_path)
+        elif method == "fixed_region":
+            return self._extract_fixed_region(image, pokemon_name, image_path)
             
-    def _extract_auto(self, image, pokemon_name, image_path):
-        """自動抽出（複数手法を試行）"""
-        print("🤖 自動抽出モードで処理中...")
-        
-        # 手法1: 色範囲での背景除去
-        result1 = self._extract_color_range(image, f"{pokemon_name}_method1" if pokemon_name else "auto_method1", image_path, save=False)
-        
-        # 手法2: エッジ検出
-        result2 = self._extract_edge_detection(image, f"{pokemon_name}_method2" if pokemon_name else "auto_method2", image_path, save=False)
-        
-        # 手法3: 固定領域抽出
-        result3 = self._extract_fixed_region(image, f"{pokemon_name}_method3" if pokemon_name else "auto_method3", image_path, save=False)
-        
+    def _extract_auto(self, image, pokemon_name, image_path, save_all=False):
+        """自動抽出（3手法を試行し、信頼度が最も高い結果を保存。save_all=True なら全手法を保存）"""
+        self._log("🤖 自動抽出モードで処理中...")
+
+        candidates = self._auto_candidates(image, image_path)
+        if not candidates:
+            return []
+        return [path for _, _, path in self._save_candidates(candidates, pokemon_name, save_all)]
+
+    def _save_candidates(self, candidates, pokemon_name, save_all=False):
+        """候補を保存して [(手法名, 信頼度, 保存先)] を返す（save_all=False なら信頼度が最も高いものだけ）"""
+        if not save_all:
+            candidates = [max(candidates, key=lambda c: c[2])]
+
         # 結果を保存
         results = []
-        for i, (result, method_name) in enumerate([(result1, "color_range"), (result2, "edge_detection"), (result3, "fixed_region")]):
-            if result is not None:
-                filename = f"{pokemon_name}_{method_name}.png" if pokemon_name else f"extracted_{method_name}.png"
-                output_path = self.output_dir / filename
-                cv2.imwrite(str(output_path), result)
-                results.append(output_path)
-                print(f"✅ 保存完了: {filename}")
-        
+        for method_name, result, confidence in candidates:
+            filename = f"{pokemon_name}_{method_name}.png" if pokemon_name else f"extracted_{method_name}.png"
+            output_path = self.output_dir / filename
+            cv2.imwrite(str(output_path), result)
+            results.append((method_name, confidence, output_path))
+            self._log(f"✅ 保存完了: {filename}（信頼度 {confidence:.2f}）")
+
         return results
-    
-    def _extract_color_range(self, image, pokemon_name, image_path, save=True):
+
+    def _auto_candidates(self, image, image_path):
+        """自動抽出の候補 [(手法名, 抽出結果, 信頼度)]。HSV・グレースケール変換は1回だけ行い全手法で共有"""
+        prepared = self._prepare(image)
+        candidates = []
+
+        # 手法1: 色範囲での背景除去
+        result = self._extract_color_range(image, None, image_path, save=False, prepared=prepared)
+        candidates.append(("color_range", result, self._mask_confidence(result[:, :, 3] > 0)))
+
+        # 手法2: エッジ検出
+        contour = self._largest_contour(prepared['gray'])
+        if contour is not None:
+            result = self._extract_edge_detection(image, None, image_path, save=False, prepared=prepared, contour=contour)
+            candidates.append(("edge_detection", result, self._contour_confidence(contour, image.shape)))
+
+        # 手法3: 固定領域抽出
+        result = self._extract_fixed_region(image, None, image_path, save=False)
+        candidates.append(("fixed_region", result, FIXED_REGION_CONFIDENCE))
+
+        return candidates
+
+    @staticmethod
+    def _coverage_score(coverage):
+        """画面に占める割合 → 0〜1（PLAUSIBLE_COVERAGE の範囲内なら 1、外れるほど下がる）"""
+        low, high = PLAUSIBLE_COVERAGE
+        if coverage < low:
+            return coverage / low
+        if coverage > high:
+            return max(0.0, (1 - coverage) / (1 - high))
+        return 1.0
+
+    def _mask_confidence(self, foreground):
+        """色範囲の信頼度: 前景が背景に囲まれ（画面の端に触れず）、外接矩形の中が詰まっているほど高い"""
+        ys = np.flatnonzero(foreground.any(axis=1))
+        xs = np.flatnonzero(foreground.any(axis=0))
+        if len(ys) == 0:
+            return 0.0
+        h, w = foreground.shape
+        box_area = (ys[-1] - ys[0] + 1) * (xs[-1] - xs[0] + 1)
+        fill = np.count_nonzero(foreground) / box_area
+        # 前景が触れている画面の辺の数（背景が取り除けていないと四辺すべてに触れる）
+        edges_touched = int(ys[0] == 0) + int(ys[-1] == h - 1) + int(xs[0] == 0) + int(xs[-1] == w - 1)
+        return float(fill * self._coverage_score(box_area / (h * w)) * (1 - edges_touched / 4))
+
+    def _contour_confidence(self, contour, shape):
+        """エッジ検出の信頼度: 最大輪郭が外接矩形をどれだけ埋めているか × 大きさの妥当さ"""
+        h, w = shape[:2]
+        _, _, box_w, box_h = cv2.boundingRect(contour)
+        box_area = box_w * box_h
+        if box_area == 0:
+            return 0.0
+        fill = min(1.0, cv2.contourArea(contour) / box_area)
+        return fill * self._coverage_score(box_area / (h * w))
+
+    @staticmethod
+    def _background_mask(hsv):
+        """図鑑の青い背景のマスク（0/255）。2つの青の範囲の和を1回の比較で求める"""
+        hue, saturation, value = hsv[:, :, 0], hsv[:, :, 1], hsv[:, :, 2]
+        background = ((hue >= BACKGROUND_HUE[0]) & (hue <= BACKGROUND_HUE[1])
+                      & (saturation >= BACKGROUND_MIN_SATURATION) & (value >= BACKGROUND_MIN_VALUE))
+        return background.astype(np.uint8) * 255
+
+    @staticmethod
+    def _largest_contour(gray):
+        """Canny エッジの最大輪郭（ポケモンと仮定）。見つからなければ None"""
+        # ガウシアンブラーでノイズ除去
+        blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+
+        # Cannyエッジ検出
+        edges = cv2.Canny(blurred, 50, 150)
+
+        # 輪郭検出
+        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        if not contours:
+            return None
+        return max(contours, key=cv2.contourArea)
+
+    def _extract_color_range(self, image, pokemon_name, image_path, save=True, prepared=None):
         """色範囲指定での背景除去"""
-        print("🎨 色範囲指定で背景除去中...")
-        
+        self._log("🎨 色範囲指定で背景除去中...")
+
         # BGR色空間をHSVに変換
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
-        
-        # 青い背景の色範囲を定義（HSV）
-        # 図鑑の青い背景を除去
-        lower_blue1 = np.array([100, 50, 50])   # 薄い青
-        upper_blue1 = np.array([130, 255, 255]) # 濃い青
-        
-        lower_blue2 = np.array([90, 30, 30])    # より広範囲の青
-        upper_blue2 = np.array([140, 255, 255])
-        
-        # マスク作成（背景部分）
-        mask_blue1 = cv2.inRange(hsv, lower_blue1, upper_blue1)
-        mask_blue2 = cv2.inRange(hsv, lower_blue2, upper_blue2)
-        background_mask = cv2.bitwise_or(mask_blue1, mask_blue2)
-        
+        hsv = prepared['hsv'] if prepared else cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+
+        # 図鑑の青い背景を除去（マスク作成: 背景部分）
+        background_mask = self._background_mask(hsv)
+
         # モルフォロジー処理でノイズ除去
         kernel = np.ones((3,3), np.uint8)
         background_mask = cv2.morphologyEx(background_mask, cv2.MORPH_CLOSE, kernel)
         background_mask = cv2.morphologyEx(background_mask, cv2.MORPH_OPEN, kernel)
-        
+
         # ポケモン領域のマスク（背景の逆）
         pokemon_mask = cv2.bitwise_not(background_mask)
-        
+
         # 4チャンネル画像作成（BGRA）
         result = cv2.cvtColor(image, cv2.COLOR_BGR2BGRA)
         result[:, :, 3] = pokemon_mask  # アルファチャンネルにマスクを適用
-        
+
         if save and pokemon_name:
             filename = f"{pokemon_name}_color_range.png"
             output_path = self.output_dir / filename
             cv2.imwrite(str(output_path), result)
-            print(f"✅ 色範囲抽出完了: {filename}")
+            self._log(f"✅ 色範囲抽出完了: {filename}")
             return str(output_path)
-            
+
         return result
-    
-    def _extract_edge_detection(self, image, pokemon_name, image_path, save=True):
+
+    def _extract_edge_detection(self, image, pokemon_name, image_path, save=True, prepared=None, contour=None):
         """エッジ検出による輪郭抽出"""
-        print("📐 エッジ検出で輪郭抽出中...")
-        
-        # グレースケール変換
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        
-        # ガウシアンブラーでノイズ除去
-        blurred = cv2.GaussianBlur(gray, (5, 5), 0)
-        
-        # Cannyエッジ検出
-        edges = cv2.Canny(blurred, 50, 150)
-        
-        # 輪郭検出
-        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        
-        if contours:
-            # 最大の輪郭を取得（ポケモンと仮定）
-            largest_contour = max(contours, key=cv2.contourArea)
-            
+        self._log("📐 エッジ検出で輪郭抽出中...")
+
+        if contour is None:
+            # グレースケール変換
+            gray = prepared['gray'] if prepared else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            contour = self._largest_contour(gray)
+
+        if contour is not None:
             # バウンディングボックス取得
-            x, y, w, h = cv2.boundingRect(largest_contour)
-            
+            x, y, w, h = cv2.boundingRect(contour)
+
             # ポケモン領域を切り抜き
             pokemon_region = image[y:y+h, x:x+w]
-            
+
             if save and pokemon_name:
                 filename = f"{pokemon_name}_edge_detection.png"
                 output_path = self.output_dir / filename
                 cv2.imwrite(str(output_path), pokemon_region)
-                print(f"✅ エッジ検出完了: {filename}")
+                self._log(f"✅ エッジ検出完了: {filename}")
                 return str(output_path)
-                
+
             return pokemon_region
-        
-        print("⚠️ 輪郭が検出できませんでした")
+
+        self._log("⚠️ 輪郭が検出できませんでした")
         return None
-    
+
     def _extract_fixed_region(self, image, pokemon_name, image_path, save=True):
         """固定領域での抽出（図鑑画面用）"""
-        print("📏 固定領域で抽出中...")
-        
+        self._log("📏 固定領域で抽出中...")
+
         h, w = image.shape[:2]
-        
+
         # ポケモンZA図鑑画面の推定領域
-        # 中央やや右寄り、テキスト領域を避ける
-        start_x = int(w * 0.35)  # 左35%から
-        end_x = int(w * 0.95)    # 右95%まで
-        start_y = int(h * 0.15)  # 上15%から
-        end_y = int(h * 0.75)    # 下75%まで
-        
+        left, top, right, bottom = FIXED_REGION
+        start_x, end_x = int(w * left), int(w * right)
+        start_y, end_y = int(h * top), int(h * bottom)
+
         # 領域切り抜き
         pokemon_region = image[start_y:end_y, start_x:end_x]
-        
+
         if save and pokemon_name:
             filename = f"{pokemon_name}_fixed_region.png"
             output_path = self.output_dir / filename
             cv2.imwrite(str(output_path), pokemon_region)
-            print(f"✅ 固定領域抽出完了: {filename}")
+            self._log(f"✅ 固定領域抽出完了: {filename}")
             return str(output_path)
-            
+
         return pokemon_region
-    
+
     def _extract_manual(self, image, pokemon_name, image_path):
         """手動での座標指定抽出"""
-        print("✋ 手動座標指定モード（コンソール入力）")
+        self._log("✋ 手動座標指定モード（コンソール入力）")
         
         h, w = image.shape[:2]
-        print(f"画像サイズ: {w} x {h}")
-        print("抽出したい領域の座標を入力してください:")
+        self._log(f"画像サイズ: {w} x {h}")
+        self._log("抽出したい領域の座標を入力してください:")
         
         try:
             start_x = int(input("開始X座標: "))
@@ -195,23 +294,92 @@ class PokemonExtractor:
                 filename = f"{pokemon_name}_manual.png"
                 output_path = self.output_dir / filename
                 cv2.imwrite(str(output_path), pokemon_region)
-                print(f"✅ 手動抽出完了: {filename}")
+                self._log(f"✅ 手動抽出完了: {filename}")
                 return str(output_path)
                 
             return pokemon_region
             
         except ValueError:
-            print("❌ 無効な座標が入力されました")
+            self._log("❌ 無効な座標が入力されました")
             return None
 
+    def extract_batch(self, input_dir, jobs=None, save_all=False):
+        """フォルダ内のスクリーンショットをプロセスプールでまとめて自動抽出
+
+        1枚ごとに最も信頼度の高い手法の結果を「<元のファイル名>_<手法名>.png」で保存する。
+        戻り値は [(ファイル名, 手法名, 信頼度, 保存先)]（読めなかった画像は手法名 None）
+        """
+        input_dir = Path(input_dir)
+        image_files = sorted(p for p in input_dir.iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS)
+        if not image_files:
+            print(f"📁 画像ファイルが見つかりません: {input_dir}")
+            return []
+
+        started = time.perf_counter()
+        print(f"📸 {len(image_files)} 枚を一括抽出中... → {self.output_dir}")
+        jobs_list = [(path, str(self.output_dir), save_all) for path in image_files]
+        results = []
+        with ProcessPoolExecutor(max_workers=jobs or os.cpu_count(), initializer=_init_worker) as pool:
+            for done, result in enumerate(pool.map(_extract_one, jobs_list, chunksize=4), 1):
+                results.append(result)
+                if done % 100 == 0:
+                    print(f"  📊 {done}/{len(image_files)}")
+        elapsed = time.perf_counter() - started
+
+        chosen = {}
+        for name, method, confidence, _ in results:
+            if method is None:
+                print(f"  ❌ 画像が読み込めません: {name}")
+            else:
+                chosen[method] = chosen.get(method, 0) + 1
+        print("🏆 採用された手法: " + "、".join(f"{method} {count}枚" for method, count in sorted(chosen.items())))
+        print(f"✅ 完了: {len(results)} 枚 / {elapsed:.1f}秒（{len(results) / elapsed:.1f} 枚/秒）")
+        return results
+
+
+def _init_worker():
+    # プロセス単位で並列化するので、OpenCV 内部のスレッドは使わない
+    cv2.setNumThreads(1)
+
+
+def _extract_one(job):
+    """1枚を自動抽出（ワーカープロセスで実行）。(ファイル名, 採用した手法, 信頼度, 保存先)"""
+    image_path, output_dir, save_all = job
+    extractor = PokemonExtractor(output_dir, verbose=False)
+    image = cv2.imread(str(image_path))   # デコードは1回だけ
+    if image is None:
+        return image_path.name, None, 0.0, None
+    candidates = extractor._auto_candidates(image, image_path)
+    saved = extractor._save_candidates(candidates, image_path.stem, save_all)
+    method, confidence, output_path = max(saved, key=lambda s: s[1])
+    return image_path.name, method, confidence, str(output_path)
+
+
 def main():
+    ap = argparse.ArgumentParser(description='ポケモンZA 図鑑画面からポケモン画像を抽出')
+    ap.add_argument('--batch', metavar='DIR', help='フォルダ内の画像をまとめて自動抽出（省略時は対話モード）')
+    ap.add_argument('--output', default='extracted_pokemon', help='出力フォルダ（既定: extracted_pokemon）')
+    ap.add_argument('--jobs', type=int, default=None, help='並列プロセス数（既定: CPU コア数）')
+    ap.add_argument('--save-all', action='store_true', help='信頼度で選ばず3手法すべての結果を保存')
+    args = ap.parse_args()
+
+    if args.batch:
+        if not Path(args.batch).is_dir():
+            ap.error(f"フォルダが存在しません: {args.batch}")
+        PokemonExtractor(args.output).extract_batch(args.batch, args.jobs, args.save_all)
+        return
+
+    interactive(args.output)
+
+
+def interactive(output_dir="extracted_pokemon"):
     print("🎀✨ ポケモンZA 画像抽出ツール ✨🎀")
     print("="*50)
     
-    extractor = PokemonExtractor()
+    extractor = PokemonExtractor(output_dir)
     
     # 現在のディレクトリから画像ファイルを検索
-    image_extensions = ['.png', '.jpg', '.jpeg', '.bmp']
+    image_extensions = IMAGE_EXTENSIONS
     current_dir = Path('.')
     image_files = []
     
@@ -233,7 +401,7 @@ def main():
     
     # 抽出方法選択
     print("\n🔧 抽出方法を選択してください:")
-    print("1. 自動抽出（全手法を試行）")
+    print("1. 自動抽出（全手法を試行し、信頼度の最も高い結果を保存）")
     print("2. 色範囲指定")
     print("3. エッジ検出")
     print("4. 固定領域")
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+種族値カラム形式バイナリ生成スクリプト
+全ポケモンの種族値・タイプ・世代・高さ・重さを列ごとの配列にまとめ、
+ギャラリーが TypedArray としてそのまま読める data/bundle/stats.bin を出力します
+
+ファイル形式（リトルエンディアン）:
+  [0:4]   マジック b'PKST'
+  [4:8]   uint32 ヘッダー長 H
+  [8:8+H] ヘッダー JSON（UTF-8、8バイト境界までスペース詰め）
+  以降    各列の配列（先頭オフセットは8バイト境界）
+
+ヘッダー例:
+  {"version": 1, "count": 1025, "columns": [{"name": "hp", "dtype": "uint16", "offset": 512}, ...],
+   "types": ["normal", "fire", ...], "type_none": 255}
+
+列:
+- id / hp / attack / defense / special_attack / special_defense / speed / total : uint16
+- type1 / type2 : uint8（types の添字、単タイプの type2 は type_none）
+- generation    : uint8
+- height        : uint16 固定小数点（scale=10 → 0.1m 単位）
+- weight        : uint16 固定小数点（scale=10 → 0.1kg 単位）
+
+使用方法:
+python tools/data_processors/stats_columnar_builder.py
+"""
+
+import json
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+DATA_DIR = ROOT / 'data'
+OUT = DATA_DIR / 'bundle' / 'stats.bin'
+
+MAGIC = b'PKST'
+FORMAT_VERSION = 1
+ALIGN = 8
+
+# タイプID（添字）。type_chart.html の並びと同じ
+TYPE_ORDER = [
+    'normal', 'fire', 'water', 'electric', 'grass', 'ice',
+    'fighting', 'poison', 'ground', 'flying', 'psychic', 'bug',
+    'rock', 'ghost', 'dragon', 'dark', 'steel', 'fairy'
+]
+TYPE_NONE = 255
+
+STAT_KEYS = ['hp', 'attack', 'defense', 'special_attack', 'special_defense', 'speed']
+
+# (列名, array typecode, dtype名, scale)
+COLUMNS = [
+    ('id', 'H', 'uint16', None),
+    *[(key, 'H', 'uint16', None) for key in STAT_KEYS],
+    ('total', 'H', 'uint16', None),
+    ('type1', 'B', 'uint8', None),
+    ('type2', 'B', 'uint8', None),
+    ('generation', 'B', 'uint8', None),
+    ('height', 'H', 'uint16', 10),
+    ('weight', 'H', 'uint16', 10),
+]
+
+
+def load_all_pokemon():
+    """gen1-9 の JSON を全国図鑑番号順に並べて返す"""
+    all_pokemon = {}
+    for gen in range(1, 10):
+        path = DATA_DIR / f'gen{gen}_pokemon.json'
+        if path.exists():
+            all_pokemon.update(json.loads(path.read_text(encoding='utf-8')))
+    return [all_pokemon[k] for k in sorted(all_pokemon, key=int)]
+
+
+def to_fixed(value, scale):
+    return int(round((value or 0) * scale))
+
+
+def build_columns(pokemon_list):
+    """列名 -> array の dict を作成"""
+    columns = {name: array(code) for name, code, _, _ in COLUMNS}
+    type_index = {t: i for i, t in enumerate(TYPE_ORDER)}
+
+    for p in pokemon_list:
+        stats = p.get('stats') or {}
+        values = [stats.get(key, 0) for key in STAT_KEYS]
+        types = p.get('types_en') or []
+
+        columns['id'].append(p['id'])
+        for key, value in zip(STAT_KEYS, values):
+            columns[key].append(value)
+        columns['total'].append(sum(values))
+        columns['type1'].append(type_index.get(types[0], TYPE_NONE) if len(types) > 0 else TYPE_NONE)
+        columns['type2'].append(type_index.get(types[1], TYPE_NONE) if len(types) > 1 else TYPE_NONE)
+        columns['generation'].append(p.get('generation') or 0)
+        columns['height'].append(to_fixed(p.get('height'), 10))
+        columns['weight'].append(to_fixed(p.get('weight'), 10))
+    return columns
+
+
+def align(n):
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+
+def encode(columns, count):
+    """ヘッダー + 列配列をバイト列にする"""
+    # ヘッダー長はオフセットに依存するため、仮のオフセットで長さを決めてから確定させる
+    def header_bytes(offsets):
+        header = {
+            'version': FORMAT_VERSION,
+            'count': count,
+            'endianness': 'little',
+            'columns': [
+                {'name': name, 'dtype': dtype, 'offset': offsets[name], **({'scale': scale} if scale else {})}
+                for name, _, dtype, scale in COLUMNS
+            ],
+            'types': TYPE_ORDER,
+            'type_none': TYPE_NONE,
+        }
+        return json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    offsets = {name: 0 for name, _, _, _ in COLUMNS}
+    for _ in range(10):
+        raw_header = header_bytes(offsets)
+        data_start = align(8 + len(raw_header))
+        position = data_start
+        new_offsets = {}
+        for name, _, _, _ in COLUMNS:
+            new_offsets[name] = position
+            position = align(position + columns[name].itemsize * count)
+        if new_offsets == offsets:
+            break
+        offsets = new_offsets
+    else:
+        raise ValueError('ヘッダーのオフセットが確定しませんでした')
+
+    raw_header = header_bytes(offsets)
+    padded_header = raw_header + b' ' * (data_start - 8 - len(raw_header))
+    out = bytearray(MAGIC + struct.pack('<I', len(padded_header)) + padded_header)
+    for name, _, _, _ in COLUMNS:
+        col = columns[name]
+        if sys.byteorder != 'little':
+            col = array(col.typecode, col)
+            col.byteswap()
+        assert len(out) == offsets[name]
+        out += col.tobytes()
+        out += b'\0' * (align(len(out)) - len(out))
+    return bytes(out)
+
+
+def decode(data):
+    """stats.bin を読み戻す（検証用）-> (header, {列名: array})"""
+    if data[:4] != MAGIC:
+        raise ValueError('stats.bin ではありません')
+    header_len = struct.unpack('<I', data[4:8])[0]
+    header = json.loads(data[8:8 + header_len])
+    count = header['count']
+    codes = {'uint8': 'B', 'uint16': 'H'}
+    columns = {}
+    for col in header['columns']:
+        arr = array(codes[col['dtype']])
+        arr.frombytes(data[col['offset']:col['offset'] + arr.itemsize * count])
+        if sys.byteorder != 'little':
+            arr.byteswap()
+        columns[col['name']] = arr
+    return header, columns
+
+
+def main():
+    print("📊 種族値カラムバイナリを生成中...")
+    pokemon_list = load_all_pokemon()
+    columns = build_columns(pokemon_list)
+    data = encode(columns, len(pokemon_list))
+
+    # 読み戻して一致を確認
+    _, decoded = decode(data)
+    for name, _, _, _ in COLUMNS:
+        if list(decoded[name]) != list(columns[name]):
+            raise ValueError(f'列 {name} の読み戻しが一致しません')
+
+    OUT.parent.mkdir(parents=True, exist_ok=True)
+    if not OUT.exists() or OUT.read_bytes() != data:
+        OUT.write_bytes(data)
+    print(f"  {len(pokemon_list)} 匹 × {len(COLUMNS)} 列 -> {OUT.relative_to(ROOT)} ({len(data):,} bytes)")
+    print("✅ 生成完了！")
+
+
+if __name__ == "__main__":
+    main()
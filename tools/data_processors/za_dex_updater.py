@@ -7,8 +7,14 @@
 
 import json
 import os
+import sys
+from pathlib import Path
 from typing import Dict, Any
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from json_store import JsonStore  # noqa: E402
+
 class ZADexUpdater:
     def __init__(self):
         self.generation_files = [
@@ -73,30 +79,28 @@ class ZADexUpdater:
                 print(f"バックアップ作成: {backup_file}")
             
             # データ読み込み
-            with open(gen_file, 'r', encoding='utf-8') as f:
-                pokemon_data = json.load(f)
+            store = JsonStore(gen_file)
             
             updated_count = 0
-            for pokemon_id, data in pokemon_data.items():
+            for pokemon_id, data in list(store.items()):
                 pid = int(pokemon_id)
                 
                 # game_dex_numbersが存在しない場合は作成
-                if 'game_dex_numbers' not in data:
-                    data['game_dex_numbers'] = {}
+                game_dex = dict(data.get('game_dex_numbers', {}))
                 
                 # ZA図鑑番号を設定
                 if pid in za_mapping:
-                    data['game_dex_numbers']['za'] = za_mapping[pid]
+                    game_dex['za'] = za_mapping[pid]
                     updated_count += 1
                 else:
                     # XYに登場しないポケモンはnull
-                    data['game_dex_numbers']['za'] = None
+                    game_dex['za'] = None
+                store.patch(pokemon_id, {'game_dex_numbers': game_dex})
             
-            # ファイル保存
-            with open(gen_file, 'w', encoding='utf-8') as f:
-                json.dump(pokemon_data, f, ensure_ascii=False, indent=2)
+            # ファイル保存（一時ファイル経由・内容が同じなら書かない）
+            written = store.commit()
             
-            print(f"{gen_file}: {updated_count}匹更新")
+            print(f"{gen_file}: {updated_count}匹更新" + ("" if written else "（ファイルは変更なし）"))
             total_updated += updated_count
         
         return total_updated
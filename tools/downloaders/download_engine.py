@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+画像ダウンロードエンジン
+- image_manifest.json（フォルム → 候補URL → 保存先）に書かれた画像をまとめて取得
+- ワーカースレッドで並列取得し、ホストごとにトークンバケットでレート制限
+- スレッドごとの Session で接続を使い回し、429/5xx・通信エラーは指数バックオフで再試行
+- 404 などは待たずに次の候補URLへ
+- 既にある画像はスキップ（--force で取り直し）。途中のファイルは .part に書いてから置き換えるので、
+  中断しても壊れた画像は残らず、再実行で続きから取得できます
+- 成功した候補URLを .cache/download_state.json に記録し、次回はそのURLから試す
+
+使い方:
+  python tools/downloaders/download_engine.py --list
+  python tools/downloaders/download_engine.py                     # マニフェスト全体（未取得分のみ）
+  python tools/downloaders/download_engine.py alola galar         # グループ指定
+  python tools/downloaders/download_engine.py hisui --force --workers 4 --host-rate 2
+  python tools/downloaders/download_engine.py --dry-run
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from net_utils import DEFAULT_CACHE_DIR, RETRY_STATUS, TokenBucket  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_MANIFEST = Path(__file__).resolve().parent / 'image_manifest.json'
+STATE_FILE = DEFAULT_CACHE_DIR / 'download_state.json'
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+# 画像として受け入れる先頭バイト（エラーページを画像として保存しないため）
+IMAGE_SIGNATURES = (b'\x89PNG\r\n\x1a\n', b'\xff\xd8\xff', b'GIF87a', b'GIF89a', b'RIFF')
+
+VARIANT_FIELDS = {
+    'normal': {'variant': 'normal', 'shiny': '', 'shiny_dir': ''},
+    'shiny': {'variant': 'shiny', 'shiny': '_shiny', 'shiny_dir': 'shiny/'},
+}
+
+
+class DownloadJob:
+    """保存先1つ分の取得ジョブ（候補URLを順に試す）"""
+
+    def __init__(self, group, label, target, candidates):
+        self.group = group
+        self.label = label
+        self.target = target
+        self.candidates = candidates
+
+    def relpath(self):
+        try:
+            return str(self.target.relative_to(ROOT)).replace(os.sep, '/')
+        except ValueError:
+            return str(self.target)
+
+
+def load_manifest(path=DEFAULT_MANIFEST):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def expand_jobs(manifest, groups=None, root=ROOT):
+    """マニフェストを DownloadJob のリストに展開（保存先の重複はエラー）"""
+    known = [g['name'] for g in manifest['groups']]
+    for name in groups or []:
+        if name not in known:
+            raise SystemExit(f"❌ 不明なグループ: {name}（--list で一覧表示）")
+
+    jobs = []
+    seen = {}
+    for group in manifest['groups']:
+        if groups and group['name'] not in groups:
+            continue
+        variants = group.get('variants', manifest.get('variants', ['normal']))
+        for entry in group['entries']:
+            for variant in entry.get('variants', variants):
+                fields = {**entry, **VARIANT_FIELDS[variant]}
+                directory = entry.get('dir', group.get('dir'))
+                filename = entry.get('file', group.get('file')).format(**fields)
+                urls = [u.format(**fields) for u in entry.get('urls', group.get('urls', []))]
+                target = root / directory / filename
+                if target in seen:
+                    raise ValueError(f"保存先が重複しています: {target}（{seen[target]} と {group['name']}）")
+                seen[target] = group['name']
+                jobs.append(DownloadJob(group['name'], f"{entry['name']} ({variant})", target, urls))
+    return jobs
+
+
+def load_state():
+    try:
+        return json.loads(STATE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state):
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = STATE_FILE.with_suffix('.tmp')
+    tmp.write_text(json.dumps(state, ensure_ascii=False, indent=1, sort_keys=True), encoding='utf-8')
+    os.replace(tmp, STATE_FILE)
+
+
+class DownloadEngine:
+    """並列・ホスト別レート制限・リトライ付きの画像ダウンローダー
+
+    workers   : 同時に処理するジョブ数
+    host_rate : ホストごとの1秒あたり最大リクエスト数
+    """
+
+    def __init__(self, workers=8, host_rate=4.0, retries=3, backoff=1.0, timeout=30, force=False):
+        self.workers = max(1, workers)
+        self.host_rate = host_rate
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.force = force
+        self.limiters = {}
+        self.limiters_lock = threading.Lock()
+        self.local = threading.local()
+        self.state = load_state()
+        self.state_lock = threading.Lock()
+        self.stats_lock = threading.Lock()
+        self.stats = {'downloaded': 0, 'skipped': 0, 'failed': 0, 'requests': 0, 'bytes': 0}
+
+    def session(self):
+        session = getattr(self.local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(HEADERS)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.workers)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self.local.session = session
+        return session
+
+    def limiter(self, url):
+        host = urlparse(url).netloc
+        with self.limiters_lock:
+            if host not in self.limiters:
+                self.limiters[host] = TokenBucket(self.host_rate, burst=max(1, min(self.workers, self.host_rate)))
+            return self.limiters[host]
+
+    def count(self, key, amount=1):
+        with self.stats_lock:
+            self.stats[key] += amount
+
+    def fetch(self, url):
+        """画像のバイト列を返す。見つからない（4xx・画像でない）なら None、通信失敗はリトライ後に例外"""
+        for attempt in range(self.retries + 1):
+            self.limiter(url).acquire()
+            self.count('requests')
+            try:
+                response = self.session().get(url, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.retries:
+                    raise
+                time.sleep(self.backoff * 2 ** attempt)
+                continue
+
+            if response.status_code in RETRY_STATUS and attempt < self.retries:
+                retry_after = response.headers.get('Retry-After', '')
+                time.sleep(float(retry_after) if retry_after.isdigit() else self.backoff * 2 ** attempt)
+                continue
+            if response.status_code != 200:
+                return None
+            content = response.content
+            return content if content.startswith(IMAGE_SIGNATURES) else None
+        return None
+
+    def ordered_candidates(self, job):
+        """前回成功したURLを先頭にした候補リスト"""
+        known = self.state.get(job.relpath())
+        if known in job.candidates:
+            return [known] + [u for u in job.candidates if u != known]
+        return job.candidates
+
+    def run_job(self, job):
+        if not self.force and job.target.exists() and job.target.stat().st_size > 0:
+            self.count('skipped')
+            return 'skipped', None
+
+        for url in self.ordered_candidates(job):
+            try:
+                content = self.fetch(url)
+            except requests.RequestException as e:
+                print(f"⚠️ 通信エラー: {url} ({e})")
+                continue
+            if content is None:
+                continue
+            job.target.parent.mkdir(parents=True, exist_ok=True)
+            part = job.target.with_name(job.target.name + '.part')
+            part.write_bytes(content)
+            os.replace(part, job.target)
+            with self.state_lock:
+                self.state[job.relpath()] = url
+            self.count('downloaded')
+            self.count('bytes', len(content))
+            return 'downloaded', url
+
+        self.count('failed')
+        return 'failed', None
+
+    def run(self, jobs):
+        started = time.perf_counter()
+        failed = []
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self.run_job, job): job for job in jobs}
+            for future in as_completed(futures):
+                job = futures[future]
+                status, url = future.result()
+                if status == 'downloaded':
+                    print(f"✅ {job.relpath()} ← {url}")
+                elif status == 'failed':
+                    print(f"❌ {job.relpath()}: 候補URL {len(job.candidates)} 件すべて失敗")
+                    failed.append(job)
+        save_state(self.state)
+        return failed, time.perf_counter() - started
+
+
+def main():
+    ap = argparse.ArgumentParser(description='マニフェストに基づく画像の並列ダウンロード')
+    ap.add_argument('groups', nargs='*', help='対象グループ（省略時は全て）')
+    ap.add_argument('--manifest', type=Path, default=DEFAULT_MANIFEST, help='画像マニフェストJSON')
+    ap.add_argument('--workers', type=int, default=8, help='同時ダウンロード数')
+    ap.add_argument('--host-rate', type=float, default=4.0, help='ホストごとの1秒あたり最大リクエスト数')
+    ap.add_argument('--retries', type=int, default=3, help='429/5xx・通信エラー時の再試行回数')
+    ap.add_argument('--force', action='store_true', help='既存の画像も取り直す')
+    ap.add_argument('--dry-run', action='store_true', help='取得対象を表示するだけ')
+    ap.add_argument('--list', action='store_true', help='グループ一覧を表示')
+    args = ap.parse_args()
+
+    manifest = load_manifest(args.manifest)
+    if args.list:
+        for group in manifest['groups']:
+            print(f"  {group['name']:<12} {len(group['entries']):>3} 件  {group.get('description', '')}")
+        return
+
+    jobs = expand_jobs(manifest, args.groups)
+    pending = [j for j in jobs if args.force or not (j.target.exists() and j.target.stat().st_size > 0)]
+    print(f"🔄 画像ダウンロード: {len(jobs)} 件中 {len(pending)} 件が対象 "
+          f"({args.workers} 並列 / ホストごと {args.host_rate:g} req/s)")
+    if args.dry_run:
+        for job in pending:
+            print(f"  {job.relpath()}  ({len(job.candidates)} 候補)")
+        return
+
+    engine = DownloadEngine(workers=args.workers, host_rate=args.host_rate, retries=args.retries, force=args.force)
+    failed, elapsed = engine.run(pending)
+    s = engine.stats
+    print("=" * 80)
+    print(f"🎉 完了！ 成功: {s['downloaded']}, 失敗: {s['failed']} "
+          f"({s['requests']} リクエスト / {s['bytes'] / 1024:,.0f} KB / {elapsed:.1f}秒)")
+    if failed:
+        print("\n⚠️ 失敗したファイルは image_manifest.json の候補URLを見直してください:")
+        for job in failed:
+            print(f"  - {job.relpath()}")
+
+
+if __name__ == '__main__':
+    main()
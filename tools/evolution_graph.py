@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PokeAkane 進化グラフモジュール
+- gen*_pokemon.json の evolution {prev, next} を1本の有向グラフにまとめ、進化系統（連結成分）ごとに
+  トポロジカル順（進化前 → 進化後、同じ深さは全国No.順）の配列へ並べ直す
+- prev と next のどちらか片方にしか書かれていない進化も辺として採用し、食い違いは --check で報告
+- 分岐進化（イーブイ・バルキー・ケムッソなど）も木のまま保持するので、
+  「系統全体」「進化段階での絞り込み」「最終進化だけ」が表引き・系統内の走査だけで済む
+- data/bundle/evolution_index.json に書き出し、ギャラリーの進化段階フィルターと詳細パネルが使う
+
+evolution_index.json:
+  {"version": 1,
+   "order": [133, 134, ...],        # 全国No.（系統ごとに連続、系統内はトポロジカル順）
+   "family_start": [0, 3, ...],     # 系統 f = order[family_start[f]:family_start[f+1]]（末尾に len(order)）
+   "parent": [-1, 0, ...],          # order 上の位置 → 進化前の位置（-1 は系統の根）
+   "depth": [0, 1, ...],            # 進化の段数（根が 0）
+   "child_start": [...],            # 位置 i の進化先 = children[child_start[i]:child_start[i+1]]
+   "children": [...],               # 進化先の位置（CSR 形式の隣接配列）
+   "stages": {"basic": [...], "middle": [...], "final": [...]}}  # 進化段階 → 全国No.（昇順）
+  進化段階はギャラリーの従来の判定と同じ（basic: 進化前のみ / middle: 中間 / final: 進化先なし、無進化を含む）
+
+使用例:
+  sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # tools/ を import パスに追加
+  import evolution_graph
+  graph = evolution_graph.EvolutionGraph.load()
+  graph.family(134)         # [133, 134, 135, 136, 196, 197, 470, 471, 700]
+  graph.finals(265)         # [267, 269]
+
+使い方:
+  python tools/evolution_graph.py                 # data/bundle/evolution_index.json を生成
+  python tools/evolution_graph.py --check         # 生成済みのファイルが最新か・prev/next の食い違いを確認
+  python tools/evolution_graph.py --show 133 265  # 指定したポケモンの進化系統を表示
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from json_store import write_text_atomic
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_DIR = ROOT / 'data'
+OUTPUT = DATA_DIR / 'bundle' / 'evolution_index.json'
+FORMAT_VERSION = 1
+
+STAGES = ('basic', 'middle', 'final')
+
+
+def load_records(data_dir=DATA_DIR):
+    """全国No. → gen*_pokemon.json のレコード"""
+    records = {}
+    for gen in range(1, 10):
+        path = data_dir / f'gen{gen}_pokemon.json'
+        if not path.exists():
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            for pokemon_id, info in json.load(f).items():
+                records[int(pokemon_id)] = info
+    return dict(sorted(records.items()))
+
+
+def evolution_edges(records):
+    """(進化前, 進化後) の集合と、prev / next が食い違っている箇所のリスト
+
+    prev・next のどちらかにあれば辺とし、図鑑データに無い番号を指す辺は捨てる
+    """
+    edges = set()
+    issues = []
+    for pid, info in records.items():
+        evolution = info.get('evolution') or {}
+        prev = evolution.get('prev')
+        if prev not in (None, ''):
+            edges.add((int(prev), pid))
+        for child in evolution.get('next') or []:
+            edges.add((pid, int(child)))
+
+    for parent, child in sorted(edges):
+        if parent not in records or child not in records:
+            issues.append(f"#{parent} → #{child}: 図鑑データに無い番号")
+            continue
+        if int(records[child].get('evolution', {}).get('prev') or 0) != parent:
+            issues.append(f"#{child} の prev に #{parent} がない")
+        if child not in [int(c) for c in (records[parent].get('evolution') or {}).get('next') or []]:
+            issues.append(f"#{parent} の next に #{child} がない")
+    edges = {(p, c) for p, c in edges if p in records and c in records}
+
+    parents = {}
+    for parent, child in sorted(edges):
+        if child in parents:
+            issues.append(f"#{child} の進化前が複数（#{parents[child]}, #{parent}）: #{parent} からの辺を無視")
+            continue
+        parents[child] = parent
+    return {(p, c) for c, p in parents.items()}, issues
+
+
+class EvolutionGraph:
+    """進化系統ごとに連続させた隣接配列（位置 = order 上の添字）"""
+
+    def __init__(self, ids, edges):
+        children_of = {pid: [] for pid in ids}
+        has_parent = set()
+        for parent, child in edges:
+            children_of[parent].append(child)
+            has_parent.add(child)
+        for kids in children_of.values():
+            kids.sort()
+
+        # 根（進化前のないポケモン）ごとに幅優先でたどる → 系統内はトポロジカル順、同じ深さは全国No.順
+        self.order = []
+        self.family_start = []
+        self.parent = []
+        self.depth = []
+        self.position = {}
+        for root in sorted(ids):
+            if root in has_parent:
+                continue
+            self.family_start.append(len(self.order))
+            queue = [(root, -1, 0)]
+            for pid, parent, depth in queue:
+                self.position[pid] = len(self.order)
+                self.order.append(pid)
+                self.parent.append(parent)
+                self.depth.append(depth)
+                queue.extend((child, self.position[pid], depth + 1) for child in children_of[pid])
+        self.family_start.append(len(self.order))
+        if len(self.order) != len(ids):
+            # 根にたどり着かない（循環している）ポケモンは単独の系統として扱う
+            for pid in sorted(set(ids) - self.position.keys()):
+                self.position[pid] = len(self.order)
+                self.order.append(pid)
+                self.parent.append(-1)
+                self.depth.append(0)
+                self.family_start.append(len(self.order))
+
+        self.child_start = [0]
+        self.children = []
+        for pid in self.order:
+            self.children.extend(self.position[child] for child in children_of[pid] if child in self.position)
+            self.child_start.append(len(self.children))
+
+        # 位置 → 系統番号
+        self.family_of = [0] * len(self.order)
+        for family in range(len(self.family_start) - 1):
+            for i in range(self.family_start[family], self.family_start[family + 1]):
+                self.family_of[i] = family
+
+    @classmethod
+    def from_records(cls, records):
+        edges, _ = evolution_edges(records)
+        return cls(list(records), edges)
+
+    @classmethod
+    def load(cls, data_dir=DATA_DIR):
+        return cls.from_records(load_records(data_dir))
+
+    def __contains__(self, pid):
+        return pid in self.position
+
+    def family_slice(self, pid):
+        family = self.family_of[self.position[pid]]
+        return range(self.family_start[family], self.family_start[family + 1])
+
+    def family(self, pid):
+        """同じ進化系統の全国No.（トポロジカル順）"""
+        return [self.order[i] for i in self.family_slice(pid)]
+
+    def next_ids(self, pid):
+        i = self.position[pid]
+        return [self.order[c] for c in self.children[self.child_start[i]:self.child_start[i + 1]]]
+
+    def prev_id(self, pid):
+        parent = self.parent[self.position[pid]]
+        return None if parent < 0 else self.order[parent]
+
+    def is_final(self, i):
+        return self.child_start[i] == self.child_start[i + 1]
+
+    def finals(self, pid):
+        """同じ進化系統の最終進化（進化先のないポケモン）"""
+        return [self.order[i] for i in self.family_slice(pid) if self.is_final(i)]
+
+    def stage(self, pid):
+        """進化段階（ギャラリーの判定と同じ。無進化は final）"""
+        i = self.position[pid]
+        if self.is_final(i):
+            return 'final'
+        return 'basic' if self.parent[i] < 0 else 'middle'
+
+    def stage_sets(self):
+        """進化段階 → 全国No. の集合"""
+        sets = {stage: set() for stage in STAGES}
+        for pid in self.order:
+            sets[self.stage(pid)].add(pid)
+        return sets
+
+    def to_index(self):
+        return {
+            'version': FORMAT_VERSION,
+            'order': self.order,
+            'family_start': self.family_start,
+            'parent': self.parent,
+            'depth': self.depth,
+            'child_start': self.child_start,
+            'children': self.children,
+            'stages': {stage: sorted(ids) for stage, ids in self.stage_sets().items()},
+        }
+
+
+def render(index):
+    return json.dumps(index, ensure_ascii=False, separators=(',', ':'))
+
+
+def write_index():
+    graph = EvolutionGraph.load()
+    changed = write_text_atomic(OUTPUT, render(graph.to_index()))
+    branching = sum(1 for i in range(len(graph.order)) if graph.child_start[i + 1] - graph.child_start[i] > 1)
+    print(f"🌱 進化グラフ: {len(graph.family_start) - 1} 系統 / {len(graph.order)} 匹（分岐 {branching} 箇所）"
+          f" → {OUTPUT.relative_to(ROOT).as_posix()}{'' if changed else '（変更なし）'}")
+    return graph
+
+
+def main():
+    ap = argparse.ArgumentParser(description='進化グラフ（系統・進化段階の索引）の生成')
+    ap.add_argument('--check', action='store_true', help='生成済みのファイルが最新か・prev/next の食い違いを確認するだけ')
+    ap.add_argument('--show', nargs='+', type=int, metavar='ID', help='指定したポケモンの進化系統を表示')
+    args = ap.parse_args()
+
+    if args.show:
+        records = load_records()
+        graph = EvolutionGraph.from_records(records)
+        for pokemon_id in args.show:
+            if pokemon_id not in graph:
+                print(f"  #{pokemon_id}: 見つかりません")
+                continue
+            print(f"  #{pokemon_id} {records[pokemon_id].get('name', '')}（{graph.stage(pokemon_id)}）")
+            finals = set(graph.finals(pokemon_id))
+            for member in graph.family(pokemon_id):
+                depth = graph.depth[graph.position[member]]
+                mark = ' ★' if member in finals else ''
+                print(f"    {'  ' * depth}#{member} {records[member].get('name', '')}{mark}")
+        return
+
+    if args.check:
+        records = load_records()
+        _, issues = evolution_edges(records)
+        for issue in issues:
+            print(f"  ⚠️ {issue}")
+        current = OUTPUT.read_text(encoding='utf-8') if OUTPUT.exists() else None
+        if current != render(EvolutionGraph.from_records(records).to_index()):
+            print(f"❌ {OUTPUT.relative_to(ROOT).as_posix()} が図鑑データと一致しません（再生成してください）")
+            sys.exit(1)
+        print("✅ 進化グラフは最新です")
+        return
+
+    write_index()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PokeAkane データファイル（JSON）の保存レイヤー
+- 出力形式は既存ファイルと同じ（ensure_ascii=False, indent=2, 末尾改行なし）
+- 一時ファイルに書いて fsync してから os.replace するので、途中で落ちても壊れたファイルは残らない
+- 内容が同じならファイルを書き換えない（更新時刻も変わらないので build.py の差分判定に引っかからない）
+- JsonStore はポケモン1匹（トップレベルのキー1つ）単位で変更を受け付け、
+    checkpoint() : 変更分だけを <ファイル名>.journal に追記（バッチ保存のコストは変更件数に比例）
+    commit()     : ファイル全体を1回だけ書き出し、ジャーナルを削除
+  中断した場合は次回開いたときにジャーナルを読み戻して続きから再開できる
+
+使用例:
+  sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # tools/ を import パスに追加
+  from json_store import JsonStore
+  with JsonStore('gen1_pokemon.json') as store:
+      store.patch('25', {'game_dex_numbers': {**store.get('25')['game_dex_numbers'], 'za': 29}})
+"""
+
+import json
+import os
+from pathlib import Path
+
+JOURNAL_SUFFIX = '.journal'
+
+
+def encode(data):
+    """既存データファイルと同じ形式の JSON 文字列"""
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def encode_entry(key, value):
+    """トップレベルの1項目（'  "25": {...}'）を encode() と同じインデントで文字列化"""
+    body = encode(value).replace('\n', '\n  ')
+    return f'  {json.dumps(key, ensure_ascii=False)}: {body}'
+
+
+def write_text_atomic(path, text):
+    """内容が変わるときだけ一時ファイル経由で置き換える。書き換えたら True"""
+    path = Path(path)
+    data = text.encode('utf-8')
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    return True
+
+
+def write_json(path, data):
+    """JSON を既存形式でアトミックに保存（変更がなければ書かない）。書き換えたら True"""
+    return write_text_atomic(path, encode(data))
+
+
+class JsonStore:
+    """{ポケモンID: データ} 形式の JSON ファイルをレコード単位で更新する
+
+    get() が返す dict は保存中のデータそのものなので直接書き換えず、patch() / put() を使うこと
+    """
+
+    def __init__(self, path, create=False):
+        self.path = Path(path)
+        self.journal = self.path.with_name(self.path.name + JOURNAL_SUFFIX)
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.records = json.load(f)
+        elif create:
+            self.records = {}
+        else:
+            raise FileNotFoundError(f'{self.path} が見つかりません')
+
+        self.chunks = {}        # キー → encode_entry() の結果（変更されたキーだけ作り直す）
+        self.dirty = set()      # 前回の checkpoint() 以降に変わったキー
+        self.changed = False    # 読み込み以降に何か変わったか
+        self.recovered = self.replay_journal()
+
+    # --- 読み出し ---
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, key):
+        return str(key) in self.records
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def get(self, key, default=None):
+        return self.records.get(str(key), default)
+
+    def items(self):
+        return self.records.items()
+
+    # --- 更新 ---
+
+    def put(self, key, record):
+        """レコードを丸ごと置き換える。値が変わったら True"""
+        key = str(key)
+        if key in self.records and self.records[key] == record:
+            return False
+        self.records[key] = record
+        self.chunks.pop(key, None)
+        self.dirty.add(key)
+        self.changed = True
+        return True
+
+    def patch(self, key, fields):
+        """レコードのトップレベルの項目を上書きする（他の項目はそのまま）。値が変わったら True"""
+        current = self.records.get(str(key), {})
+        if all(k in current and current[k] == v for k, v in fields.items()):
+            return False
+        return self.put(key, {**current, **fields})
+
+    # --- 保存 ---
+
+    def checkpoint(self):
+        """前回以降に変わったレコードだけをジャーナルに追記（中間保存用）"""
+        if not self.dirty:
+            return 0
+        with open(self.journal, 'a', encoding='utf-8') as f:
+            for key in sorted(self.dirty, key=lambda k: (len(k), k)):
+                f.write(json.dumps({'key': key, 'record': self.records[key]}, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        count = len(self.dirty)
+        self.dirty.clear()
+        return count
+
+    def render(self):
+        if not self.records:
+            return '{}'
+        parts = []
+        for key, value in self.records.items():
+            if key not in self.chunks:
+                self.chunks[key] = encode_entry(key, value)
+            parts.append(self.chunks[key])
+        return '{\n' + ',\n'.join(parts) + '\n}'
+
+    def commit(self):
+        """ファイル全体をアトミックに書き出してジャーナルを消す。ファイルを書き換えたら True"""
+        written = False
+        if self.changed or not self.path.exists():
+            written = write_text_atomic(self.path, self.render())
+        if self.journal.exists():
+            self.journal.unlink()
+        self.dirty.clear()
+        self.changed = False
+        return written
+
+    def replay_journal(self):
+        """前回中断したときのジャーナルを読み戻す（途中で切れた最後の行は捨てる）"""
+        if not self.journal.exists():
+            return set()
+        recovered = set()
+        with open(self.journal, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                self.records[entry['key']] = entry['record']
+                self.chunks.pop(entry['key'], None)
+                recovered.add(entry['key'])
+        if recovered:
+            self.changed = True
+            print(f"♻️ {self.journal.name}: 前回中断時の {len(recovered)} 件を復元しました")
+        return recovered
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # 例外時は書き出さず、それまでの変更をジャーナルに残して次回に再開できるようにする
+        if exc_type is None:
+            self.commit()
+        else:
+            self.checkpoint()
+        return False
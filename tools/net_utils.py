@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PokeAkane ネットワーク共通部品
+- TokenBucket   : スレッド間で共有するトークンバケット式レート制限
+- ResponseCache : URL をキーにした JSON レスポンスのディスクキャッシュ（ETag / Last-Modified 付き）
+- PageCache     : 同じく HTML などの生の本文を gzip 圧縮して保存するディスクキャッシュ
+- HttpClient    : 上のキャッシュと接続プール・リトライを組み合わせた取得クライアント
+                  （JSON は get_json、生の本文は get_bytes）
+
+キャッシュ済みの URL はネットワークに出ません。revalidate=True のときは
+ETag / Last-Modified で条件付き GET を送り、変更が無ければ 304 で本文を再取得しません。
+
+使用例:
+  client = HttpClient(rate=20, concurrency=8, cache=ResponseCache(DEFAULT_CACHE_DIR / 'pokeapi'))
+  data = client.get_json('https://pokeapi.co/api/v2/pokemon/1')
+
+  pages = HttpClient(rate=2, concurrency=4, cache=PageCache(DEFAULT_CACHE_DIR / 'yakkun'))
+  html = pages.get_bytes('https://yakkun.com/sv/zukan/n25')
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import requests
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CACHE_DIR = ROOT / '.cache'
+
+USER_AGENT = 'PokeAkane-tools/1.0'
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """1秒あたり rate 個のトークンを補充し、最大 burst 個まで貯めるレート制限"""
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """トークンが1つ取れるまで待つ（rate が 0 以下なら制限なし）"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class ResponseCache:
+    """URL → JSON 本文のディスクキャッシュ
+
+    1 URL = 1 ファイル（SHA-256 の先頭2文字でディレクトリ分割）。
+    書き込みは一時ファイル経由の置き換えなので、並列実行や中断でも壊れません。
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def path_for(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.directory / key[:2] / f'{key}.json'
+
+    def get(self, url):
+        path = self.path_for(url)
+        try:
+            entry = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        return entry if entry.get('url') == url else None
+
+    def put(self, url, body, headers=None):
+        headers = headers or {}
+        entry = {
+            'url': url,
+            'fetched_at': time.time(),
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'body': body,
+        }
+        path = self.path_for(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f'{path.name}.{threading.get_ident()}.tmp')
+        tmp.write_text(json.dumps(entry, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+        os.replace(tmp, path)
+        return entry
+
+    def touch(self, url, entry):
+        """304 で再検証できたエントリの取得時刻だけ更新"""
+        return self.put(url, entry['body'], {'ETag': entry.get('etag'), 'Last-Modified': entry.get('last_modified')})
+
+
+class PageCache(ResponseCache):
+    """URL → 生の本文（bytes）の gzip 圧縮ディスクキャッシュ
+
+    HTML は文字コードの判定をパーサーに任せるため、受け取ったバイト列をそのまま保存する。
+    1 URL = 1 ファイル（{sha256}.gz）。中身は「メタデータの JSON 1行 + 改行 + 本文」を gzip したもの。
+    """
+
+    def path_for(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.directory / key[:2] / f'{key}.gz'
+
+    def get(self, url):
+        path = self.path_for(url)
+        try:
+            meta, _, body = gzip.decompress(path.read_bytes()).partition(b'\n')
+            entry = json.loads(meta)
+        except (OSError, EOFError, ValueError):
+            return None
+        if entry.get('url') != url:
+            return None
+        entry['body'] = body
+        return entry
+
+    def put(self, url, body, headers=None):
+        headers = headers or {}
+        entry = {
+            'url': url,
+            'fetched_at': time.time(),
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+        }
+        meta = json.dumps(entry, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        path = self.path_for(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f'{path.name}.{threading.get_ident()}.tmp')
+        tmp.write_bytes(gzip.compress(meta + b'\n' + body, mtime=0))
+        os.replace(tmp, path)
+        return {**entry, 'body': body}
+
+
+class HttpClient:
+    """レート制限・同時接続数制限・ディスクキャッシュ付きの HTTP クライアント
+
+    rate        : 1秒あたりの最大リクエスト数（全スレッド合計、0 で無制限）
+    concurrency : 同時に飛ばす最大リクエスト数
+    cache       : get_json なら ResponseCache、get_bytes なら PageCache（None でキャッシュなし）
+    max_age     : キャッシュの有効秒数（None なら期限なし）
+    revalidate  : 期限切れ・強制時に条件付き GET で再検証する
+    user_agent  : User-Agent ヘッダー
+    """
+
+    def __init__(self, rate=5.0, concurrency=4, cache=None, max_age=None, revalidate=False,
+                 timeout=30, retries=3, backoff=1.0, user_agent=USER_AGENT):
+        self.limiter = TokenBucket(rate, burst=max(1, concurrency))
+        self.slots = threading.BoundedSemaphore(max(1, concurrency))
+        self.cache = cache
+        self.max_age = max_age
+        self.revalidate = revalidate
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.user_agent = user_agent
+        self.local = threading.local()
+        self.stats_lock = threading.Lock()
+        self.stats = {'requests': 0, 'cache_hits': 0, 'not_modified': 0, 'retries': 0}
+
+    def session(self):
+        """スレッドごとの requests.Session（keep-alive で接続を使い回す）"""
+        session = getattr(self.local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers['User-Agent'] = self.user_agent
+            self.local.session = session
+        return session
+
+    def count(self, key):
+        with self.stats_lock:
+            self.stats[key] += 1
+
+    def is_fresh(self, entry):
+        if self.revalidate:
+            return False
+        return self.max_age is None or time.time() - entry.get('fetched_at', 0) < self.max_age
+
+    def get_json(self, url):
+        """URL の JSON を返す。4xx は requests.HTTPError、通信失敗はリトライ後に例外"""
+        return self.fetch(url, lambda response: response.json())
+
+    def get_bytes(self, url):
+        """URL の本文をバイト列のまま返す（HTML など）。例外は get_json と同じ"""
+        return self.fetch(url, lambda response: response.content)
+
+    def fetch(self, url, decode):
+        entry = self.cache.get(url) if self.cache else None
+        if entry is not None and self.is_fresh(entry):
+            self.count('cache_hits')
+            return entry['body']
+
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = self.request(url, headers)
+        if response.status_code == 304 and entry is not None:
+            self.count('not_modified')
+            self.cache.touch(url, entry)
+            return entry['body']
+        response.raise_for_status()
+        body = decode(response)
+        if self.cache:
+            self.cache.put(url, body, response.headers)
+        return body
+
+    def request(self, url, headers):
+        for attempt in range(self.retries + 1):
+            self.limiter.acquire()
+            try:
+                with self.slots:
+                    self.count('requests')
+                    response = self.session().get(url, headers=headers, timeout=self.timeout)
+                if response.status_code not in RETRY_STATUS or attempt == self.retries:
+                    return response
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.retries:
+                    raise
+            self.count('retries')
+            time.sleep(self.backoff * 2 ** attempt)
+
+    def summary(self):
+        s = self.stats
+        return (f"通信 {s['requests']} 回 / キャッシュ {s['cache_hits']} 件 / "
+                f"304 {s['not_modified']} 件 / リトライ {s['retries']} 回")
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PokeAkane 図鑑データ共通モジュール
+- data/gen*_pokemon.json と data/pokedex_structures/*.json を1回だけ読み込み、O(1) の索引を提供
+    by_id   : 全国図鑑番号 → ポケモンデータ
+    by_slug : 英語スラッグ（mr-mime, farfetchd など）→ 全国図鑑番号
+    by_ja   : 正規化した日本語名（図鑑ごとの表記ゆれも含む）→ 全国図鑑番号
+    forms   : フォームキー（raichu-alola, tauros-combat など）→ {pokemon_id, form, path}
+- 索引は .cache/pokedex_core.pickle に保存し、元ファイルの更新時刻・サイズが変わるまで再利用
+
+使用例:
+  sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # tools/ を import パスに追加
+  import pokedex_core
+  pokedex = pokedex_core.load()
+  pokedex.id_by_slug('pikachu')        # 25
+  pokedex.id_by_name('ピカチュウ')      # 25（ひらがな・全角半角の違いも吸収）
+  pokedex.form('raichu-alola')         # {'pokemon_id': 26, 'form': 'alola', 'path': 'pokemon_images/forms/...'}
+
+動作確認:
+  python tools/pokedex_core.py ピカチュウ mr-mime 151 raichu-alola
+"""
+
+import json
+import os
+import pickle
+import re
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_DIR = ROOT / 'data'
+IMAGE_DIR = ROOT / 'pokemon_images'
+SNAPSHOT = ROOT / '.cache' / 'pokedex_core.pickle'
+SNAPSHOT_VERSION = 1
+
+# フォーム画像のフォルダ（normal / shinies は通常の姿なので含めない）
+FORM_IMAGE_DIRS = ('forms', 'patterns', 'mega_evolutions', 'gender_differences')
+FORM_FILE_PATTERN = re.compile(r'^(\d+)_(.+?)(_shiny)?\.png$')
+
+
+def normalize_ja(text):
+    """日本語名の正規化: NFKC + カタカナ→ひらがな + 空白除去（ＰＯＲＹＧＯＮ２ → porygon2 なども吸収）"""
+    n = unicodedata.normalize('NFKC', text or '').lower()
+    n = ''.join(chr(ord(c) - 0x60) if 'ァ' <= c <= 'ヶ' else c for c in n)
+    return re.sub(r'\s+', '', n)
+
+
+def normalize_slug(text):
+    """英語名をスラッグに: 'Mr. Mime' → 'mr-mime'、"Farfetch'd" → 'farfetchd'"""
+    n = unicodedata.normalize('NFKC', text or '').lower().strip()
+    n = re.sub(r"[.'’:]", '', n)
+    return re.sub(r'[\s_]+', '-', n)
+
+
+def form_key(text):
+    """フォームキーの正規化: 'tauros_combat' / 'Tauros-Combat' → 'tauros-combat'"""
+    return normalize_slug(text)
+
+
+class Pokedex:
+    """索引済みの図鑑データ（load() で取得）"""
+
+    def __init__(self, by_id, by_slug, by_ja, forms):
+        self.by_id = by_id
+        self.by_slug = by_slug
+        self.by_ja = by_ja
+        self.forms = forms
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __contains__(self, pokemon_id):
+        return int(pokemon_id) in self.by_id
+
+    def get(self, pokemon_id, default=None):
+        """全国図鑑番号（int / str）→ ポケモンデータ"""
+        try:
+            return self.by_id.get(int(pokemon_id), default)
+        except (TypeError, ValueError):
+            return default
+
+    def records(self):
+        """全国図鑑番号順のポケモンデータ"""
+        return [self.by_id[pid] for pid in sorted(self.by_id)]
+
+    def id_by_slug(self, name_en):
+        return self.by_slug.get(normalize_slug(name_en))
+
+    def id_by_name(self, name_ja):
+        return self.by_ja.get(normalize_ja(name_ja))
+
+    def japanese_name(self, name_en, default=None):
+        pid = self.id_by_slug(name_en)
+        return self.by_id[pid]['name'] if pid is not None else default
+
+    def form(self, key):
+        return self.forms.get(form_key(key))
+
+    def lookup(self, query):
+        """番号・英語スラッグ・日本語名のどれでも全国図鑑番号を返す（見つからなければ None）"""
+        text = str(query).strip()
+        if text.isdigit():
+            return int(text) if int(text) in self.by_id else None
+        pid = self.id_by_slug(text)
+        if pid is None:
+            pid = self.id_by_name(text)
+        if pid is None:
+            info = self.form(text)
+            pid = info['pokemon_id'] if info else None
+        return pid
+
+    def to_state(self):
+        return {'by_id': self.by_id, 'by_slug': self.by_slug, 'by_ja': self.by_ja, 'forms': self.forms}
+
+
+def source_files(data_dir):
+    files = [data_dir / f'gen{gen}_pokemon.json' for gen in range(1, 10)]
+    files += sorted((data_dir / 'pokedex_structures').glob('*.json'))
+    return [p for p in files if p.exists()]
+
+
+def signature(data_dir, image_dir):
+    """スナップショットの有効判定に使う (パス, mtime_ns, サイズ) の一覧
+
+    画像フォルダはフォルダ自体の更新時刻（ファイルの追加・削除で変わる）で判定
+    """
+    paths = source_files(data_dir) + [image_dir / d for d in FORM_IMAGE_DIRS if (image_dir / d).is_dir()]
+    sig = []
+    for p in paths:
+        st = p.stat()
+        sig.append((str(p), st.st_mtime_ns, st.st_size if p.is_file() else 0))
+    return sig
+
+
+def build(data_dir=DATA_DIR, image_dir=IMAGE_DIR):
+    """JSON と画像フォルダから索引を作る"""
+    by_id = {}
+    for gen in range(1, 10):
+        path = data_dir / f'gen{gen}_pokemon.json'
+        if not path.exists():
+            continue
+        for pid_str, info in json.loads(path.read_text(encoding='utf-8')).items():
+            by_id[int(pid_str)] = info
+
+    by_slug = {}
+    by_ja = {}
+    for pid in sorted(by_id):
+        info = by_id[pid]
+        if info.get('name_en'):
+            by_slug.setdefault(normalize_slug(info['name_en']), pid)
+        if info.get('name'):
+            by_ja.setdefault(normalize_ja(info['name']), pid)
+
+    # 図鑑ごとの表記ゆれ（ドリフロン など）も別名として登録（正式名を優先）
+    structures = sorted((data_dir / 'pokedex_structures').glob('*.json'), key=lambda p: (len(p.stem), p.stem))
+    for path in structures:
+        dex = json.loads(path.read_text(encoding='utf-8'))
+        for entry in dex.get('pokemon', {}).values():
+            pid = entry.get('pokemon_id')
+            if pid is None or int(pid) not in by_id:
+                continue
+            if entry.get('name'):
+                by_ja.setdefault(normalize_ja(entry['name']), int(pid))
+            if entry.get('name_en'):
+                by_slug.setdefault(normalize_slug(entry['name_en']), int(pid))
+
+    forms = {}
+    for folder in FORM_IMAGE_DIRS:
+        directory = image_dir / folder
+        if not directory.is_dir():
+            continue
+        for path in sorted(directory.iterdir()):
+            match = FORM_FILE_PATTERN.match(path.name)
+            if not match or match.group(3):
+                continue
+            pid = int(match.group(1))
+            key = form_key(match.group(2))
+            base = by_id.get(pid, {}).get('name_en')
+            form = key[len(base) + 1:] if base and key.startswith(base + '-') else key
+            forms.setdefault(key, {
+                'pokemon_id': pid,
+                'form': form,
+                'folder': folder,
+                'path': f'{image_dir.name}/{folder}/{path.name}',
+            })
+
+    return Pokedex(by_id, by_slug, by_ja, forms)
+
+
+def load_dex_entries(data_dir, by_id):
+    """図鑑ごとの登録内容。({図鑑ID: {id, key, name, count}}, {図鑑ID: [(図鑑番号, 全国図鑑番号), ...]})
+
+    図鑑番号順。全国図鑑番号が無い・データに無いエントリは除く
+    """
+    dexes = {}
+    entries = {}
+    for path in sorted((data_dir / 'pokedex_structures').glob('*.json'), key=lambda p: int(p.stem)):
+        dex = json.loads(path.read_text(encoding='utf-8'))
+        dexes[dex['id']] = {'id': dex['id'], 'key': dex['key'], 'name': dex['name']}
+        dex_entries = []
+        for number, entry in dex['pokemon'].items():
+            pid = entry.get('pokemon_id')
+            if pid is not None and int(pid) in by_id:
+                dex_entries.append((int(number), int(pid)))
+        dex_entries.sort()
+        entries[dex['id']] = dex_entries
+        dexes[dex['id']]['count'] = len(dex_entries)
+    return dexes, entries
+
+
+_loaded = {}
+
+
+def load(data_dir=DATA_DIR, image_dir=IMAGE_DIR, use_cache=True):
+    """索引済みの Pokedex を返す
+
+    同じプロセス内では1回だけ読み込み、既定のデータフォルダならスナップショット（pickle）を使う
+    """
+    data_dir = Path(data_dir).resolve()
+    image_dir = Path(image_dir).resolve()
+    key = (data_dir, image_dir)
+    if use_cache and key in _loaded:
+        return _loaded[key]
+
+    snapshot_enabled = use_cache and data_dir == DATA_DIR.resolve() and image_dir == IMAGE_DIR.resolve()
+    sig = signature(data_dir, image_dir)
+    pokedex = None
+    if snapshot_enabled and SNAPSHOT.exists():
+        try:
+            with open(SNAPSHOT, 'rb') as f:
+                saved = pickle.load(f)
+            if saved.get('version') == SNAPSHOT_VERSION and saved.get('signature') == sig:
+                pokedex = Pokedex(**saved['state'])
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError, KeyError):
+            pokedex = None
+
+    if pokedex is None:
+        pokedex = build(data_dir, image_dir)
+        if snapshot_enabled:
+            SNAPSHOT.parent.mkdir(parents=True, exist_ok=True)
+            tmp = SNAPSHOT.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp, 'wb') as f:
+                pickle.dump({'version': SNAPSHOT_VERSION, 'signature': sig, 'state': pokedex.to_state()},
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, SNAPSHOT)
+
+    if use_cache:
+        _loaded[key] = pokedex
+    return pokedex
+
+
+def main():
+    started = time.perf_counter()
+    pokedex = load()
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"📚 図鑑データ: {len(pokedex)} 匹 / 英語スラッグ {len(pokedex.by_slug)} / "
+          f"日本語名 {len(pokedex.by_ja)} / フォーム {len(pokedex.forms)} ({elapsed:.1f}ms)")
+    for query in sys.argv[1:]:
+        pid = pokedex.lookup(query)
+        if pid is None:
+            print(f"  {query}: 見つかりません")
+            continue
+        info = pokedex.get(pid)
+        form = pokedex.form(query)
+        extra = f" [フォーム: {form['form']} → {form['path']}]" if form else ''
+        print(f"  {query}: #{pid:04d} {info['name']} ({info['name_en']}){extra}")
+
+
+if __name__ == '__main__':
+    main()
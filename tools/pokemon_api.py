@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PokeAkane ローカル検索 API（読み取り専用）
+- server_engine.py が /api/ 以下のリクエストをここに渡す
+- data/gen*_pokemon.json と data/pokedex_structures/*.json から起動時にメモリ上の索引を作り、
+  図鑑・タイプ・世代・進化段階での絞り込み、種族値での並び替え、ページ分割をサーバー側で行う
+  （端末はギャラリー1ページ分の結果だけを受け取ればよい）
+- データファイルが更新されたら次のリクエストで索引を作り直す（確認は RELOAD_CHECK_INTERVAL 秒ごと）
+- 同じ URL への応答は JSON 化・gzip 済みのバイト列をキャッシュ（索引を作り直したら破棄）
+
+エンドポイント:
+  GET /api/pokemon?dex=21&type=fire&sort=speed&limit=50&offset=0
+      dex       : 図鑑ID（pokedex_structures のファイル名、既定 0 = 全国図鑑）
+      type      : タイプ（英語・日本語どちらでも。カンマ区切り/複数指定はすべてを持つポケモン）
+      gen       : 世代（1〜9）
+      evolution : basic / middle / final（ギャラリーの進化段階フィルターと同じ判定、evolution_graph.py）
+      family    : 同じ進化系統のポケモンだけ（全国図鑑番号・英語名・日本語名）
+      q         : 名前（日本語・英語）・全国図鑑番号・図鑑番号の部分一致
+      sort      : id（図鑑番号順）/ hp / attack / defense / special_attack / special_defense / speed / total
+      order     : asc / desc（既定: id は asc、種族値は desc）
+      limit     : 件数（既定 50、最大 MAX_LIMIT）
+      offset    : 先頭からの位置
+  GET /api/pokemon/{全国図鑑番号・英語名・日本語名・フォームキー}
+  GET /api/dexes
+  GET /api/team?dex=19&members=6,149,445&suggest=5
+      パーティのタイプ相性分析と追加メンバーの提案（team_analyzer.py）
+      dex       : 相手にする図鑑（ID またはキー、既定 0 = 全国図鑑）
+      members   : メンバー（全国図鑑番号・英語名・日本語名、カンマ区切りで6匹まで）
+      suggest   : 追加メンバー候補の数（既定 5、0 で提案しない）
+
+動作確認（サーバーなし）:
+  python tools/pokemon_api.py "/api/pokemon?dex=20&type=fire&sort=speed&limit=5"
+  python tools/pokemon_api.py "/api/pokemon/%E3%83%94%E3%82%AB%E3%83%81%E3%83%A5%E3%82%A6"   # ピカチュウ
+"""
+
+import gzip
+import hashlib
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import evolution_graph
+import pokedex_core
+import team_analyzer
+
+ROOT = Path(__file__).resolve().parents[1]
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+RELOAD_CHECK_INTERVAL = 1.0
+RESPONSE_CACHE_SIZE = 512
+# これより小さい応答は圧縮しない（gzip のヘッダー分かえって大きくなる）
+GZIP_MIN_BYTES = 1024
+
+STAT_KEYS = ('hp', 'attack', 'defense', 'special_attack', 'special_defense', 'speed')
+SORT_KEYS = ('id', *STAT_KEYS, 'total')
+SORT_ALIASES = {'stats_total': 'total'}
+EVOLUTION_STAGES = evolution_graph.STAGES
+
+
+class ApiError(Exception):
+    """クライアントに返すエラー（HTTP ステータスつき）"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class PokemonIndex:
+    """検索用のメモリ上の索引（PokemonApi がデータ更新時に作り直す）"""
+
+    def __init__(self, data_dir, image_dir):
+        self.data_dir = Path(data_dir)
+        self.pokedex = pokedex_core.build(self.data_dir, Path(image_dir))
+        self.records = self.pokedex.by_id
+
+        self.by_type = {}
+        self.by_generation = {}
+        # 進化段階・進化系統は prev / next の両方から組んだ進化グラフで判定
+        self.evolution = evolution_graph.EvolutionGraph.from_records(self.records)
+        self.by_stage = self.evolution.stage_sets()
+        self.type_names = {}
+        self.search_text = {}
+        self.totals = {}
+        for pid, info in self.records.items():
+            for name_ja, name_en in zip(info.get('types', []), info.get('types_en', [])):
+                self.by_type.setdefault(name_en, set()).add(pid)
+                self.type_names[name_ja] = name_en
+                self.type_names[name_en] = name_en
+            self.by_generation.setdefault(info.get('generation'), set()).add(pid)
+            self.search_text[pid] = (pokedex_core.normalize_ja(info.get('name', '')),
+                                     (info.get('name_en') or '').lower(),
+                                     str(pid), f'{pid:03d}')
+            self.totals[pid] = sum((info.get('stats') or {}).get(k, 0) for k in STAT_KEYS)
+
+        # 図鑑ごとの (図鑑番号, 全国図鑑番号) を図鑑番号順に
+        self.dexes, self.entries = pokedex_core.load_dex_entries(self.data_dir, self.records)
+        self.team = team_analyzer.TeamAnalyzer(self.records, self.dexes, self.entries)
+
+        self.sorted_cache = {}
+        self.sorted_lock = threading.Lock()
+
+    def stat(self, pid, key):
+        if key == 'total':
+            return self.totals[pid]
+        return (self.records[pid].get('stats') or {}).get(key, 0)
+
+    def sorted_entries(self, dex_id, sort, descending):
+        """図鑑 × 並び順ごとの並び替え済みリスト（初回だけ並び替えてキャッシュ）"""
+        key = (dex_id, sort, descending)
+        with self.sorted_lock:
+            cached = self.sorted_cache.get(key)
+        if cached is not None:
+            return cached
+        entries = self.entries[dex_id]
+        if sort == 'id':
+            result = entries[::-1] if descending else entries
+        else:
+            # 同じ値は図鑑番号順（ギャラリーの安定ソートと同じ並び）
+            result = sorted(entries, key=lambda e: -self.stat(e[1], sort) if descending else self.stat(e[1], sort))
+        with self.sorted_lock:
+            self.sorted_cache[key] = result
+        return result
+
+    def matches_search(self, pid, number, query_ja, query_en):
+        name_ja, name_en, pid_text, padded = self.search_text[pid]
+        return (query_ja in name_ja or (query_en and query_en in name_en)
+                or query_en in pid_text or query_en in padded or query_en in str(number))
+
+    def search(self, dex=0, types=(), gen=None, evolution=None, family=None, q=None, sort='id', order=None,
+               limit=DEFAULT_LIMIT, offset=0):
+        if dex not in self.entries:
+            raise ApiError(404, f'図鑑ID {dex} はありません')
+        sort = SORT_ALIASES.get(sort, sort)
+        if sort not in SORT_KEYS:
+            raise ApiError(400, f"sort は {', '.join(SORT_KEYS)} のいずれかです")
+        if order not in (None, 'asc', 'desc'):
+            raise ApiError(400, 'order は asc / desc のいずれかです')
+        descending = order == 'desc' if order else sort != 'id'
+        if evolution is not None and evolution not in EVOLUTION_STAGES:
+            raise ApiError(400, f"evolution は {', '.join(EVOLUTION_STAGES)} のいずれかです")
+
+        # 絞り込み条件は ID の集合にしてから積集合を取る
+        allowed = None
+        for type_name in types:
+            type_en = self.type_names.get(type_name.lower()) or self.type_names.get(type_name)
+            if type_en is None:
+                raise ApiError(400, f'不明なタイプです: {type_name}')
+            ids = self.by_type[type_en]
+            allowed = ids if allowed is None else allowed & ids
+        if gen is not None:
+            ids = self.by_generation.get(gen, set())
+            allowed = ids if allowed is None else allowed & ids
+        if evolution is not None:
+            ids = self.by_stage[evolution]
+            allowed = ids if allowed is None else allowed & ids
+        if family is not None:
+            pid = self.pokedex.lookup(family)
+            if pid is None or pid not in self.evolution:
+                raise ApiError(404, f'ポケモンが見つかりません: {family}')
+            ids = set(self.evolution.family(pid))
+            allowed = ids if allowed is None else allowed & ids
+
+        query_ja = pokedex_core.normalize_ja(q) if q else None
+        query_en = q.strip().lower() if q else None
+
+        total = 0
+        page = []
+        for number, pid in self.sorted_entries(dex, sort, descending):
+            if allowed is not None and pid not in allowed:
+                continue
+            if query_ja is not None and not self.matches_search(pid, number, query_ja, query_en):
+                continue
+            if offset <= total < offset + limit:
+                page.append({'dex_number': number, **self.records[pid]})
+            total += 1
+
+        return {
+            'dex': self.dexes[dex],
+            'total': total,
+            'offset': offset,
+            'limit': limit,
+            'sort': sort,
+            'order': 'desc' if descending else 'asc',
+            'results': page,
+        }
+
+
+class ApiResponse:
+    """JSON 化済みの応答（gzip は GZIP_MIN_BYTES 以上のときだけ用意）"""
+
+    def __init__(self, status, payload):
+        self.status = status
+        self.body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self.etag = '"' + hashlib.blake2b(self.body, digest_size=16).hexdigest() + '"'
+        self.gzip_body = gzip.compress(self.body, compresslevel=6) if len(self.body) >= GZIP_MIN_BYTES else None
+
+
+class PokemonApi:
+    """/api/ 以下のリクエストを処理する（スレッドセーフ・データ更新時に自動で索引を作り直す）"""
+
+    def __init__(self, data_dir=ROOT / 'data', image_dir=ROOT / 'pokemon_images'):
+        self.data_dir = Path(data_dir)
+        self.image_dir = Path(image_dir)
+        self.lock = threading.Lock()
+        self.index = None
+        self.signature = None
+        self.checked_at = 0.0
+        self.responses = {}
+
+    def current_signature(self):
+        return [(str(p), p.stat().st_mtime_ns, p.stat().st_size) for p in pokedex_core.source_files(self.data_dir)]
+
+    def get_index(self):
+        now = time.monotonic()
+        if self.index is not None and now - self.checked_at < RELOAD_CHECK_INTERVAL:
+            return self.index
+        with self.lock:
+            if self.index is None or now - self.checked_at >= RELOAD_CHECK_INTERVAL:
+                signature = self.current_signature()
+                if signature != self.signature:
+                    self.index = PokemonIndex(self.data_dir, self.image_dir)
+                    self.signature = signature
+                    self.responses = {}
+                self.checked_at = now
+            return self.index
+
+    def respond(self, raw_path):
+        """キャッシュつきで ApiResponse を返す（server_engine.py から呼ばれる）"""
+        self.get_index()
+        responses = self.responses
+        cached = responses.get(raw_path)
+        if cached is not None:
+            return cached
+        response = ApiResponse(*self.handle(raw_path))
+        if response.status == 200:
+            with self.lock:
+                if len(responses) >= RESPONSE_CACHE_SIZE:
+                    responses.pop(next(iter(responses)))
+                responses[raw_path] = response
+        return response
+
+    def handle(self, raw_path):
+        """(ステータス, JSON 化できる本文) を返す"""
+        url = urlsplit(raw_path)
+        # ブラウザ・curl は日本語名をパーセントエンコードして送る（/api/pokemon/%E3%83%94...）
+        parts = [unquote(p) for p in url.path.split('/') if p]
+        params = parse_qs(url.query)
+        try:
+            index = self.get_index()
+            if parts == ['api', 'pokemon']:
+                return 200, index.search(**self.search_params(params))
+            if len(parts) == 3 and parts[:2] == ['api', 'pokemon']:
+                pid = index.pokedex.lookup(parts[2])
+                if pid is None:
+                    raise ApiError(404, f'ポケモンが見つかりません: {parts[2]}')
+                return 200, index.records[pid]
+            if parts == ['api', 'dexes']:
+                return 200, list(index.dexes.values())
+            if parts == ['api', 'team']:
+                return 200, self.team(index, params)
+            raise ApiError(404, f'不明な API です: {url.path}')
+        except ApiError as e:
+            return e.status, {'error': e.message}
+
+    @staticmethod
+    def team(index, params):
+        members = []
+        for value in params.get('members', []):
+            for query in filter(None, (q.strip() for q in value.split(','))):
+                pid = index.pokedex.lookup(query)
+                if pid is None:
+                    raise ApiError(404, f'ポケモンが見つかりません: {query}')
+                members.append(pid)
+        try:
+            suggest = int(params.get('suggest', [team_analyzer.DEFAULT_SUGGESTIONS])[-1])
+        except ValueError:
+            raise ApiError(400, f"suggest の値が不正です: {params['suggest'][-1]}")
+        try:
+            return index.team.analyze(params.get('dex', ['0'])[-1] or '0', members, suggest)
+        except team_analyzer.TeamError as e:
+            raise ApiError(400, str(e))
+
+    @staticmethod
+    def search_params(params):
+        def single(name, convert=str, default=None):
+            values = params.get(name)
+            if not values or values[-1] == '':
+                return default
+            try:
+                return convert(values[-1])
+            except ValueError:
+                raise ApiError(400, f'{name} の値が不正です: {values[-1]}')
+
+        limit = single('limit', int, DEFAULT_LIMIT)
+        offset = single('offset', int, 0)
+        if not 1 <= limit <= MAX_LIMIT:
+            raise ApiError(400, f'limit は 1〜{MAX_LIMIT} で指定してください')
+        if offset < 0:
+            raise ApiError(400, 'offset は 0 以上で指定してください')
+        types = [t.strip() for value in params.get('type', []) for t in value.split(',') if t.strip()]
+        return {
+            'dex': single('dex', int, 0),
+            'types': types,
+            'gen': single('gen', int),
+            'evolution': single('evolution'),
+            'family': single('family'),
+            'q': single('q'),
+            'sort': single('sort', str, 'id'),
+            'order': single('order'),
+            'limit': limit,
+            'offset': offset,
+        }
+
+
+def main():
+    api = PokemonApi()
+    for path in sys.argv[1:] or ['/api/pokemon?limit=3']:
+        started = time.perf_counter()
+        status, body = api.handle(path)
+        elapsed = (time.perf_counter() - started) * 1000
+        if status == 200 and 'results' in body:
+            names = ', '.join(f"{r['name']}" for r in body['results'])
+            print(f"✅ {path} → {body['total']} 件中 {len(body['results'])} 件 ({elapsed:.2f}ms): {names}")
+        else:
+            print(f"{'✅' if status == 200 else '❌'} {path} → {status} ({elapsed:.2f}ms): "
+                  f"{json.dumps(body, ensure_ascii=False)[:200]}")
+
+
+if __name__ == '__main__':
+    main()
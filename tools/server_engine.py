@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PokeAkane 静的ファイルサーバー（内蔵エンジン）
+- スレッドプールで複数接続を同時処理（1クライアントが遅くても他をブロックしない）
+- HTTP/1.1 keep-alive 対応（1025枚の画像を同じ接続で連続取得）
+- 可能な場合は socket.sendfile でファイルを送信
+- 強い ETag（内容ハッシュを path+mtime+size でメモリキャッシュ）と
+  If-None-Match / If-Modified-Since による 304 応答
+- pokemon_images/ 配下は長期キャッシュ（Cache-Control: immutable。縮小版・アトラスの一覧 JSON だけは毎回再検証）
+- precompress_assets.py が作った .br / .gz を Accept-Encoding に応じて返す
+- /api/ 以下は読み取り専用の検索 API（pokemon_api.py）。図鑑・タイプでの絞り込みやページ分割をサーバー側で行う
+
+通常は server_manager.py から起動されます:
+  python tools/server_manager.py start
+
+単体起動:
+  python tools/server_engine.py 8000 --bind 127.0.0.1 --directory .
+"""
+
+import argparse
+import datetime
+import email.utils
+import hashlib
+import os
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from http import HTTPStatus
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+from pathlib import Path
+
+from pokemon_api import PokemonApi
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# ワーカースレッド数（ブラウザは1ホストあたり6接続程度を張る）
+DEFAULT_WORKERS = 32
+# keep-alive のアイドル接続を切るまでの秒数（ワーカーを占有し続けないように）
+KEEP_ALIVE_TIMEOUT = 15
+
+# 内容が変わらない前提で長期キャッシュさせるパス（プロジェクトルートからの相対）
+IMMUTABLE_PREFIXES = ('pokemon_images/',)
+# 上記の配下でも内容が更新されるもの（縮小版・アトラスの一覧 JSON。画像自体はハッシュ付きファイル名）
+REVALIDATE_SUFFIXES = ('.json',)
+# 内容ハッシュ付きファイル名（例: data/bundle/national.e2a888d71a.min.json）も内容不変
+HASHED_NAME_PATTERN = re.compile(r'\.[0-9a-f]{10,}\.[^/]+$')
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+# それ以外は毎回 ETag で再検証（変更がなければ 304 で本文なし）
+REVALIDATE_CACHE_CONTROL = 'no-cache'
+
+# 事前圧縮版を探す拡張子（優先順）。tools/utilities/precompress_assets.py が生成
+PRECOMPRESSED_VARIANTS = (('br', '.br'), ('gzip', '.gz'))
+COMPRESSIBLE_SUFFIXES = ('.html', '.css', '.js', '.json')
+
+API_PREFIX = '/api/'
+
+
+def parse_accept_encoding(header):
+    """Accept-Encoding から受け入れ可能な符号化の集合を返す（q=0 は除外）"""
+    accepted = set()
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if q <= 0:
+            continue
+        if coding == '*':
+            accepted.update(encoding for encoding, _ in PRECOMPRESSED_VARIANTS)
+        else:
+            accepted.add(coding)
+    return accepted
+
+
+class FileMetadataCache:
+    """ファイルの ETag を (path, mtime, size) 単位でメモリにキャッシュ
+
+    ハッシュ計算でファイルを読むのは初回と更新時だけ。
+    2回目以降は stat のみで ETag を返せる。
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def etag(self, path, st):
+        key = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._entries.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                digest.update(chunk)
+        etag = f'"{digest.hexdigest()}"'
+        with self._lock:
+            self._entries[path] = (key, etag)
+        return etag
+
+
+class ThreadPoolHTTPServer(HTTPServer):
+    """接続ごとの処理をスレッドプールに投げる HTTPServer"""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, server_address, handler_class, workers=DEFAULT_WORKERS):
+        super().__init__(server_address, handler_class)
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pokeakane-http')
+
+    def process_request(self, request, client_address):
+        self.executor.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class PokeAkaneRequestHandler(SimpleHTTPRequestHandler):
+    """keep-alive 対応の静的ファイルハンドラ"""
+
+    protocol_version = 'HTTP/1.1'
+    timeout = KEEP_ALIVE_TIMEOUT
+    # ヘッダーと本文(sendfile)を別々に書くため、Nagle による遅延 ACK 待ちを避ける
+    disable_nagle_algorithm = True
+    server_version = 'PokeAkane'
+
+    metadata_cache = FileMetadataCache()
+
+    def do_GET(self):
+        if self.path.startswith(API_PREFIX):
+            self.send_api(include_body=True)
+        else:
+            super().do_GET()
+
+    def do_HEAD(self):
+        if self.path.startswith(API_PREFIX):
+            self.send_api(include_body=False)
+        else:
+            super().do_HEAD()
+
+    def send_api(self, include_body):
+        """検索 API の応答（JSON・ETag で 304・大きい応答は gzip）"""
+        response = self.server.api.respond(self.path)
+        etag = response.etag
+        if response.status == HTTPStatus.OK and self.is_not_modified(etag, None):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", REVALIDATE_CACHE_CONTROL)
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+
+        body, encoding = response.body, None
+        if response.gzip_body is not None and 'gzip' in parse_accept_encoding(self.headers.get("Accept-Encoding", "")):
+            body, encoding = response.gzip_body, 'gzip'
+        self.send_response(response.status)
+        self.send_header("Content-type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", REVALIDATE_CACHE_CONTROL)
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+        if include_body:
+            self.wfile.write(body)
+
+    def send_head(self):
+        """ETag / Last-Modified / Cache-Control 付きでヘッダーを送信
+
+        ディレクトリ（一覧・index.html へのリダイレクト）や存在しないパスは
+        標準の SimpleHTTPRequestHandler に任せる。
+        """
+        path = self.translate_path(self.path)
+        if path.endswith('/') or not os.path.isfile(path):
+            return super().send_head()
+
+        try:
+            encoding, served_path, has_variants = self.negotiate_encoding(path)
+            st = os.stat(served_path)
+            etag = self.metadata_cache.etag(served_path, st)
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        cache_control = self.cache_control_for(path)
+        if self.is_not_modified(etag, st):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", self.date_time_string(st.st_mtime))
+            self.send_header("Cache-Control", cache_control)
+            if has_variants:
+                self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return None
+
+        try:
+            f = open(served_path, 'rb')
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-type", self.guess_type(path))
+        self.send_header("Content-Length", str(st.st_size))
+        self.send_header("Last-Modified", self.date_time_string(st.st_mtime))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", cache_control)
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        if has_variants:
+            self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+        return f
+
+    def negotiate_encoding(self, path):
+        """事前圧縮版があれば選ぶ -> (encoding, 実際に送るパス, 圧縮版の有無)
+
+        元ファイルより古い圧縮版（ビルド後に元データを編集した場合）は使わない。
+        """
+        if not path.endswith(COMPRESSIBLE_SUFFIXES):
+            return None, path, False
+        accepted = parse_accept_encoding(self.headers.get("Accept-Encoding", ""))
+        source_mtime = None
+        has_variants = False
+        for encoding, suffix in PRECOMPRESSED_VARIANTS:
+            candidate = path + suffix
+            try:
+                variant_st = os.stat(candidate)
+            except OSError:
+                continue
+            has_variants = True
+            if encoding not in accepted:
+                continue
+            if source_mtime is None:
+                source_mtime = os.stat(path).st_mtime_ns
+            if variant_st.st_mtime_ns >= source_mtime:
+                return encoding, candidate, True
+        return None, path, has_variants
+
+    def cache_control_for(self, path):
+        rel = os.path.relpath(path, self.directory).replace(os.sep, '/')
+        if HASHED_NAME_PATTERN.search(rel):
+            return IMMUTABLE_CACHE_CONTROL
+        if rel.startswith(IMMUTABLE_PREFIXES) and not rel.endswith(REVALIDATE_SUFFIXES):
+            return IMMUTABLE_CACHE_CONTROL
+        return REVALIDATE_CACHE_CONTROL
+
+    def is_not_modified(self, etag, st):
+        """条件付き GET の判定（If-None-Match を優先）"""
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            if if_none_match.strip() == '*':
+                return True
+            candidates = [tag.strip() for tag in if_none_match.split(',')]
+            # 比較は弱い比較（W/ 接頭辞は無視）
+            return any(tag.removeprefix('W/') == etag for tag in candidates)
+
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since is None or st is None:
+            return False
+        try:
+            ims = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        if ims.tzinfo is None:
+            ims = ims.replace(tzinfo=datetime.timezone.utc)
+        last_modified = datetime.datetime.fromtimestamp(int(st.st_mtime), datetime.timezone.utc)
+        return last_modified <= ims
+
+    def copyfile(self, source, outputfile):
+        """実ファイルは sendfile でカーネルから直接送信する"""
+        try:
+            self.connection.sendfile(source)
+        except (AttributeError, OSError, ValueError):
+            super().copyfile(source, outputfile)
+
+    def log_message(self, format, *args):
+        # 画像1000枚超のアクセスログでコンソールが埋まらないよう、エラーのみ出力
+        pass
+
+    def log_error(self, format, *args):
+        # keep-alive のアイドル切断はエラー扱いしない
+        if format.startswith('Request timed out'):
+            return
+        sys.stderr.write("%s - - [%s] %s\n" % (self.address_string(), self.log_date_time_string(), format % args))
+
+
+def create_server(port, bind='127.0.0.1', directory=ROOT, workers=DEFAULT_WORKERS):
+    """サーバーインスタンスを作成（serve_forever は呼び出し側で実行）"""
+    handler = partial(PokeAkaneRequestHandler, directory=str(directory))
+    httpd = ThreadPoolHTTPServer((bind, port), handler, workers=workers)
+    # 検索 API の索引は最初のリクエストを待たずに作っておく
+    httpd.api = PokemonApi(Path(directory) / 'data', Path(directory) / 'pokemon_images')
+    httpd.api.get_index()
+    return httpd
+
+
+def main():
+    ap = argparse.ArgumentParser(description='PokeAkane 静的ファイルサーバー')
+    ap.add_argument('port', type=int, nargs='?', default=8000)
+    ap.add_argument('--bind', default='127.0.0.1')
+    ap.add_argument('--directory', default=str(ROOT))
+    ap.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    args = ap.parse_args()
+
+    httpd = create_server(args.port, args.bind, Path(args.directory), args.workers)
+    print(f"■ PokeAkane エンジン起動: http://{args.bind}:{args.port}/ "
+          f"(workers={args.workers}, keep-alive={KEEP_ALIVE_TIMEOUT}s, pid={os.getpid()})")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
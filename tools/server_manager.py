@@ -15,8 +15,11 @@ import psutil
 from pathlib import Path
 
 class PokeAkaneServer:
-    def __init__(self, port=8000):
+    def __init__(self, port=8000, engine='builtin'):
         self.port = port
+        # builtin: tools/server_engine.py（スレッドプール + keep-alive）
+        # legacy : python -m http.server（1接続ずつ処理）
+        self.engine = engine
         self.project_root = Path(__file__).parent.parent
         self.pid_file = self.project_root / ".server.pid"
         
@@ -37,7 +40,7 @@ class PokeAkaneServer:
                 # PIDが実際に存在するかチェック
                 if psutil.pid_exists(pid):
                     process = psutil.Process(pid)
-                    # python http.serverプロセスかチェック
+                    # サーバープロセス（内蔵エンジン or http.server）かチェック
                     if 'python' in process.name().lower() and str(self.port) in ' '.join(process.cmdline()):
                         return pid
             except:
@@ -59,11 +62,7 @@ class PokeAkaneServer:
         
         try:
             # サーバー起動（標準入出力を親コンソールに委譲）
-            cmd = [
-                sys.executable, '-m', 'http.server', str(self.port),
-                '--bind', '127.0.0.1',
-                '--directory', str(self.project_root)
-            ]
+            cmd = self.build_command()
 
             process = subprocess.Popen(
                 cmd,
@@ -83,6 +82,7 @@ class PokeAkaneServer:
 
                     print(f"■ サーバー起動成功！")
                     print(f"■ PID: {process.pid}")
+                    print(f"■ エンジン: {self.engine}")
                     print(f"■ アクセス: http://localhost:{self.port}/pokemon_gallery.html")
                     print(f"■ 停止方法: python tools/server_manager.py stop")
                     return True
@@ -104,6 +104,20 @@ class PokeAkaneServer:
             print(f"■ エラー: {e}")
             return False
     
+    def build_command(self):
+        """起動コマンドを組み立て"""
+        if self.engine == 'legacy':
+            return [
+                sys.executable, '-m', 'http.server', str(self.port),
+                '--bind', '127.0.0.1',
+                '--directory', str(self.project_root)
+            ]
+        return [
+            sys.executable, str(Path(__file__).parent / 'server_engine.py'), str(self.port),
+            '--bind', '127.0.0.1',
+            '--directory', str(self.project_root)
+        ]
+    
     def stop_server(self):
         """サーバー停止"""
         print(f"? サーバー停止中...")
@@ -177,7 +191,8 @@ class PokeAkaneServer:
 
 def main():
     """メイン実行"""
-    server = PokeAkaneServer()
+    engine = 'legacy' if '--legacy' in sys.argv[2:] else 'builtin'
+    server = PokeAkaneServer(engine=engine)
     
     if len(sys.argv) < 2:
         print("? PokeAkane サーバー管理ツール")
@@ -187,6 +202,8 @@ def main():
         print("  python tools/server_manager.py status  - 状態確認")
         print("  python tools/server_manager.py restart - 再起動")
         print("  python tools/server_manager.py open    - ブラウザで開く")
+        print("\nオプション:")
+        print("  --legacy  従来の python -m http.server で起動（1接続ずつ処理）")
         return
     
     command = sys.argv[1].lower()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PokeAkane パーティ相性分析エンジン
+- 最大6匹のパーティと図鑑ID を受け取り、その図鑑の全ポケモンを相手にしたときの
+    受け: 相手のタイプ一致技（STAB）を等倍以下で受けられるメンバーがいない相手（＝脅威）
+    攻め: メンバーのタイプ一致技で弱点を突ける相手（＝カバー）・等倍も取れない相手（＝受けられる）
+  を NumPy でまとめて計算する（相手 × メンバー × 攻撃タイプ の配列を1回作るだけ）
+    相手はタイプの組（最大171通り）ごとにまとめて数で重みづけするので、図鑑の大きさにほぼよらない
+- 攻撃タイプごとの弱点・耐性の数から、パーティの穴（2匹以上が弱点で、半減以下で受けられるメンバーがいないタイプ）を表示
+- 図鑑の全ポケモンを6匹目の候補として一括で評価し、スコアが最も上がるメンバーを提案
+  （同じタイプの組は1匹にまとめ、種族値合計が最も高いポケモンを代表にする）
+
+スコア = 弱点を突ける相手の数 − 脅威になる相手の数
+
+使用例:
+  sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # tools/ を import パスに追加
+  import team_analyzer
+  analyzer = team_analyzer.load()
+  analyzer.analyze(19, [6, 149, 445])
+
+使い方:
+  python tools/team_analyzer.py --dex sv リザードン カイリュー 445
+  python tools/team_analyzer.py --dex 21 1 4 7 --suggest 10
+  python tools/team_analyzer.py --dex sv 6 149 --json
+
+ローカルサーバーでは GET /api/team?dex=19&members=6,149,445&suggest=5（pokemon_api.py）
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+import pokedex_core
+import type_matrix
+
+MAX_MEMBERS = 6
+DEFAULT_SUGGESTIONS = 5
+MAX_SUGGESTIONS = 50
+LIST_LIMIT = 10          # 脅威・受けられる相手として返す件数（多い順ではなく図鑑番号順）
+
+STAT_KEYS = ('hp', 'attack', 'defense', 'special_attack', 'special_defense', 'speed')
+
+
+class TeamError(ValueError):
+    """パーティ・図鑑の指定が正しくない"""
+
+
+class DexArrays:
+    """1つの図鑑の全ポケモンのタイプを配列にしたもの（図鑑ごとに1回だけ作る）"""
+
+    def __init__(self, entries, records):
+        self.numbers = np.array([number for number, _ in entries], dtype=np.int32)
+        self.ids = np.array([pid for _, pid in entries], dtype=np.int32)
+        self.stab = stab_mask([records[pid]['types_en'] for pid in self.ids])
+        self.defense = defense_profiles([records[pid]['types_en'] for pid in self.ids])
+        self.totals = np.array([sum((records[pid].get('stats') or {}).get(k, 0) for k in STAT_KEYS)
+                                for pid in self.ids], dtype=np.int32)
+        # タイプの組ごとにまとめた配列（受ける倍率・タイプ一致技は組で決まる）
+        combo_index = {}
+        self.inverse = np.array([combo_index.setdefault(type_matrix.combo_key(records[pid]['types_en']),
+                                                        len(combo_index)) for pid in self.ids], dtype=np.int32)
+        first = np.unique(self.inverse, return_index=True)[1]
+        self.combo_stab = self.stab[first]
+        self.combo_defense = self.defense[first]
+        self.combo_counts = np.bincount(self.inverse, minlength=len(first))
+
+
+def stab_mask(type_lists):
+    """(N, 18) の 0/1 配列: タイプ一致技として使える攻撃タイプ"""
+    mask = np.zeros((len(type_lists), len(type_matrix.TYPES)), dtype=np.float32)
+    for row, types in enumerate(type_lists):
+        for t in types:
+            mask[row, type_matrix.TYPE_INDEX[t]] = 1
+    return mask
+
+
+def defense_profiles(type_lists):
+    """(N, 18) の配列: 各攻撃タイプから受ける倍率"""
+    keys, profiles = type_matrix.combo_profiles()
+    index = {key: i for i, key in enumerate(keys)}
+    rows = [index[type_matrix.combo_key(types)] for types in type_lists]
+    return profiles[rows].astype(np.float32)
+
+
+def best_stab(attacker_stab, defender_profile):
+    """[受ける側, 攻める側] = 攻める側のタイプ一致技のうち最も通る倍率
+
+    attacker_stab: (M, 18)、defender_profile: (N, 18) → (N, M)
+    タイプ一致でない列は 0 を掛けて消す（倍率は 0 以上なので max に影響しない）
+    """
+    return (attacker_stab[None, :, :] * defender_profile[:, None, :]).max(axis=2)
+
+
+class TeamAnalyzer:
+    """図鑑の全ポケモンに対するパーティの相性分析（図鑑ごとの配列をキャッシュ）"""
+
+    def __init__(self, records, dexes, entries):
+        self.records = records
+        self.dexes = dexes
+        self.entries = entries
+        self.arrays = {}
+
+    def dex_arrays(self, dex_id):
+        arrays = self.arrays.get(dex_id)
+        if arrays is None:
+            arrays = self.arrays[dex_id] = DexArrays(self.entries[dex_id], self.records)
+        return arrays
+
+    def resolve_dex(self, dex):
+        """図鑑ID（数値）または図鑑キー（sv, blueberry など）→ 図鑑ID"""
+        text = str(dex).strip()
+        if text.lstrip('-').isdigit() and int(text) in self.dexes:
+            return int(text)
+        for dex_id, info in self.dexes.items():
+            if info['key'] == text:
+                return dex_id
+        raise TeamError(f'図鑑が見つかりません: {dex}')
+
+    def member_summary(self, pid):
+        info = self.records[int(pid)]
+        return {'id': int(pid), 'name': info['name'], 'types': info['types_en']}
+
+    def analyze(self, dex, members, suggest=DEFAULT_SUGGESTIONS):
+        """パーティ（全国図鑑番号のリスト）を図鑑 dex の全ポケモンと比べた結果の dict"""
+        started = time.perf_counter()
+        dex_id = self.resolve_dex(dex)
+        members = [int(pid) for pid in dict.fromkeys(members)]
+        if not members:
+            raise TeamError('メンバーを1匹以上指定してください')
+        if len(members) > MAX_MEMBERS:
+            raise TeamError(f'メンバーは {MAX_MEMBERS} 匹までです')
+        unknown = [pid for pid in members if pid not in self.records]
+        if unknown:
+            raise TeamError(f"ポケモンが見つかりません: {', '.join(map(str, unknown))}")
+        if not 0 <= suggest <= MAX_SUGGESTIONS:
+            raise TeamError(f'suggest は 0〜{MAX_SUGGESTIONS} で指定してください')
+
+        dex = self.dex_arrays(dex_id)
+        team_types = [self.records[pid]['types_en'] for pid in members]
+        team_stab = stab_mask(team_types)
+        team_defense = defense_profiles(team_types)
+
+        # incoming[c, m]: タイプの組 c の相手のタイプ一致技がメンバー m に通る最大の倍率
+        # outgoing[c, m]: メンバー m のタイプ一致技がタイプの組 c の相手に通る最大の倍率
+        incoming = best_stab(dex.combo_stab, team_defense).T
+        outgoing = best_stab(team_stab, dex.combo_defense)
+        safest = incoming.min(axis=1)        # 一番うまく受けられるメンバーでの倍率
+        strongest = outgoing.max(axis=1)     # 一番通るメンバーでの倍率
+        # 相手1匹ずつの判定（図鑑番号順）
+        threats = (safest >= 2)[dex.inverse]
+        covered = (strongest >= 2)[dex.inverse]
+        walls = (strongest < 1)[dex.inverse]
+        neutral = ~covered & ~walls
+
+        # 攻撃タイプごとの弱点・耐性の数
+        weak = (team_defense > 1).sum(axis=0)
+        resist = (team_defense < 1).sum(axis=0)
+        immune = (team_defense == 0).sum(axis=0)
+        defense = {t: {'weak': int(weak[i]), 'resist': int(resist[i]), 'immune': int(immune[i])}
+                   for i, t in enumerate(type_matrix.TYPES)}
+        holes = [t for i, t in enumerate(type_matrix.TYPES) if weak[i] >= 2 and resist[i] == 0]
+
+        def listed(mask):
+            return [{'dex_number': int(dex.numbers[i]), **self.member_summary(dex.ids[i])}
+                    for i in np.flatnonzero(mask)[:LIST_LIMIT]]
+
+        result = {
+            'dex': self.dexes[dex_id],
+            'members': [self.member_summary(pid) for pid in members],
+            'score': int(covered.sum()) - int(threats.sum()),
+            'opponents': len(dex.ids),
+            'coverage': {
+                'super_effective': int(covered.sum()),
+                'neutral': int(neutral.sum()),
+                'resisted': int(walls.sum()),
+                'walls': listed(walls),
+            },
+            'threats': {'count': int(threats.sum()), 'pokemon': listed(threats)},
+            'defense': defense,
+            'holes': holes,
+            'suggestions': [],
+        }
+        if suggest and len(members) < MAX_MEMBERS:
+            result['suggestions'] = self.suggest(dex, members, safest, strongest, suggest)
+        result['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 2)
+        return result
+
+    def suggest(self, dex, members, safest, strongest, limit):
+        """図鑑の全ポケモンを追加メンバー候補として一括評価し、スコアの高い順に返す
+
+        候補はタイプの組ごとに1匹（種族値合計が最も高く、同じなら図鑑番号が小さいポケモン）
+        """
+        available = ~np.isin(dex.ids, members)
+        representative = {}
+        for i in np.lexsort((dex.numbers, -dex.totals)):
+            if available[i]:
+                representative.setdefault(int(dex.inverse[i]), i)
+        if not representative:
+            return []
+        combos = np.array(list(representative))
+        picks = np.array(list(representative.values()))
+
+        # [相手のタイプの組, 候補] の配列で、追加後の「一番うまく受けられる倍率」「一番通る倍率」をまとめて計算
+        incoming = best_stab(dex.combo_stab, dex.combo_defense[combos]).T
+        outgoing = best_stab(dex.combo_stab[combos], dex.combo_defense)
+        new_safest = np.minimum(safest[:, None], incoming)
+        new_strongest = np.maximum(strongest[:, None], outgoing)
+        covered = dex.combo_counts @ (new_strongest >= 2)
+        threats = dex.combo_counts @ (new_safest >= 2)
+        scores = covered - threats
+
+        # スコア → 種族値合計 → 図鑑番号の順
+        order = np.lexsort((dex.numbers[picks], -dex.totals[picks], -scores))[:limit]
+        return [{
+            'dex_number': int(dex.numbers[picks[k]]),
+            **self.member_summary(dex.ids[picks[k]]),
+            'score': int(scores[k]),
+            'super_effective': int(covered[k]),
+            'threats': int(threats[k]),
+        } for k in order]
+
+
+def load(data_dir=pokedex_core.DATA_DIR):
+    pokedex = pokedex_core.load(data_dir)
+    dexes, entries = pokedex_core.load_dex_entries(data_dir, pokedex.by_id)
+    return TeamAnalyzer(pokedex.by_id, dexes, entries), pokedex
+
+
+def print_report(result):
+    ja = type_matrix.TYPE_JA
+    dex = result['dex']
+    print(f"🧪 {dex['name']}（{result['opponents']} 匹）に対するパーティ分析 ({result['elapsed_ms']:.2f}ms)")
+    for member in result['members']:
+        print(f"  - #{member['id']} {member['name']}（{'・'.join(ja[t] for t in member['types'])}）")
+
+    coverage = result['coverage']
+    print(f"\n⚔️ 攻め（タイプ一致技）: 弱点を突ける {coverage['super_effective']} 匹 / "
+          f"等倍 {coverage['neutral']} 匹 / 半減以下 {coverage['resisted']} 匹")
+    if coverage['walls']:
+        print(f"   受けられる相手: {'、'.join(p['name'] for p in coverage['walls'])}"
+              f"{' ...' if coverage['resisted'] > len(coverage['walls']) else ''}")
+    threats = result['threats']
+    print(f"🛡️ 受け: 誰も等倍以下で受けられない相手 {threats['count']} 匹")
+    if threats['pokemon']:
+        print(f"   脅威: {'、'.join(p['name'] for p in threats['pokemon'])}"
+              f"{' ...' if threats['count'] > len(threats['pokemon']) else ''}")
+    if result['holes']:
+        print(f"   穴（2匹以上が弱点・半減以下なし）: {'、'.join(ja[t] for t in result['holes'])}")
+    print(f"📈 スコア: {result['score']:+d}")
+
+    if result['suggestions']:
+        print("\n💡 追加メンバーの候補:")
+        for s in result['suggestions']:
+            print(f"  {s['score']:+4d}  #{s['id']} {s['name']}（{'・'.join(ja[t] for t in s['types'])}）"
+                  f" 弱点を突ける {s['super_effective']} / 脅威 {s['threats']}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description='パーティのタイプ相性分析と追加メンバーの提案')
+    ap.add_argument('members', nargs='+', help='メンバー（全国図鑑番号・日本語名・英語名、6匹まで）')
+    ap.add_argument('--dex', default='0', help='相手にする図鑑（ID または sv / blueberry などのキー、既定: 全国図鑑）')
+    ap.add_argument('--suggest', type=int, default=DEFAULT_SUGGESTIONS, help='追加メンバー候補の数（0 で提案しない）')
+    ap.add_argument('--json', action='store_true', help='結果を JSON で出力')
+    args = ap.parse_args()
+
+    analyzer, pokedex = load()
+    members = []
+    for query in args.members:
+        pid = pokedex.lookup(query)
+        if pid is None:
+            ap.error(f'ポケモンが見つかりません: {query}')
+        members.append(pid)
+    try:
+        result = analyzer.analyze(args.dex, members, args.suggest)
+    except TeamError as e:
+        ap.error(str(e))
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=1))
+    else:
+        print_report(result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PokeAkane タイプ相性行列モジュール
+- 18×18 の攻撃相性行列（attack_matrix()[攻撃, 防御] = 倍率）を NumPy 配列で提供
+- 単タイプ18 + 複合タイプ153 = 171 通りの防御プロファイル（各攻撃タイプから受ける倍率）を一括計算
+- 全ポケモンの受ける倍率を data/bundle/type_defense.json に書き出し、
+  ギャラリーや「こおり 4倍弱点」のような絞り込みを表引きだけで済ませる
+
+type_defense.json:
+  {"version": 1,
+   "types": ["normal", "fire", ...],           # 攻撃タイプの並び（TYPES と同じ順）
+   "multipliers": [0, 0.25, 0.5, 1, 2, 4],      # 倍率コード 0〜5 → 倍率
+   "combos": {"grass/poison": "333153...", ...}, # タイプの組（TYPES 順に並べて / 区切り）→ 倍率コード列
+   "pokemon": {"1": "333153...", ...}}           # 全国No. → 倍率コード列（18文字、types の順）
+  例: 全国No. 1 が こおり から受ける倍率 = multipliers[int(pokemon["1"][types.indexOf("ice")])]
+
+使用例:
+  sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # tools/ を import パスに追加
+  import type_matrix
+  type_matrix.defense_profile(['grass', 'poison'])     # 18要素の倍率配列
+  type_matrix.weaknesses(['dragon', 'flying'])         # {'ice': 4.0, 'rock': 2.0, ...}
+
+使い方:
+  python tools/type_matrix.py                   # data/bundle/type_defense.json を生成
+  python tools/type_matrix.py --check           # 生成済みのファイルが最新か確認するだけ
+  python tools/type_matrix.py --show 149 6      # 指定したポケモンの弱点・耐性を表示
+"""
+
+import argparse
+import json
+import sys
+from itertools import combinations
+from pathlib import Path
+
+import numpy as np
+
+from json_store import write_text_atomic
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA_DIR = ROOT / 'data'
+OUTPUT = DATA_DIR / 'bundle' / 'type_defense.json'
+FORMAT_VERSION = 1
+
+# type_chart.html の types と同じ並び
+TYPES = ('normal', 'fire', 'water', 'electric', 'grass', 'ice', 'fighting', 'poison', 'ground',
+         'flying', 'psychic', 'bug', 'rock', 'ghost', 'dragon', 'dark', 'steel', 'fairy')
+TYPE_INDEX = {t: i for i, t in enumerate(TYPES)}
+TYPE_JA = {
+    'normal': 'ノーマル', 'fire': 'ほのお', 'water': 'みず', 'electric': 'でんき', 'grass': 'くさ',
+    'ice': 'こおり', 'fighting': 'かくとう', 'poison': 'どく', 'ground': 'じめん', 'flying': 'ひこう',
+    'psychic': 'エスパー', 'bug': 'むし', 'rock': 'いわ', 'ghost': 'ゴースト', 'dragon': 'ドラゴン',
+    'dark': 'あく', 'steel': 'はがね', 'fairy': 'フェアリー',
+}
+
+# タイプ相性（攻撃側 → 防御側の倍率。書いていない組み合わせは等倍）
+# type_chart.html の typeEffectiveness と同じ内容
+EFFECTIVENESS = {
+    'normal': {'rock': 0.5, 'ghost': 0, 'steel': 0.5},
+    'fire': {'fire': 0.5, 'water': 0.5, 'grass': 2, 'ice': 2, 'bug': 2, 'rock': 0.5, 'dragon': 0.5, 'steel': 2},
+    'water': {'fire': 2, 'water': 0.5, 'grass': 0.5, 'ground': 2, 'rock': 2, 'dragon': 0.5},
+    'electric': {'water': 2, 'electric': 0.5, 'grass': 0.5, 'ground': 0, 'flying': 2, 'dragon': 0.5},
+    'grass': {'fire': 0.5, 'water': 2, 'grass': 0.5, 'poison': 0.5, 'ground': 2, 'flying': 0.5, 'bug': 0.5,
+              'rock': 2, 'dragon': 0.5, 'steel': 0.5},
+    'ice': {'fire': 0.5, 'water': 0.5, 'grass': 2, 'ice': 0.5, 'ground': 2, 'flying': 2, 'dragon': 2, 'steel': 0.5},
+    'fighting': {'normal': 2, 'ice': 2, 'poison': 0.5, 'flying': 0.5, 'psychic': 0.5, 'bug': 0.5, 'rock': 2,
+                 'ghost': 0, 'dark': 2, 'steel': 2, 'fairy': 0.5},
+    'poison': {'grass': 2, 'poison': 0.5, 'ground': 0.5, 'rock': 0.5, 'ghost': 0.5, 'steel': 0, 'fairy': 2},
+    'ground': {'fire': 2, 'electric': 2, 'grass': 0.5, 'poison': 2, 'flying': 0, 'bug': 0.5, 'rock': 2, 'steel': 2},
+    'flying': {'electric': 0.5, 'grass': 2, 'fighting': 2, 'rock': 0.5, 'steel': 0.5, 'bug': 2},
+    'psychic': {'fighting': 2, 'poison': 2, 'psychic': 0.5, 'dark': 0, 'steel': 0.5},
+    'bug': {'fire': 0.5, 'grass': 2, 'fighting': 0.5, 'poison': 0.5, 'flying': 0.5, 'psychic': 2, 'ghost': 0.5,
+            'dark': 2, 'steel': 0.5, 'fairy': 0.5},
+    'rock': {'fire': 2, 'ice': 2, 'fighting': 0.5, 'ground': 0.5, 'flying': 2, 'bug': 2, 'steel': 0.5},
+    'ghost': {'normal': 0, 'psychic': 2, 'ghost': 2, 'dark': 0.5},
+    'dragon': {'dragon': 2, 'steel': 0.5, 'fairy': 0},
+    'dark': {'fighting': 0.5, 'psychic': 2, 'ghost': 2, 'dark': 0.5, 'fairy': 0.5},
+    'steel': {'fire': 0.5, 'water': 0.5, 'electric': 0.5, 'ice': 2, 'rock': 2, 'steel': 0.5, 'fairy': 2},
+    'fairy': {'fire': 0.5, 'fighting': 2, 'poison': 0.5, 'dragon': 2, 'dark': 2, 'steel': 0.5},
+}
+
+# 倍率コード（type_defense.json の1文字）。2タイプの積はこの6通りのどれかになる
+MULTIPLIERS = (0, 0.25, 0.5, 1, 2, 4)
+MULTIPLIER_CODE = {m: str(i) for i, m in enumerate(MULTIPLIERS)}
+
+_attack = None
+_combos = None
+
+
+def attack_matrix():
+    """攻撃相性行列 (18, 18)。[攻撃タイプ, 防御タイプ] = 倍率（読み取り専用）"""
+    global _attack
+    if _attack is None:
+        matrix = np.ones((len(TYPES), len(TYPES)))
+        for attacker, row in EFFECTIVENESS.items():
+            for defender, value in row.items():
+                matrix[TYPE_INDEX[attacker], TYPE_INDEX[defender]] = value
+        matrix.setflags(write=False)
+        _attack = matrix
+    return _attack
+
+
+def combo_key(types):
+    """タイプの組のキー（TYPES 順に並べて / 区切り）: ['poison', 'grass'] → 'grass/poison'"""
+    return '/'.join(sorted(set(types), key=TYPE_INDEX.__getitem__))
+
+
+def combo_profiles():
+    """全171通りのタイプの組 → 防御プロファイル。(キーのリスト, (171, 18) の配列)
+
+    防御プロファイル[i, a] = 攻撃タイプ a から組 i が受ける倍率（各防御タイプの列の積）
+    """
+    global _combos
+    if _combos is None:
+        matrix = attack_matrix()
+        pairs = [(i,) for i in range(len(TYPES))] + list(combinations(range(len(TYPES)), 2))
+        first = np.array([p[0] for p in pairs])
+        second = np.array([p[-1] for p in pairs])
+        # 単タイプは同じ列を2回掛けないよう、2つ目を「等倍」の列に差し替える
+        columns = np.concatenate([matrix, np.ones((len(TYPES), 1))], axis=1)
+        second = np.where([len(p) == 1 for p in pairs], len(TYPES), second)
+        profiles = (columns[:, first] * columns[:, second]).T
+        profiles.setflags(write=False)
+        _combos = ([combo_key(TYPES[i] for i in p) for p in pairs], profiles)
+    return _combos
+
+
+def defense_profile(types):
+    """タイプ（英語名のリスト）の防御プロファイル: TYPES 順の18要素の倍率配列"""
+    keys, profiles = combo_profiles()
+    return profiles[keys.index(combo_key(types))]
+
+
+def weaknesses(types):
+    """{攻撃タイプ: 倍率}（等倍以外だけ、倍率の大きい順）"""
+    profile = defense_profile(types)
+    order = sorted(range(len(TYPES)), key=lambda i: (-profile[i], i))
+    return {TYPES[i]: float(profile[i]) for i in order if profile[i] != 1}
+
+
+def encode_profile(profile):
+    return ''.join(MULTIPLIER_CODE[float(m)] for m in profile)
+
+
+def load_pokemon(data_dir=DATA_DIR):
+    """全国No. → タイプ（英語名のリスト）"""
+    pokemon = {}
+    for gen in range(1, 10):
+        path = data_dir / f'gen{gen}_pokemon.json'
+        if not path.exists():
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            for pokemon_id, info in json.load(f).items():
+                pokemon[int(pokemon_id)] = info['types_en']
+    return dict(sorted(pokemon.items()))
+
+
+def build_table(data_dir=DATA_DIR):
+    keys, profiles = combo_profiles()
+    combos = {key: encode_profile(profile) for key, profile in zip(keys, profiles)}
+    pokemon = {str(pokemon_id): combos[combo_key(types)] for pokemon_id, types in load_pokemon(data_dir).items()}
+    return {
+        'version': FORMAT_VERSION,
+        'types': list(TYPES),
+        'multipliers': list(MULTIPLIERS),
+        'combos': combos,
+        'pokemon': pokemon,
+    }
+
+
+def render(table):
+    return json.dumps(table, ensure_ascii=False, separators=(',', ':'))
+
+
+def write_table():
+    table = build_table()
+    changed = write_text_atomic(OUTPUT, render(table))
+    print(f"🛡️ タイプ相性表: {len(table['combos'])} 通りの組 / {len(table['pokemon'])} 匹"
+          f" → {OUTPUT.relative_to(ROOT).as_posix()}{'' if changed else '（変更なし）'}")
+    return table
+
+
+def main():
+    ap = argparse.ArgumentParser(description='タイプ相性行列・ポケモンごとの弱点表の生成')
+    ap.add_argument('--check', action='store_true', help='生成済みのファイルが最新か確認するだけ')
+    ap.add_argument('--show', nargs='+', type=int, metavar='ID', help='指定したポケモンの弱点・耐性を表示')
+    args = ap.parse_args()
+
+    if args.show:
+        pokemon = load_pokemon()
+        for pokemon_id in args.show:
+            if pokemon_id not in pokemon:
+                print(f"  #{pokemon_id}: 見つかりません")
+                continue
+            types = pokemon[pokemon_id]
+            groups = {}
+            for attacker, value in weaknesses(types).items():
+                groups.setdefault(value, []).append(TYPE_JA[attacker])
+            summary = ' / '.join(f"{value:g}倍: {'・'.join(names)}" for value, names in groups.items())
+            print(f"  #{pokemon_id} ({'・'.join(TYPE_JA[t] for t in types)}) {summary}")
+        return
+
+    if args.check:
+        current = OUTPUT.read_text(encoding='utf-8') if OUTPUT.exists() else None
+        if current != render(build_table()):
+            print(f"❌ {OUTPUT.relative_to(ROOT).as_posix()} が図鑑データと一致しません（再生成してください）")
+            sys.exit(1)
+        print("✅ タイプ相性表は最新です")
+        return
+
+    write_table()
+
+
+if __name__ == '__main__':
+    main()
@@ -9,11 +9,15 @@ FRLG 図鑑の全国図鑑追加分を反映するツール
 """
 
 import json
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pokedex_core  # noqa: E402
+
 ROOT = Path(__file__).resolve().parents[2]
 STRUCT = ROOT / 'data' / 'pokedex_structures' / '4.json'
-GEN_DIR = ROOT / 'data'
 
 # 追加対象の全国図鑑ID一覧（重複は自動スキップ）
 EXTRA_IDS = [
@@ -25,28 +29,12 @@ EXTRA_IDS = [
     298,360
 ]
 
-def load_all_pokemon():
-    """gen1-9 の JSON から {id: {name, name_en}} を作る"""
-    data = {}
-    for gen in range(1, 10):
-        p = GEN_DIR / f'gen{gen}_pokemon.json'
-        if not p.exists():
-            continue
-        doc = json.loads(p.read_text(encoding='utf-8'))
-        for pid_str, info in doc.items():
-            pid = int(pid_str)
-            data[pid] = {
-                'name': info.get('name'),
-                'name_en': info.get('name_en')
-            }
-    return data
-
 def main():
     if not STRUCT.exists():
         raise FileNotFoundError(f'FRLG 図鑑が見つかりません: {STRUCT}')
     dex = json.loads(STRUCT.read_text(encoding='utf-8'))
 
-    all_poke = load_all_pokemon()
+    pokedex = pokedex_core.load()
     pokemon = dex.get('pokemon', {})
 
     # 既存の図鑑番号の最大値を把握し、続き番号で追記
@@ -60,14 +48,12 @@ def main():
     for pid in EXTRA_IDS:
         if pid in existing_ids:
             continue
-        meta = all_poke.get(pid)
-        if not meta:
-            # 名前が取得できない場合でも最低限の構造で追加
-            meta = {'name': f'ID{pid}', 'name_en': None}
+        # 名前が取得できない場合でも最低限の構造で追加
+        meta = pokedex.get(pid) or {'name': f'ID{pid}', 'name_en': None}
         pokemon[str(next_number)] = {
             'pokemon_id': pid,
-            'name': meta['name'],
-            'name_en': meta['name_en']
+            'name': meta.get('name'),
+            'name_en': meta.get('name_en')
         }
         next_number += 1
         added += 1
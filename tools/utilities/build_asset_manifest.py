@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+画像アセット一覧（存在マップ）生成ツール
+- pokemon_images/ の各フォルダを1回だけ走査し、全国No. ごとに実在する画像・フォルム・色違いを
+  data/bundle/image_assets.json にまとめる
+- ギャラリーの詳細表示はこの一覧でフォルム・色違いの有無を判定し、画像を1枚ずつ試し読みしない
+- 画像として読めないファイル（0バイトのプレースホルダーなど）は「無い」ものとして扱う
+  （ブラウザでの試し読みが失敗するのと同じ結果）
+- 幅・高さ・バイト数・SHA-256（先頭8桁）は更新時刻・サイズとともに .cache/image_assets.json に保存し、
+  変わっていないファイルは読み直さない
+
+image_assets.json:
+  {"version": 1, "root": "pokemon_images/",
+   "pokemon": {"25": {"images": {"normal/025.png": [幅, 高さ, バイト数, ハッシュ], ...},
+                      "forms": ["gender_differences/025_pikachu_female.png", ...],
+                      "shinies": {"normal/025.png": "shinies/025_shiny.png", ...}}}}
+  forms は通常画像以外のフォルム画像（色違いを除く）、shinies は画像 → その色違い
+
+使い方:
+  python tools/utilities/build_asset_manifest.py
+  python tools/utilities/build_asset_manifest.py --check   # 一覧が最新か確認するだけ（古ければ終了コード1）
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+from PIL import Image, UnidentifiedImageError
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from json_store import write_text_atomic  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[2]
+IMAGE_DIR = ROOT / 'pokemon_images'
+OUTPUT = ROOT / 'data' / 'bundle' / 'image_assets.json'
+STATE_FILE = ROOT / '.cache' / 'image_assets.json'
+MANIFEST_VERSION = 1
+
+FOLDERS = ('normal', 'shinies', 'forms', 'patterns', 'mega_evolutions', 'gender_differences')
+HASH_LENGTH = 8
+# 先頭の全国No.（normal/025.png, forms/019_rattata-alola.png, shinies/025_shiny.png）
+ID_PATTERN = re.compile(r'^(\d+)(?:_|$)')
+SHINY_SUFFIX = '_shiny'
+
+
+def load_state():
+    try:
+        return json.loads(STATE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def describe(path, state):
+    """[幅, 高さ, バイト数, ハッシュ]。画像として読めなければ None"""
+    relpath = path.relative_to(IMAGE_DIR).as_posix()
+    st = path.stat()
+    cached = state.get(relpath)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    info = None
+    if st.st_size:
+        try:
+            with Image.open(path) as im:
+                width, height = im.size
+            data = path.read_bytes()
+            info = [width, height, len(data), hashlib.sha256(data).hexdigest()[:HASH_LENGTH]]
+        except (UnidentifiedImageError, OSError):
+            info = None
+    state[relpath] = [st.st_mtime_ns, st.st_size, info]
+    return info
+
+
+def shiny_of(relpath):
+    """画像に対応する色違い画像のパス（ギャラリーと同じ規則）"""
+    folder, name = relpath.split('/', 1)
+    if folder == 'normal':
+        return f'shinies/{name[:-4]}{SHINY_SUFFIX}.png'
+    return f'{relpath[:-4]}{SHINY_SUFFIX}.png'
+
+
+def build_manifest(state):
+    images = {}
+    skipped = []
+    for folder in FOLDERS:
+        for path in sorted((IMAGE_DIR / folder).glob('*.png')):
+            match = ID_PATTERN.match(path.stem)
+            if not match:
+                continue
+            info = describe(path, state)
+            relpath = path.relative_to(IMAGE_DIR).as_posix()
+            if info is None:
+                skipped.append(relpath)
+                continue
+            images.setdefault(int(match.group(1)), {})[relpath] = info
+
+    pokemon = {}
+    for pokemon_id in sorted(images):
+        files = images[pokemon_id]
+        forms = [p for p in files
+                 if not p.startswith(('normal/', 'shinies/')) and not p[:-4].endswith(SHINY_SUFFIX)]
+        shinies = {p: shiny_of(p) for p in files
+                   if not p.startswith('shinies/') and not p[:-4].endswith(SHINY_SUFFIX) and shiny_of(p) in files}
+        pokemon[str(pokemon_id)] = {'images': files, 'forms': forms, 'shinies': shinies}
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'root': f'{IMAGE_DIR.relative_to(ROOT).as_posix()}/',
+        'pokemon': pokemon,
+    }
+    return manifest, skipped
+
+
+def render(manifest):
+    return json.dumps(manifest, ensure_ascii=False, separators=(',', ':'))
+
+
+def write_manifest():
+    state = load_state()
+    manifest, skipped = build_manifest(state)
+    changed = write_text_atomic(OUTPUT, render(manifest))
+    write_text_atomic(STATE_FILE, json.dumps(state, ensure_ascii=False, sort_keys=True, separators=(',', ':')))
+
+    count = sum(len(p['images']) for p in manifest['pokemon'].values())
+    print(f"🗂️ 画像アセット一覧: {len(manifest['pokemon'])} 匹 / {count} 枚"
+          f"（読めない画像 {len(skipped)} 枚を除外） → {OUTPUT.relative_to(ROOT).as_posix()}"
+          f"{'' if changed else '（変更なし）'}")
+    return manifest
+
+
+def main():
+    ap = argparse.ArgumentParser(description='画像アセット一覧（存在マップ）生成')
+    ap.add_argument('--check', action='store_true', help='一覧が最新か確認するだけ')
+    args = ap.parse_args()
+
+    if args.check:
+        manifest, _ = build_manifest(load_state())
+        current = OUTPUT.read_text(encoding='utf-8') if OUTPUT.exists() else None
+        if current != render(manifest):
+            print(f"❌ {OUTPUT.relative_to(ROOT).as_posix()} が画像フォルダと一致しません（再生成してください）")
+            sys.exit(1)
+        print("✅ 画像アセット一覧は最新です")
+        return
+
+    write_manifest()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ポケモン画像の縮小版（srcset 用）生成ツール
+- pokemon_images/ の normal / shinies / forms / patterns / mega_evolutions / gender_differences から
+  64 / 128 / 256px（元画像より大きいサイズは作らない）の AVIF・WebP・最適化 PNG を生成
+- 出力は pokemon_images/derived/{サイズ}/{フォルダ}/{ファイル名}.{元画像ハッシュ8桁}.{形式}
+  （ファイル名に元画像のハッシュが入るので、長期キャッシュされても差し替え時に古い画像が残らない）
+- 元画像の SHA-256 で差分判定し、変わった画像だけを CPU コア数ぶん並列に処理
+  （ハッシュは更新時刻・サイズとともに .cache/image_derivatives.json に保存し、変わっていなければ読み直さない）
+- 不要になった縮小版は削除し、ギャラリーが srcset を組み立てる pokemon_images/derived/manifest.json を出力
+
+manifest.json:
+  {"version": 1, "sizes": [64, 128, 256], "formats": ["avif", "webp", "png"],
+   "path": "pokemon_images/derived/{size}/{folder}/{stem}.{hash}.{format}",
+   "images": {"normal/025": ["1a2b3c4d", 512, 512, [64, 128, 256]], ...}}
+  images の値は [ハッシュ, 元の幅, 元の高さ, 生成したサイズ]
+
+使い方:
+  python tools/utilities/build_image_derivatives.py
+  python tools/utilities/build_image_derivatives.py normal shinies --jobs 4
+  python tools/utilities/build_image_derivatives.py --formats webp png --sizes 64 128
+  python tools/utilities/build_image_derivatives.py --dry-run
+
+依存:
+  pip install pillow   # AVIF は Pillow 11.3 以降（未対応なら AVIF を飛ばして WebP / PNG のみ）
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image, UnidentifiedImageError, features
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from json_store import write_text_atomic  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[2]
+IMAGE_DIR = ROOT / 'pokemon_images'
+DERIVED_DIR = IMAGE_DIR / 'derived'
+MANIFEST = DERIVED_DIR / 'manifest.json'
+STATE_FILE = ROOT / '.cache' / 'image_derivatives.json'
+MANIFEST_VERSION = 1
+
+FOLDERS = ('normal', 'shinies', 'forms', 'patterns', 'mega_evolutions', 'gender_differences')
+SIZES = (64, 128, 256)
+FORMATS = ('avif', 'webp', 'png')
+HASH_LENGTH = 8
+
+# 形式ごとの保存オプション（縮小版はカード表示用なので画質より転送量を優先）
+SAVE_OPTIONS = {
+    'avif': {'quality': 55, 'speed': 8},
+    'webp': {'quality': 80, 'method': 4},
+    'png': {'optimize': True},
+}
+
+
+def available_formats(formats):
+    result = []
+    for fmt in formats:
+        if fmt == 'avif' and not features.check('avif'):
+            print("⚠️ この Pillow は AVIF に未対応のため AVIF を飛ばします（pip install -U pillow）")
+            continue
+        result.append(fmt)
+    return result
+
+
+def derived_path(size, folder, stem, digest, fmt):
+    return DERIVED_DIR / str(size) / folder / f'{stem}.{digest}.{fmt}'
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def load_state():
+    try:
+        return json.loads(STATE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state):
+    write_text_atomic(STATE_FILE, json.dumps(state, ensure_ascii=False, sort_keys=True, separators=(',', ':')))
+
+
+def scan_sources(folders, state):
+    """(フォルダ, ファイル名, パス, ハッシュ, 幅, 高さ) の一覧。読めない画像（0バイトなど）は除外"""
+    sources = []
+    skipped = []
+    for folder in folders:
+        for path in sorted((IMAGE_DIR / folder).glob('*.png')):
+            relpath = path.relative_to(ROOT).as_posix()
+            st = path.stat()
+            cached = state.get(relpath)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                digest, width, height = cached[2:]
+            else:
+                try:
+                    with Image.open(path) as im:
+                        width, height = im.size
+                except (UnidentifiedImageError, OSError):
+                    skipped.append(relpath)
+                    continue
+                digest = file_digest(path)
+                state[relpath] = [st.st_mtime_ns, st.st_size, digest, width, height]
+            sources.append((folder, path.stem, path, digest, width, height))
+    return sources, skipped
+
+
+def target_sizes(width, height, sizes):
+    return [s for s in sizes if s <= max(width, height)]
+
+
+def render(job):
+    """1枚の元画像から全サイズ・全形式の縮小版を作る（ワーカープロセスで実行）"""
+    folder, stem, path, digest, width, height, sizes, formats = job
+    written = 0
+    with Image.open(path) as source:
+        source.load()
+        image = source.convert('RGBA') if source.mode not in ('RGB', 'RGBA') else source.copy()
+    for size in sizes:
+        resized = image.copy()
+        resized.thumbnail((size, size), Image.LANCZOS)
+        for fmt in formats:
+            target = derived_path(size, folder, stem, digest, fmt)
+            if target.exists():
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_name(f'.{target.name}.{os.getpid()}.tmp')
+            resized.save(tmp, format=fmt.upper(), **SAVE_OPTIONS[fmt])
+            os.replace(tmp, target)
+            written += target.stat().st_size
+    return written
+
+
+def prune(expected):
+    """manifest に載らなくなった縮小版を削除"""
+    removed = 0
+    if not DERIVED_DIR.exists():
+        return removed
+    for path in DERIVED_DIR.glob('*/*/*'):
+        if path.is_file() and path not in expected:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def build(folders=FOLDERS, sizes=SIZES, formats=FORMATS, jobs=None, dry_run=False):
+    started = time.perf_counter()
+    formats = available_formats(formats)
+    state = load_state()
+    sources, skipped = scan_sources(folders, state)
+
+    images = {}
+    expected = set()
+    pending = []
+    for folder, stem, path, digest, width, height in sources:
+        image_sizes = target_sizes(width, height, sizes)
+        images[f'{folder}/{stem}'] = [digest, width, height, image_sizes]
+        outputs = [derived_path(s, folder, stem, digest, fmt) for s in image_sizes for fmt in formats]
+        expected.update(outputs)
+        if not all(p.exists() for p in outputs):
+            pending.append((folder, stem, path, digest, width, height, image_sizes, formats))
+
+    print(f"🖼️ 縮小版: 元画像 {len(sources)} 枚中 {len(pending)} 枚が対象 "
+          f"({'/'.join(map(str, sizes))}px × {'/'.join(formats)})")
+    for relpath in skipped:
+        print(f"  ⚠️ 画像として読めないためスキップ: {relpath}")
+    if dry_run:
+        for job in pending[:20]:
+            print(f"  {job[2].relative_to(ROOT).as_posix()}")
+        if len(pending) > 20:
+            print(f"  ...ほか {len(pending) - 20} 枚")
+        return None
+
+    written = 0
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+            for done, size in enumerate(pool.map(render, pending, chunksize=8), 1):
+                written += size
+                if done % 100 == 0:
+                    print(f"  📊 {done}/{len(pending)}")
+
+    # 対象外のフォルダを指定して実行した場合も、他フォルダの既存エントリは残す
+    previous = {}
+    if MANIFEST.exists():
+        try:
+            previous = json.loads(MANIFEST.read_text(encoding='utf-8')).get('images', {})
+        except ValueError:
+            previous = {}
+    for key, entry in previous.items():
+        folder, stem = key.split('/', 1)
+        if folder not in folders and (IMAGE_DIR / folder / f'{stem}.png').exists():
+            images.setdefault(key, entry)
+            expected.update(derived_path(s, folder, stem, entry[0], fmt) for s in entry[3] for fmt in formats)
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'sizes': list(sizes),
+        'formats': formats,
+        'path': 'pokemon_images/derived/{size}/{folder}/{stem}.{hash}.{format}',
+        'images': dict(sorted(images.items())),
+    }
+    write_text_atomic(MANIFEST, json.dumps(manifest, ensure_ascii=False, separators=(',', ':')))
+    removed = prune(expected | {MANIFEST})
+    save_state({k: v for k, v in state.items() if (ROOT / k).exists()})
+
+    print(f"✅ 生成 {len(pending)} 枚（{written / 1024 / 1024:.1f} MB）/ 削除 {removed} ファイル / "
+          f"{time.perf_counter() - started:.1f}秒 → {MANIFEST.relative_to(ROOT).as_posix()}")
+    return manifest
+
+
+def main():
+    ap = argparse.ArgumentParser(description='ポケモン画像の縮小版（AVIF / WebP / PNG）生成')
+    ap.add_argument('folders', nargs='*', help=f"対象フォルダ（{' / '.join(FOLDERS)}、省略時は全て）")
+    ap.add_argument('--sizes', type=int, nargs='+', default=list(SIZES), help='生成するサイズ（px）')
+    ap.add_argument('--formats', nargs='+', default=list(FORMATS), choices=FORMATS, help='生成する形式')
+    ap.add_argument('--jobs', type=int, default=None, help='並列プロセス数（既定: CPU コア数）')
+    ap.add_argument('--dry-run', action='store_true', help='生成が必要な画像を表示するだけ')
+    args = ap.parse_args()
+    unknown = [f for f in args.folders if f not in FOLDERS]
+    if unknown:
+        ap.error(f"未知のフォルダ: {', '.join(unknown)}")
+
+    build(tuple(args.folders) or FOLDERS, tuple(sorted(args.sizes)), tuple(args.formats), args.jobs, args.dry_run)
+
+
+if __name__ == '__main__':
+    main()
@@ -17,7 +17,8 @@ ROOT = Path(__file__).resolve().parents[2]
 STRUCT_DIR = ROOT / 'data' / 'pokedex_structures'
 OUT = ROOT / 'data' / 'pokedex_index.json'
 
-def main():
+def build_index():
+    """図鑑構造ファイルから {id: {id, name, key}} を作る"""
     if not STRUCT_DIR.exists():
         raise FileNotFoundError(f"図鑑構造フォルダがありません: {STRUCT_DIR}")
 
@@ -33,8 +34,14 @@ def main():
             }
         except Exception as e:
             print(f"警告: {p.name} の読み取りに失敗: {e}")
+    return index
 
-    OUT.write_text(json.dumps(index, ensure_ascii=False, indent=2), encoding='utf-8')
+def main():
+    index = build_index()
+    text = json.dumps(index, ensure_ascii=False, indent=2)
+    # 内容が同じなら書き込まない（後段のバンドル等を無駄に再生成させない）
+    if not OUT.exists() or OUT.read_text(encoding='utf-8') != text:
+        OUT.write_text(text, encoding='utf-8')
     print(f"図鑑インデックスを生成しました: {OUT} ({len(index)}件)")
 
 if __name__ == '__main__':
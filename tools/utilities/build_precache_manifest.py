@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+サービスワーカー用プリキャッシュ一覧の生成ツール
+- ページ本体（*.html）・data/ の派生データ・図鑑構造・タイプ／地方アイコンのうち Git で管理しているファイルを走査し、
+  内容ハッシュ（SHA-256 の先頭10桁）つきの一覧を precache_manifest.json に書き出す
+  （pokemon_images/derived/ など各自の手元で生成するファイルは含めない。どの環境で生成しても同じ一覧になる）
+- 一覧全体のハッシュを revision とし、service_worker.js の PRECACHE_REVISION を書き換える
+  （ブラウザはサービスワーカーのファイルが変わったときだけ更新を確認するため）
+- サービスワーカーは前回の一覧とハッシュが同じファイルは取り直さず、変わったものだけをダウンロードする
+- pokemon_images/ の画像はプリキャッシュせず、表示したときにキャッシュする（合計サイズの上限つき LRU）。
+  元画像の内容が変わったかどうかは data/bundle/image_assets.json のハッシュで判定する
+  （縮小版・アトラスの一覧 JSON はネットワーク優先で、つながらないときだけキャッシュを使う）
+
+precache_manifest.json:
+  {"version": 1,
+   "revision": "0123456789",                                   # precache と runtime から計算
+   "precache": {"pokemon_gallery.html": "a1b2c3d4e5", ...},    # ページからの相対パス → 内容ハッシュ
+   "runtime": {"prefixes": ["pokemon_images/"], "max_bytes": 67108864,
+               "image_assets": "data/bundle/image_assets.json"}}
+
+使い方:
+  python tools/utilities/build_precache_manifest.py
+  python tools/utilities/build_precache_manifest.py --runtime-mb 128   # 画像キャッシュの上限（MB）
+  python tools/utilities/build_precache_manifest.py --check            # 一覧が最新か確認するだけ（古ければ終了コード1）
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from json_store import write_text_atomic  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[2]
+OUTPUT = ROOT / 'precache_manifest.json'
+SERVICE_WORKER = ROOT / 'service_worker.js'
+MANIFEST_VERSION = 1
+HASH_LENGTH = 10
+
+# プリキャッシュする（ROOT からの glob）。ページが読み込むもののうち Git で管理しているものだけ
+# gen*_pokemon.json はバンドルが無いときのフォールバック専用なので含めない
+PRECACHE_PATTERNS = [
+    '*.html',
+    'data/bundle/*.json',
+    'data/bundle/stats.bin',
+    'data/pokedex_index.json',
+    'data/pokedex_hierarchy.json',
+    'data/pokedex_structures/*.json',
+    'type_images/*.png',
+    'region_icons/*.png',
+]
+# 内容ハッシュ付きファイル名のバンドル（national.e2a888d71a.min.json）は national.min.json と同じ内容
+HASHED_NAME_PATTERN = re.compile(r'\.[0-9a-f]{10,}\.[^/]+$')
+
+RUNTIME_PREFIXES = ['pokemon_images/']
+RUNTIME_MAX_MB = 64
+IMAGE_ASSETS = 'data/bundle/image_assets.json'
+
+REVISION_PATTERN = re.compile(r"^const PRECACHE_REVISION = '[^']*';$", re.MULTILINE)
+
+
+def tracked_files():
+    """Git で管理しているファイル（ROOT からの相対パスの集合）。Git が使えなければ None"""
+    try:
+        result = subprocess.run(['git', 'ls-files', '-z'], cwd=ROOT, capture_output=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return set(result.stdout.decode('utf-8').split('\0')) - {''}
+
+
+def precache_files():
+    """プリキャッシュするファイル（Git の作業ツリー以外で実行したときは存在するものすべて）"""
+    tracked = tracked_files()
+    paths = set()
+    for pattern in PRECACHE_PATTERNS:
+        for p in ROOT.glob(pattern):
+            relpath = p.relative_to(ROOT).as_posix()
+            if p.is_file() and not HASHED_NAME_PATTERN.search(p.name) and (tracked is None or relpath in tracked):
+                paths.add(relpath)
+    return sorted(paths)
+
+
+def content_hash(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:HASH_LENGTH]
+
+
+def build_manifest(runtime_mb=RUNTIME_MAX_MB):
+    precache = {relpath: content_hash(ROOT / relpath) for relpath in precache_files()}
+    runtime = {'prefixes': RUNTIME_PREFIXES, 'max_bytes': runtime_mb * 1024 * 1024, 'image_assets': IMAGE_ASSETS}
+    revision = hashlib.sha256(json.dumps([precache, runtime], sort_keys=True).encode('utf-8')).hexdigest()
+    return {
+        'version': MANIFEST_VERSION,
+        'revision': revision[:HASH_LENGTH],
+        'precache': precache,
+        'runtime': runtime,
+    }
+
+
+def render(manifest):
+    return json.dumps(manifest, ensure_ascii=False, indent=1)
+
+
+def inject_revision(source, revision):
+    """service_worker.js の PRECACHE_REVISION の行を書き換えた内容"""
+    if not REVISION_PATTERN.search(source):
+        raise SystemExit(f"❌ {SERVICE_WORKER.name} に PRECACHE_REVISION の行がありません")
+    return REVISION_PATTERN.sub(f"const PRECACHE_REVISION = '{revision}';", source, count=1)
+
+
+def write_manifest(runtime_mb=RUNTIME_MAX_MB):
+    manifest = build_manifest(runtime_mb)
+    changed = write_text_atomic(OUTPUT, render(manifest))
+    worker = SERVICE_WORKER.read_text(encoding='utf-8')
+    write_text_atomic(SERVICE_WORKER, inject_revision(worker, manifest['revision']))
+    total = sum((ROOT / relpath).stat().st_size for relpath in manifest['precache'])
+    print(f"📦 プリキャッシュ一覧: {len(manifest['precache'])} ファイル / {total / 1024 / 1024:.1f} MB"
+          f" (revision {manifest['revision']}) → {OUTPUT.name}{'' if changed else '（変更なし）'}")
+    return manifest
+
+
+def main():
+    ap = argparse.ArgumentParser(description='サービスワーカー用プリキャッシュ一覧の生成')
+    ap.add_argument('--runtime-mb', type=int, default=RUNTIME_MAX_MB,
+                    help=f'表示した画像をキャッシュする上限（MB、既定 {RUNTIME_MAX_MB}）')
+    ap.add_argument('--check', action='store_true', help='一覧が最新か確認するだけ')
+    args = ap.parse_args()
+
+    if args.check:
+        manifest = build_manifest(args.runtime_mb)
+        current = OUTPUT.read_text(encoding='utf-8') if OUTPUT.exists() else None
+        worker = SERVICE_WORKER.read_text(encoding='utf-8')
+        if current != render(manifest) or inject_revision(worker, manifest['revision']) != worker:
+            print(f"❌ {OUTPUT.name} が最新ではありません（再生成してください）")
+            sys.exit(1)
+        print("✅ プリキャッシュ一覧は最新です")
+        return
+
+    write_manifest(args.runtime_mb)
+
+
+if __name__ == '__main__':
+    main()
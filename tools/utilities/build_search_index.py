@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+名前検索インデックス生成ツール
+- data/gen*_pokemon.json と data/pokedex_structures/*.json から名前の転置インデックスを作成
+- 日本語名: NFKC 正規化 + カタカナ→ひらがな に揃えた文字バイグラム
+- 英語名: 小文字化・記号除去した名前の文字バイグラム（語頭記号付きなので前方一致もこれで拾える）
+- 出力: data/bundle/search_index.json（ギャラリーの検索で使用）
+
+検索はバイグラムの一致数で候補を集め、完全一致 > 前方一致 > 部分一致 の順に順位付けします。
+それらが1件も無いときだけ類似（Dice係数）で探すので、1文字違いの入力ミス（例: ぴかちゆう）も拾えます
+（「ぴか」で ぴちゅー や ぽっぽ まで絞り込み結果に混ざらないように）。
+
+使い方:
+  python tools/utilities/build_search_index.py
+  python tools/utilities/build_search_index.py --query ぴかちゅ
+"""
+
+import argparse
+import json
+import re
+import sys
+import unicodedata
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from json_store import write_text_atomic  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[2]
+DATA_DIR = ROOT / 'data'
+STRUCT_DIR = DATA_DIR / 'pokedex_structures'
+OUT = DATA_DIR / 'bundle' / 'search_index.json'
+
+INDEX_VERSION = 1
+# 語頭を表す記号（「^ぴ」で1文字目からの前方一致を表現）
+BOUNDARY = '^'
+# 類似候補として残す Dice 係数の下限（完全一致・前方一致・部分一致が無いときだけ使う）
+MIN_SIMILARITY = 0.4
+
+# 順位付けの基礎点
+SCORE_EXACT = 3.0
+SCORE_PREFIX = 2.0
+SCORE_SUBSTRING = 1.0
+
+
+def normalize_ja(text):
+    """NFKC 正規化 + カタカナをひらがなに + 空白除去"""
+    n = unicodedata.normalize('NFKC', text or '').lower()
+    n = ''.join(chr(ord(c) - 0x60) if 'ァ' <= c <= 'ヶ' else c for c in n)
+    return re.sub(r'\s+', '', n)
+
+
+def normalize_en(text):
+    """小文字化して英数字以外を除去（mr-mime → mrmime）"""
+    n = unicodedata.normalize('NFKC', text or '').lower()
+    return re.sub(r'[^0-9a-z]', '', n)
+
+
+def bigrams(text):
+    """語頭記号付きバイグラム（重複なし、出現順）"""
+    padded = BOUNDARY + text
+    seen = []
+    for i in range(len(padded) - 1):
+        gram = padded[i:i + 2]
+        if gram not in seen:
+            seen.append(gram)
+    return seen
+
+
+def load_documents():
+    """[(pokemon_id, [日本語名...], 英語名)] を全国図鑑番号順で返す"""
+    docs = {}
+    for gen in range(1, 10):
+        path = DATA_DIR / f'gen{gen}_pokemon.json'
+        if not path.exists():
+            continue
+        for pid_str, info in json.loads(path.read_text(encoding='utf-8')).items():
+            docs[int(pid_str)] = ([info.get('name')], info.get('name_en'))
+
+    # 図鑑ごとの表記ゆれ（別名）も同じポケモンの名前として登録
+    for path in sorted(STRUCT_DIR.glob('*.json')):
+        dex = json.loads(path.read_text(encoding='utf-8'))
+        for entry in dex.get('pokemon', {}).values():
+            pid = entry.get('pokemon_id')
+            name = entry.get('name')
+            if pid is None or not name or int(pid) not in docs:
+                continue
+            names = docs[int(pid)][0]
+            if name not in names:
+                names.append(name)
+
+    return [(pid, [n for n in names if n], name_en) for pid, (names, name_en) in sorted(docs.items())]
+
+
+def build_index(documents):
+    ja_postings = {}
+    en_postings = {}
+    docs = []
+    for doc_index, (pid, names, name_en) in enumerate(documents):
+        normalized_names = []
+        for name in names:
+            n = normalize_ja(name)
+            if n and n not in normalized_names:
+                normalized_names.append(n)
+        en = normalize_en(name_en)
+        docs.append([pid, names[0] if names else '', name_en or '', normalized_names, en])
+
+        for n in normalized_names:
+            for gram in bigrams(n):
+                postings = ja_postings.setdefault(gram, [])
+                if not postings or postings[-1] != doc_index:
+                    postings.append(doc_index)
+        if en:
+            for gram in bigrams(en):
+                postings = en_postings.setdefault(gram, [])
+                if not postings or postings[-1] != doc_index:
+                    postings.append(doc_index)
+
+    return {
+        'version': INDEX_VERSION,
+        'boundary': BOUNDARY,
+        'min_similarity': MIN_SIMILARITY,
+        # [全国No., 表示名, 英語名, [正規化済み日本語名...], 正規化済み英語名]
+        'docs': docs,
+        'ja_bigrams': dict(sorted(ja_postings.items())),
+        'en_bigrams': dict(sorted(en_postings.items())),
+    }
+
+
+def score_name(query, name):
+    """1つの正規化済み名前に対する得点（完全一致・前方一致・部分一致。0 は不一致）"""
+    if not query or not name:
+        return 0.0
+    if name == query:
+        return SCORE_EXACT + 1.0
+    if name.startswith(query):
+        return SCORE_PREFIX + len(query) / len(name)
+    if query in name:
+        return SCORE_SUBSTRING + len(query) / len(name)
+    return 0.0
+
+
+def similarity(query, name):
+    """入力ミス用の類似度（Dice係数。MIN_SIMILARITY 未満は 0）"""
+    if not query or not name:
+        return 0.0
+    q_grams = set(bigrams(query))
+    n_grams = set(bigrams(name))
+    value = 2 * len(q_grams & n_grams) / (len(q_grams) + len(n_grams))
+    return value if value >= MIN_SIMILARITY else 0.0
+
+
+def search(index, query, limit=20):
+    """順位付きの検索結果 [(得点, 全国No., 表示名)] を返す"""
+    q_ja = normalize_ja(query)
+    q_en = normalize_en(query)
+    candidates = set()
+
+    for gram in bigrams(q_ja):
+        candidates.update(index['ja_bigrams'].get(gram, ()))
+    if q_en:
+        for gram in bigrams(q_en):
+            candidates.update(index['en_bigrams'].get(gram, ()))
+    if len(q_ja) == 1:
+        # 1文字検索はバイグラムが語頭分しか無いので部分一致を総当たり（候補は少数）
+        candidates.update(i for i, doc in enumerate(index['docs']) if any(q_ja in n for n in doc[3]))
+
+    # 完全一致・前方一致・部分一致が1件でもあれば類似は使わない（近いだけの別名を絞り込みに混ぜない）
+    results = []
+    for scorer in (score_name, similarity):
+        for doc_index in candidates:
+            pid, name, _, ja_names, en = index['docs'][doc_index]
+            score = max([scorer(q_ja, n) for n in ja_names] + [scorer(q_en, en)])
+            if score > 0:
+                results.append((score, pid, name))
+        if results:
+            break
+    results.sort(key=lambda r: (-r[0], r[1]))
+    return results[:limit]
+
+
+def write_index():
+    """インデックスを生成して data/bundle/search_index.json に保存"""
+    documents = load_documents()
+    index = build_index(documents)
+    text = json.dumps(index, ensure_ascii=False, separators=(',', ':'))
+    changed = write_text_atomic(OUT, text)
+    print(f"検索インデックスを生成しました: {OUT} "
+          f"({len(documents)}件 / 日本語バイグラム {len(index['ja_bigrams'])} / "
+          f"英語バイグラム {len(index['en_bigrams'])} / {len(text.encode('utf-8')):,} bytes)"
+          f"{'' if changed else '（変更なし）'}")
+    return index
+
+
+def main():
+    ap = argparse.ArgumentParser(description='名前検索インデックスの生成・検索')
+    ap.add_argument('--query', help='生成後にこの語で検索して結果を表示')
+    args = ap.parse_args()
+
+    index = write_index()
+
+    if args.query:
+        for score, pid, name in search(index, args.query):
+            print(f"  {score:5.2f}  #{pid:04d} {name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+図鑑ごとのスプライトアトラス（カード画像をまとめた1枚絵）生成ツール
+- data/pokedex_structures/{図鑑ID}.json の登録順に、通常画像を 128px（1x）/ 256px（2x）のマスへ詰めて WebP にまとめる
+  （1ページ最大 10×10 = 100 匹。全国図鑑 1025 匹でも 11 ページ = 11 リクエスト）
+- 縮小版（build_image_derivatives.py の PNG）があればそれを使い、無ければ元画像から縮小
+- 座標は pokemon_images/derived/atlas/{図鑑ID}.json に出力し、ギャラリーは CSS の background-position でカードを描画
+- ページ画像のファイル名には内容ハッシュが入る。入力（登録ポケモン・元画像ハッシュ・設定）が変わらない図鑑は作り直さない
+
+{図鑑ID}.json:
+  {"version": 1, "dex": 21, "key": "...", "cell": 128, "columns": 10,
+   "pages": [{"width": 1280, "height": 1280,
+              "1x": "pokemon_images/derived/atlas/21.0.1x.0123456789.webp", "2x": "..."}],
+   "sprites": {"84": [0, 0, 0], "85": [0, 128, 0], ...}}
+  sprites の値は [ページ番号, x, y]（1x の座標。2x は同じ位置の2倍）
+
+使い方:
+  python tools/utilities/build_sprite_atlas.py
+  python tools/utilities/build_sprite_atlas.py 0 21          # 図鑑ID指定
+  python tools/utilities/build_sprite_atlas.py --force
+
+依存:
+  pip install pillow
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from json_store import write_text_atomic  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[2]
+STRUCTURES_DIR = ROOT / 'data' / 'pokedex_structures'
+IMAGE_DIR = ROOT / 'pokemon_images'
+DERIVED_MANIFEST = IMAGE_DIR / 'derived' / 'manifest.json'
+ATLAS_DIR = IMAGE_DIR / 'derived' / 'atlas'
+ATLAS_VERSION = 1
+
+CELL = 128            # 1x のマスの大きさ（カード画像の表示サイズ 120px 以上）
+SCALES = (1, 2)
+COLUMNS = 10
+ROWS = 10
+WEBP_OPTIONS = {'quality': 80, 'method': 4}
+
+
+def load_derivatives():
+    """build_image_derivatives.py の manifest（無ければ None）"""
+    try:
+        manifest = json.loads(DERIVED_MANIFEST.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get('version') == 1 else None
+
+
+def dex_ids():
+    return sorted(int(p.stem) for p in STRUCTURES_DIR.glob('*.json') if p.stem.isdigit())
+
+
+def dex_pokemon_ids(dex):
+    """図鑑番号順の全国No.（重複・pokemon_id の無い項目は除く）"""
+    ids = []
+    for _, entry in sorted(dex['pokemon'].items(), key=lambda item: int(item[0])):
+        pokemon_id = entry.get('pokemon_id')
+        if pokemon_id is not None and int(pokemon_id) not in ids:
+            ids.append(int(pokemon_id))
+    return ids
+
+
+def sprite_sources(pokemon_id, derivatives):
+    """全国No. → {倍率: 画像パス}。縮小版 PNG が無いサイズは元画像"""
+    stem = f'{pokemon_id:03d}'
+    original = IMAGE_DIR / 'normal' / f'{stem}.png'
+    if not original.exists() or original.stat().st_size == 0:
+        return None
+    sources = {scale: original for scale in SCALES}
+    entry = derivatives and derivatives['images'].get(f'normal/{stem}')
+    if entry and 'png' in derivatives['formats']:
+        digest, _, _, sizes = entry
+        for scale in SCALES:
+            if CELL * scale in sizes:
+                path = ROOT / derivatives['path'].format(
+                    size=CELL * scale, folder='normal', stem=stem, hash=digest, format='png')
+                if path.exists():
+                    sources[scale] = path
+    return sources
+
+
+def input_key(pokemon_ids, sources):
+    digest = hashlib.sha256(json.dumps([ATLAS_VERSION, CELL, SCALES, COLUMNS, ROWS, WEBP_OPTIONS]).encode())
+    for pokemon_id in pokemon_ids:
+        for scale in SCALES:
+            st = sources[pokemon_id][scale].stat()
+            digest.update(f'{pokemon_id}:{scale}:{sources[pokemon_id][scale].name}:{st.st_size}:{st.st_mtime_ns};'.encode())
+    return digest.hexdigest()[:16]
+
+
+def fit_cell(path, size):
+    """画像をマスの大きさに縮小し、中央に置いた透明背景のマス画像を返す"""
+    with Image.open(path) as im:
+        im = im.convert('RGBA')
+        if max(im.size) != size:
+            im.thumbnail((size, size), Image.LANCZOS)
+        cell = Image.new('RGBA', (size, size))
+        cell.paste(im, ((size - im.width) // 2, (size - im.height) // 2))
+    return cell
+
+
+def encode_page(pokemon_ids, paths, scale):
+    size = CELL * scale
+    rows = (len(pokemon_ids) + COLUMNS - 1) // COLUMNS
+    columns = min(COLUMNS, len(pokemon_ids))
+    sheet = Image.new('RGBA', (columns * size, rows * size))
+    for i, pokemon_id in enumerate(pokemon_ids):
+        sheet.paste(fit_cell(paths[pokemon_id], size), ((i % COLUMNS) * size, (i // COLUMNS) * size))
+    buf = io.BytesIO()
+    sheet.save(buf, format='WEBP', **WEBP_OPTIONS)
+    return buf.getvalue(), sheet.size
+
+
+def write_bytes_atomic(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def build_dex(dex_id, derivatives, force=False):
+    """1図鑑ぶんのアトラスを作る（ワーカープロセスで実行）。(図鑑ID, 匹数, ページ数, 作り直したか) を返す"""
+    dex = json.loads((STRUCTURES_DIR / f'{dex_id}.json').read_text(encoding='utf-8'))
+    sources = {}
+    for pokemon_id in dex_pokemon_ids(dex):
+        found = sprite_sources(pokemon_id, derivatives)
+        if found:
+            sources[pokemon_id] = found
+    pokemon_ids = list(sources)
+    key = input_key(pokemon_ids, sources)
+
+    out = ATLAS_DIR / f'{dex_id}.json'
+    if not force and out.exists():
+        try:
+            previous = json.loads(out.read_text(encoding='utf-8'))
+        except ValueError:
+            previous = {}
+        if previous.get('key') == key and all(
+                (ROOT / page[f'{scale}x']).exists() for page in previous.get('pages', []) for scale in SCALES):
+            return dex_id, len(pokemon_ids), len(previous['pages']), False
+
+    per_page = COLUMNS * ROWS
+    pages = []
+    sprites = {}
+    for page_no, start in enumerate(range(0, len(pokemon_ids), per_page)):
+        chunk = pokemon_ids[start:start + per_page]
+        page = {'width': 0, 'height': 0}
+        for scale in SCALES:
+            data, (width, height) = encode_page(chunk, {i: sources[i][scale] for i in chunk}, scale)
+            name = f'{dex_id}.{page_no}.{scale}x.{hashlib.sha256(data).hexdigest()[:10]}.webp'
+            write_bytes_atomic(ATLAS_DIR / name, data)
+            page[f'{scale}x'] = (ATLAS_DIR / name).relative_to(ROOT).as_posix()
+            if scale == 1:
+                page['width'], page['height'] = width, height
+        pages.append(page)
+        for i, pokemon_id in enumerate(chunk):
+            sprites[str(pokemon_id)] = [page_no, (i % COLUMNS) * CELL, (i // COLUMNS) * CELL]
+
+    atlas = {
+        'version': ATLAS_VERSION,
+        'dex': dex_id,
+        'key': key,
+        'cell': CELL,
+        'columns': COLUMNS,
+        'pages': pages,
+        'sprites': sprites,
+    }
+    write_text_atomic(out, json.dumps(atlas, ensure_ascii=False, separators=(',', ':')))
+    return dex_id, len(pokemon_ids), len(pages), True
+
+
+def prune(dex_id_list):
+    """どの座標 JSON からも参照されないページ画像と、図鑑が無くなった座標 JSON を削除"""
+    referenced = set()
+    removed = 0
+    for path in ATLAS_DIR.glob('*.json'):
+        if not path.stem.isdigit() or int(path.stem) not in dex_id_list:
+            path.unlink()
+            removed += 1
+            continue
+        atlas = json.loads(path.read_text(encoding='utf-8'))
+        referenced.update(ROOT / page[f'{s}x'] for page in atlas['pages'] for s in SCALES)
+    for path in ATLAS_DIR.glob('*.webp'):
+        if path not in referenced:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def build(targets=None, force=False, jobs=None):
+    started = time.perf_counter()
+    all_ids = dex_ids()
+    targets = [d for d in (targets or all_ids) if d in all_ids]
+    derivatives = load_derivatives()
+    if derivatives is None:
+        print("ℹ️ 縮小版の manifest が無いため元画像から縮小します（build_image_derivatives.py で高速化）")
+
+    print(f"🧩 スプライトアトラス: {len(targets)} 図鑑")
+    rebuilt = 0
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        futures = [pool.submit(build_dex, dex_id, derivatives, force) for dex_id in targets]
+        for future in futures:
+            dex_id, count, page_count, changed = future.result()
+            rebuilt += changed
+            if changed:
+                print(f"  ✅ 図鑑 {dex_id}: {count} 匹 → {page_count} ページ")
+    removed = prune(set(all_ids)) if ATLAS_DIR.exists() else 0
+
+    print(f"✅ 作成 {rebuilt} / 変更なし {len(targets) - rebuilt} 図鑑 / 削除 {removed} ファイル / "
+          f"{time.perf_counter() - started:.1f}秒 → {ATLAS_DIR.relative_to(ROOT).as_posix()}/")
+
+
+def main():
+    ap = argparse.ArgumentParser(description='図鑑ごとのスプライトアトラス生成')
+    ap.add_argument('dex_ids', nargs='*', type=int, help='対象の図鑑ID（省略時は全図鑑）')
+    ap.add_argument('--force', action='store_true', help='変更が無くても作り直す')
+    ap.add_argument('--jobs', type=int, default=None, help='並列プロセス数（既定: CPU コア数）')
+    args = ap.parse_args()
+
+    build(args.dex_ids or None, args.force, args.jobs)
+
+
+if __name__ == '__main__':
+    main()
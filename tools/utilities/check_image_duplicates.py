@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+画像の重複・取り違え検出ツール（知覚ハッシュ）
+- pokemon_images/ の全画像について aHash / dHash / pHash（各64bit）と色の分布（不透明部分の RGB 64色ヒストグラム）を計算
+  （画像の読み込みは CPU コア数ぶん並列、ハッシュ計算と全ペア比較は NumPy でまとめて実行）
+- 結果はファイルの SHA-256 ごとに .cache/image_hashes.json に保存し、内容が同じ画像は再計算しない
+- 次を報告:
+    完全一致       … 内容が同じファイル（SHA-256 が同じ）
+                     ※ 同じポケモンの性別差分・patterns が通常画像（色違い）と同じなのは想定内として別に件数だけ表示
+    色違い＝通常   … 色違い画像が通常画像とほぼ同じ（色違いの取り違え）
+    別ポケモン類似 … 全国No. が違うのにほぼ同じ画像（別のポケモンの画像を保存した可能性）
+    同ポケモン類似 … 同じポケモンの地方・メガ画像（forms / mega_evolutions）が通常画像とほぼ同じ（フォルムの取り違え）
+                     ※ 性別差分と patterns（基本の姿を含む）は通常画像と似ていて当然なので対象外
+    サイズ・透過   … 読めない・正方形でない・同じフォルダの大多数と違うサイズ・透過なし・全面不透明・全面透明
+
+「ほぼ同じ」は aHash / dHash / pHash のハミング距離がすべて --threshold 以下で、
+色の分布の差（ヒストグラムの L1 距離、0〜2）が --color 以下のもの。
+形が同じで色だけ違う本来の色違いは、色の分布の差で除外される。
+初回（キャッシュなし）は画像の展開が大半の時間を占める。2回目以降は変わった画像だけを読み直すので数秒で終わる。
+
+使い方:
+  python tools/utilities/check_image_duplicates.py
+  python tools/utilities/check_image_duplicates.py --threshold 4 --color 0.1 --limit 0   # 全件表示
+  python tools/utilities/check_image_duplicates.py --json report.json --strict   # 問題があれば終了コード1
+
+依存:
+  pip install pillow numpy
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, UnidentifiedImageError
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from json_store import write_text_atomic  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[2]
+IMAGE_DIR = ROOT / 'pokemon_images'
+CACHE_FILE = ROOT / '.cache' / 'image_hashes.json'
+CACHE_VERSION = 2
+
+FOLDERS = ('normal', 'shinies', 'forms', 'patterns', 'mega_evolutions', 'gender_differences')
+ID_PATTERN = re.compile(r'^(\d+)(?:[_.]|$)')
+SHINY_SUFFIX = '_shiny'
+# 通常画像と似ていたら取り違えを疑うフォルダの組
+FORM_VS_NORMAL = ({'normal', 'forms'}, {'normal', 'mega_evolutions'})
+# 同じポケモンの通常画像（色違い）と中身が同じでも想定内のフォルダ（オス＝通常、基本の姿のパターンなど）
+SAME_AS_NORMAL_FOLDERS = {'gender_differences', 'patterns'}
+
+HASH_SIZE = 8          # 8×8 = 64bit
+DCT_SIZE = 32          # pHash は 32×32 の DCT の低周波 8×8
+COLOR_LEVELS = 4       # 色の分布は R・G・B 各4段階 = 64色
+WORK_SIZE = 128        # 特徴の計算はこの大きさ程度に縮小してから行う
+DEFAULT_THRESHOLD = 6
+DEFAULT_COLOR = 0.15
+DEFAULT_LIMIT = 20
+
+
+def sha256_of(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_cache():
+    try:
+        cache = json.loads(CACHE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {'version': CACHE_VERSION, 'files': {}, 'features': {}}
+    if cache.get('version') != CACHE_VERSION:
+        return {'version': CACHE_VERSION, 'files': {}, 'features': {}}
+    return cache
+
+
+def read_features(path):
+    """画像1枚の縮小データと透過の情報（ワーカープロセスで実行）。読めなければ None"""
+    try:
+        with Image.open(path) as im:
+            im.load()
+            size = im.size
+            mode = im.mode
+            has_alpha = mode in ('RGBA', 'LA', 'PA') or (mode == 'P' and 'transparency' in im.info)
+            rgba = im.convert('RGBA')
+    except (UnidentifiedImageError, OSError):
+        return None
+
+    rgba = rgba.reduce(max(1, min(size) // WORK_SIZE))
+    pixels = np.asarray(rgba)
+    alpha = pixels[..., 3]
+    visible = pixels[alpha > 127][:, :3] // (256 // COLOR_LEVELS)
+    bins = (visible[:, 0].astype(np.int32) * COLOR_LEVELS + visible[:, 1]) * COLOR_LEVELS + visible[:, 2]
+    histogram = np.bincount(bins, minlength=COLOR_LEVELS ** 3) / max(1, len(bins))
+    # 透過部分は白として扱う（背景色の違いでハッシュが変わらないように）
+    flat = Image.new('RGBA', rgba.size, (255, 255, 255, 255))
+    flat.alpha_composite(rgba)
+    rgb = flat.convert('RGB')
+    gray = rgb.convert('L')
+    return {
+        'size': list(size),
+        'mode': mode,
+        'has_alpha': has_alpha,
+        'opaque': float((alpha == 255).mean()),
+        'visible': float((alpha > 0).mean()),
+        'gray': np.asarray(gray.resize((DCT_SIZE, DCT_SIZE), Image.LANCZOS), dtype=np.uint8).tobytes().hex(),
+        'grad': np.asarray(gray.resize((HASH_SIZE + 1, HASH_SIZE), Image.LANCZOS), dtype=np.uint8).tobytes().hex(),
+        'color': [round(float(v), 4) for v in histogram],
+    }
+
+
+def dct_matrix(n):
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    m = np.cos(np.pi * (2 * i + 1) * k / (2 * n)) * np.sqrt(2 / n)
+    m[0] /= np.sqrt(2)
+    return m
+
+
+def pack_bits(bits):
+    """(N, 64) の bool → (N,) の uint64"""
+    weights = (np.uint64(1) << np.arange(64, dtype=np.uint64))
+    return (bits.astype(np.uint64) * weights).sum(axis=1, dtype=np.uint64)
+
+
+def compute_hashes(gray, grad):
+    """縮小済みの画像をまとめてハッシュ化。gray: (N, 32, 32), grad: (N, 8, 9) → (aHash, dHash, pHash)"""
+    n = len(gray)
+    gray = gray.astype(np.float64)
+    # aHash: 32×32 を 4×4 ブロック平均で 8×8 にして平均値と比較
+    small = gray.reshape(n, HASH_SIZE, DCT_SIZE // HASH_SIZE, HASH_SIZE, DCT_SIZE // HASH_SIZE).mean(axis=(2, 4))
+    ahash = pack_bits((small > small.mean(axis=(1, 2), keepdims=True)).reshape(n, -1))
+    # dHash: 横方向の明暗の増減
+    dhash = pack_bits((grad[:, :, 1:] > grad[:, :, :-1]).reshape(n, -1))
+    # pHash: 2次元 DCT の低周波 8×8（直流成分を除いた中央値と比較）
+    d = dct_matrix(DCT_SIZE)
+    coeffs = (d @ gray @ d.T)[:, :HASH_SIZE, :HASH_SIZE].reshape(n, -1)
+    median = np.median(coeffs[:, 1:], axis=1, keepdims=True)
+    phash = pack_bits(coeffs > median)
+    return ahash, dhash, phash
+
+
+def popcount(values):
+    """uint64 配列の立っているビット数"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(values)
+    table = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+    return table[values.view(np.uint8).reshape(*values.shape, 8)].sum(axis=-1)
+
+
+def scan(jobs=None):
+    """全画像の特徴を集める。戻り値: ([(相対パス, SHA-256)], {SHA-256: 特徴 or None}, 再計算した枚数)"""
+    cache = load_cache()
+    files_cache = cache['files']
+    features = cache['features']
+
+    entries = []
+    for folder in FOLDERS:
+        for path in sorted((IMAGE_DIR / folder).glob('*.png')):
+            relpath = path.relative_to(IMAGE_DIR).as_posix()
+            st = path.stat()
+            cached = files_cache.get(relpath)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                digest = cached[2]
+            else:
+                digest = sha256_of(path)
+                files_cache[relpath] = [st.st_mtime_ns, st.st_size, digest]
+            entries.append((relpath, digest))
+
+    pending = {}
+    for relpath, digest in entries:
+        if digest not in features and digest not in pending:
+            pending[digest] = IMAGE_DIR / relpath
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+            for digest, result in zip(pending, pool.map(read_features, pending.values(), chunksize=16)):
+                features[digest] = result
+
+    live = {digest for _, digest in entries}
+    cache['files'] = {k: v for k, v in files_cache.items() if (IMAGE_DIR / k).exists()}
+    cache['features'] = {k: v for k, v in features.items() if k in live}
+    write_text_atomic(CACHE_FILE, json.dumps(cache, separators=(',', ':')))
+    return entries, cache['features'], len(pending)
+
+
+def shiny_of(relpath):
+    folder, name = relpath.split('/', 1)
+    if folder == 'normal':
+        return f'shinies/{name[:-4]}{SHINY_SUFFIX}.png'
+    return f'{relpath[:-4]}{SHINY_SUFFIX}.png'
+
+
+def pokemon_id_of(relpath):
+    match = ID_PATTERN.match(relpath.split('/', 1)[1])
+    return int(match.group(1)) if match else None
+
+
+def find_anomalies(entries, features):
+    anomalies = []
+    by_folder = defaultdict(Counter)
+    for relpath, digest in entries:
+        info = features.get(digest)
+        if info:
+            by_folder[relpath.split('/')[0]][tuple(info['size'])] += 1
+    common_size = {folder: sizes.most_common(1)[0][0] for folder, sizes in by_folder.items()}
+    alpha_share = defaultdict(list)
+    for relpath, digest in entries:
+        info = features.get(digest)
+        if info:
+            alpha_share[relpath.split('/')[0]].append(info['has_alpha'])
+    mostly_alpha = {folder: sum(v) / len(v) >= 0.5 for folder, v in alpha_share.items()}
+
+    for relpath, digest in entries:
+        info = features.get(digest)
+        folder = relpath.split('/')[0]
+        if info is None:
+            anomalies.append((relpath, '画像として読めない（0バイト・壊れたファイル）'))
+            continue
+        width, height = info['size']
+        if width != height:
+            anomalies.append((relpath, f'正方形でない ({width}×{height})'))
+        elif (width, height) != common_size[folder] and width < common_size[folder][0]:
+            anomalies.append((relpath, f'{folder} の大多数 ({common_size[folder][0]}px) より小さい ({width}px)'))
+        if not info['has_alpha'] and mostly_alpha[folder]:
+            anomalies.append((relpath, f'透過なし（{info["mode"]}）'))
+        elif info['has_alpha'] and info['opaque'] >= 0.999:
+            anomalies.append((relpath, '透過チャンネルはあるが全面不透明（背景が残っている）'))
+        if info['visible'] == 0:
+            anomalies.append((relpath, '全面透明'))
+    return anomalies
+
+
+def expected_duplicate(paths):
+    """同じポケモンで、通常画像・色違い以外はすべて性別差分か patterns の完全一致グループか"""
+    folders = [path.split('/')[0] for path in paths]
+    return (len({pokemon_id_of(path) for path in paths}) == 1
+            and sum(folder in ('normal', 'shinies') for folder in folders) <= 1
+            and all(folder in SAME_AS_NORMAL_FOLDERS for folder in folders if folder not in ('normal', 'shinies')))
+
+
+def find_similar(entries, features, threshold, color_threshold):
+    """(完全一致グループ, 想定内の完全一致グループ, 色違い＝通常, 別ポケモン類似, 同ポケモン類似)"""
+    by_digest = defaultdict(list)
+    for relpath, digest in entries:
+        if features.get(digest):
+            by_digest[digest].append(relpath)
+    exact, exact_expected = [], []
+    for paths in by_digest.values():
+        if len(paths) > 1:
+            (exact_expected if expected_duplicate(paths) else exact).append(sorted(paths))
+
+    # 内容が同じファイルは代表1枚で比較
+    digests = list(by_digest)
+    gray = np.stack([np.frombuffer(bytes.fromhex(features[d]['gray']), np.uint8).reshape(DCT_SIZE, DCT_SIZE)
+                     for d in digests])
+    grad = np.stack([np.frombuffer(bytes.fromhex(features[d]['grad']), np.uint8).reshape(HASH_SIZE, HASH_SIZE + 1)
+                     for d in digests]).astype(np.int16)
+    color = np.array([features[d]['color'] for d in digests])
+    ahash, dhash, phash = compute_hashes(gray, grad)
+
+    # 全ペアのハミング距離（上三角のみ）。3種類すべてが近いものだけ色を比べる
+    near = np.ones((len(digests), len(digests)), dtype=bool)
+    for values in (phash, dhash, ahash):
+        near &= popcount(values[:, None] ^ values[None, :]) <= threshold
+    candidates = np.argwhere(np.triu(near, k=1))
+    color_diff = np.abs(color[candidates[:, 0]] - color[candidates[:, 1]]).sum(axis=1)
+
+    shiny_like_normal, cross_species, same_species = [], [], []
+    for (i, j), diff in zip(candidates, color_diff):
+        if diff > color_threshold:
+            continue
+        distances = [int(popcount(values[i] ^ values[j])) for values in (ahash, dhash, phash)]
+        for a in by_digest[digests[i]]:
+            for b in by_digest[digests[j]]:
+                a, b = sorted((a, b))
+                row = (a, b, *distances, round(float(diff), 3))
+                if shiny_of(a) == b or shiny_of(b) == a:
+                    shiny_like_normal.append(row)
+                elif pokemon_id_of(a) != pokemon_id_of(b):
+                    cross_species.append(row)
+                elif {a.split('/')[0], b.split('/')[0]} in FORM_VS_NORMAL:
+                    same_species.append(row)
+    return exact, exact_expected, sorted(shiny_like_normal), sorted(cross_species), sorted(same_species)
+
+
+def print_section(title, lines, limit):
+    print(f"\n{title}: {len(lines)} 件")
+    shown = lines if not limit else lines[:limit]
+    for line in shown:
+        print(f"  {line}")
+    if len(shown) < len(lines):
+        print(f"  ...ほか {len(lines) - len(shown)} 件（--limit 0 で全件表示）")
+
+
+def pair_lines(rows):
+    return [f"{a} ≈ {b}  (aHash {ad} / dHash {dd} / pHash {pd} / 色 {cd})" for a, b, ad, dd, pd, cd in rows]
+
+
+def main():
+    ap = argparse.ArgumentParser(description='画像の重複・取り違え検出（知覚ハッシュ）')
+    ap.add_argument('--threshold', type=int, default=DEFAULT_THRESHOLD, help='pHash・dHash のハミング距離の上限')
+    ap.add_argument('--color', type=float, default=DEFAULT_COLOR, help='色の分布の差（L1 距離、0〜2）の上限')
+    ap.add_argument('--limit', type=int, default=DEFAULT_LIMIT, help='項目ごとの表示件数（0 で全件）')
+    ap.add_argument('--jobs', type=int, default=None, help='並列プロセス数（既定: CPU コア数）')
+    ap.add_argument('--json', type=Path, help='結果を JSON で保存')
+    ap.add_argument('--strict', action='store_true', help='問題が見つかったら終了コード1')
+    args = ap.parse_args()
+
+    started = time.perf_counter()
+    entries, features, computed = scan(args.jobs)
+    scanned = time.perf_counter()
+    exact, exact_expected, shiny_like_normal, cross_species, same_species = find_similar(
+        entries, features, args.threshold, args.color)
+    anomalies = find_anomalies(entries, features)
+    finished = time.perf_counter()
+
+    print(f"🔍 画像 {len(entries)} 枚（うち {computed} 枚を新たに解析）: "
+          f"読み込み {scanned - started:.1f}秒 / 比較 {finished - scanned:.1f}秒")
+    print_section("完全一致", [' = '.join(paths) for paths in exact], args.limit)
+    print(f"  ℹ️ 性別差分・patterns が通常画像（色違い）と同じもの {len(exact_expected)} 件は想定内として除外（--json に記録）")
+    print_section("色違い＝通常", pair_lines(shiny_like_normal), args.limit)
+    print_section("別ポケモン類似", pair_lines(cross_species), args.limit)
+    print_section("同ポケモン類似", pair_lines(same_species), args.limit)
+    print_section("サイズ・透過", [f"{relpath}: {message}" for relpath, message in anomalies], args.limit)
+
+    if args.json:
+        columns = ('a', 'b', 'ahash', 'dhash', 'phash', 'color')
+        report = {
+            'exact': exact,
+            'exact_expected': exact_expected,
+            'shiny_like_normal': [dict(zip(columns, row)) for row in shiny_like_normal],
+            'cross_species': [dict(zip(columns, row)) for row in cross_species],
+            'same_species': [dict(zip(columns, row)) for row in same_species],
+            'anomalies': [{'path': p, 'message': m} for p, m in anomalies],
+        }
+        write_text_atomic(args.json, json.dumps(report, ensure_ascii=False, indent=2))
+        print(f"\n💾 {args.json}")
+
+    if args.strict and (exact or shiny_like_normal or cross_species or same_species or anomalies):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
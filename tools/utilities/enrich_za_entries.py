@@ -1,52 +1,16 @@
 import json
 import os
 import re
+import sys
 import unicodedata
-from typing import Dict, Tuple, Optional, List
+from pathlib import Path
+from typing import Dict
 
-DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data')
-GEN_FILES = [
-    'gen1_pokemon.json',
-    'gen2_pokemon.json',
-    'gen3_pokemon.json',
-    'gen4_pokemon.json',
-    'gen5_pokemon.json',
-    'gen6_pokemon.json',
-    'gen7_pokemon.json',
-    'gen8_pokemon.json',
-    'gen9_pokemon.json',
-]
-
-def load_gen_data() -> List[Dict]:
-    datasets = []
-    for fname in GEN_FILES:
-        path = os.path.join(DATA_DIR, fname)
-        if os.path.exists(path):
-            with open(path, 'r', encoding='utf-8') as f:
-                try:
-                    datasets.append(json.load(f))
-                except json.JSONDecodeError:
-                    pass
-    return datasets
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-# Build name mappings: Japanese -> (id, english)
-# Assume each dataset is a dict keyed by national dex number or similar, with fields name/name_en/pokemon_id
+import pokedex_core  # noqa: E402
 
-def build_name_index(datasets: List[Dict]) -> Dict[str, Tuple[Optional[int], Optional[str]]]:
-    index: Dict[str, Tuple[Optional[int], Optional[str]]] = {}
-    for data in datasets:
-        for key, entry in data.items():
-            name = entry.get('name') or entry.get('name_ja')
-            name_en = entry.get('name_en')
-            pid = entry.get('pokemon_id') or entry.get('id')
-            if not name:
-                continue
-            # Normalize common forms parentheses to match gallery style
-            normalized_name = normalize_form_name(name)
-            # Prefer first seen
-            if normalized_name not in index:
-                index[normalized_name] = (pid, name_en)
-    return index
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data')
 
 FORM_REPLACEMENTS = [
     (r"（オスのすがた）", "(Male)"),
@@ -65,7 +29,7 @@ def normalize_form_name(name: str) -> str:
     return n
 
 
-def enrich_23(za_path: str, index: Dict[str, Tuple[Optional[int], Optional[str]]]) -> Dict:
+def enrich_23(za_path: str, pokedex: pokedex_core.Pokedex) -> Dict:
     with open(za_path, 'r', encoding='utf-8') as f:
         za = json.load(f)
     pokemon = za.get('pokemon', {})
@@ -77,10 +41,11 @@ def enrich_23(za_path: str, index: Dict[str, Tuple[Optional[int], Optional[str]]
         # Skip regional forms by prefix
         if any(name.startswith(pref) for pref in REGIONAL_PREFIXES):
             continue
-        normalized = normalize_form_name(name)
-        pid, en = index.get(normalized, (None, None))
-        if pid is not None:
-            entry['pokemon_id'] = pid
+        pid = pokedex.id_by_name(normalize_form_name(name))
+        if pid is None:
+            continue
+        entry['pokemon_id'] = pid
+        en = pokedex.get(pid).get('name_en')
         if en is not None:
             entry['name_en'] = en
     return za
@@ -88,9 +53,7 @@ def enrich_23(za_path: str, index: Dict[str, Tuple[Optional[int], Optional[str]]
 
 def main():
     za_path = os.path.join(DATA_DIR, 'pokedex_structures', '23.json')
-    datasets = load_gen_data()
-    index = build_name_index(datasets)
-    enriched = enrich_23(za_path, index)
+    enriched = enrich_23(za_path, pokedex_core.load())
     with open(za_path, 'w', encoding='utf-8') as f:
         json.dump(enriched, f, ensure_ascii=False, indent=2)
     print(f"Enriched {za_path}")
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PNG 可逆再圧縮ツール
+- pokemon_images/ の PNG を画素を変えずに作り直し、元より小さくなったものだけ置き換える
+    - 256色以下ならパレット（透過は tRNS）に変換（16色以下などはさらに少ないビット数）
+    - 全面不透明なら透過チャンネルを削除
+    - テキスト・時刻・EXIF などのメタデータを削除（gAMA / cHRM は sRGB 相当の 0.45455 のときだけ削除）
+    - zlib 最大圧縮（--zopfli で zopflipng による再圧縮も試す）
+- 置き換え前に元画像と RGBA の全画素が一致することを確認
+- 処理済みの画像は SHA-256 を .cache/png_optimize.json に記録し、次回以降は読み込まない
+- CPU コア数ぶん並列に処理し、フォルダごとの削減バイト数を表示
+- 拡張子が .png でも中身が PNG でないファイル（JPEG など）は変換せず報告
+
+画像を置き換えたあとは、画像のハッシュを使う生成物も作り直してください:
+  python tools/build.py
+
+使い方:
+  python tools/utilities/optimize_png.py --dry-run     # 削減量を見積もるだけ（書き換えない）
+  python tools/utilities/optimize_png.py
+  python tools/utilities/optimize_png.py normal shinies --jobs 4
+  python tools/utilities/optimize_png.py --zopfli      # 時間はかかるが最小
+
+依存:
+  pip install pillow numpy
+  pip install zopfli   # 任意（--zopfli 用）
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, UnidentifiedImageError
+
+try:
+    import zopfli.png as zopflipng
+except ImportError:
+    zopflipng = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from json_store import write_text_atomic  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[2]
+IMAGE_DIR = ROOT / 'pokemon_images'
+STATE_FILE = ROOT / '.cache' / 'png_optimize.json'
+
+FOLDERS = ('normal', 'shinies', 'forms', 'patterns', 'mega_evolutions', 'gender_differences')
+SRGB_GAMMA = 0.45455
+PALETTE_BITS = ((2, 1), (4, 2), (16, 4), (256, 8))   # (色数の上限, ビット数)
+
+
+def sha256_hex(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def rgba_pixels(image):
+    return np.asarray(image.convert('RGBA'))
+
+
+def encode(image, **options):
+    buf = io.BytesIO()
+    image.save(buf, format='PNG', optimize=True, **options)
+    return buf.getvalue()
+
+
+def palette_image(pixels):
+    """256色以下なら パレット画像と tRNS を返す（それ以外は None）"""
+    packed = pixels.reshape(-1, 4).view(np.uint32).ravel()
+    colors, inverse = np.unique(packed, return_inverse=True)
+    if len(colors) > 256:
+        return None
+    rgba = colors.view(np.uint8).reshape(-1, 4)
+    # 透過のある色を先頭に並べ、tRNS を短くする
+    order = np.argsort(rgba[:, 3], kind='stable')
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    rgba = rgba[order]
+    indices = rank[inverse].astype(np.uint8).reshape(pixels.shape[:2])
+
+    image = Image.fromarray(indices, 'P')
+    image.putpalette(rgba[:, :3].tobytes())
+    options = {'bits': next(bits for limit, bits in PALETTE_BITS if len(colors) <= limit)}
+    translucent = int(np.count_nonzero(rgba[:, 3] < 255))
+    if translucent:
+        options['transparency'] = rgba[:translucent, 3].tobytes()
+    return image, options
+
+
+def candidates(image, pixels):
+    """画素が同じになる保存方法の候補（エンコード済みのバイト列）"""
+    yield encode(image)
+    if image.mode == 'RGBA' and pixels[..., 3].min() == 255:
+        yield encode(image.convert('RGB'))
+    palette = palette_image(pixels)
+    if palette:
+        yield encode(palette[0], **palette[1])
+
+
+def optimize_file(job):
+    """1ファイルを最適化（ワーカープロセスで実行）。(相対パス, 状態, 元のバイト数, 結果のバイト数, 結果の SHA-256)"""
+    relpath, use_zopfli, dry_run = job
+    path = IMAGE_DIR / relpath
+    original = path.read_bytes()
+    try:
+        with Image.open(io.BytesIO(original)) as im:
+            if im.format != 'PNG':
+                return relpath, f'not_png:{im.format}', len(original), len(original), sha256_hex(original)
+            gamma = im.info.get('gamma')
+            if gamma is not None and abs(gamma - SRGB_GAMMA) > 1e-4:
+                return relpath, 'gamma', len(original), len(original), sha256_hex(original)
+            if im.info.get('icc_profile'):
+                return relpath, 'icc', len(original), len(original), sha256_hex(original)
+            im.load()
+            image = im if im.mode in ('RGB', 'RGBA', 'P', 'L', 'LA') else im.convert('RGBA')
+            pixels = rgba_pixels(im)
+    except (UnidentifiedImageError, OSError):
+        return relpath, 'unreadable', len(original), len(original), sha256_hex(original)
+
+    best = min(candidates(image, pixels), key=len)
+    if use_zopfli and zopflipng is not None:
+        best = min(best, zopflipng.optimize(best), key=len)
+
+    if len(best) >= len(original):
+        return relpath, 'optimal', len(original), len(original), sha256_hex(original)
+    with Image.open(io.BytesIO(best)) as check:
+        if not np.array_equal(rgba_pixels(check), pixels):
+            return relpath, 'mismatch', len(original), len(original), sha256_hex(original)
+
+    if not dry_run:
+        tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+        tmp.write_bytes(best)
+        os.replace(tmp, path)
+    return relpath, 'optimized', len(original), len(best), sha256_hex(best)
+
+
+def load_state():
+    try:
+        return json.loads(STATE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def pending_files(folders, state):
+    """前回の処理後から変わったファイル（更新時刻・サイズが同じなら読まず、違えば SHA-256 で確認）"""
+    pending = []
+    unchanged = 0
+    for folder in folders:
+        for path in sorted((IMAGE_DIR / folder).glob('*.png')):
+            relpath = path.relative_to(IMAGE_DIR).as_posix()
+            st = path.stat()
+            recorded = state.get(relpath)
+            if recorded and recorded[:2] == [st.st_mtime_ns, st.st_size]:
+                unchanged += 1
+                continue
+            if recorded and st.st_size and recorded[2] == sha256_hex(path.read_bytes()):
+                state[relpath] = [st.st_mtime_ns, st.st_size, recorded[2]]
+                unchanged += 1
+                continue
+            if st.st_size == 0:
+                continue
+            pending.append(relpath)
+    return pending, unchanged
+
+
+def optimize(folders=FOLDERS, jobs=None, use_zopfli=False, dry_run=False):
+    started = time.perf_counter()
+    if use_zopfli and zopflipng is None:
+        print("⚠️ zopfli が無いため zlib のみで圧縮します（pip install zopfli）")
+    state = load_state()
+    pending, unchanged = pending_files(folders, state)
+    print(f"🗜️ PNG 再圧縮{'（見積もりのみ）' if dry_run else ''}: 対象 {len(pending)} 枚 / 処理済み {unchanged} 枚")
+
+    totals = defaultdict(lambda: [0, 0, 0, 0])   # フォルダ → [枚数, 最適化した枚数, 元のバイト数, 結果のバイト数]
+    notes = []
+    if pending:
+        jobs_list = [(relpath, use_zopfli, dry_run) for relpath in pending]
+        with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+            for done, (relpath, status, before, after, digest) in enumerate(
+                    pool.map(optimize_file, jobs_list, chunksize=8), 1):
+                folder = relpath.split('/')[0]
+                total = totals[folder]
+                total[0] += 1
+                total[1] += status == 'optimized'
+                total[2] += before
+                total[3] += after
+                if status not in ('optimized', 'optimal'):
+                    notes.append((relpath, status))
+                # 変換しなかったファイルも記録して次回は読まない（画素が一致しなかったものだけは毎回試す）
+                if not dry_run and status != 'mismatch':
+                    st = (IMAGE_DIR / relpath).stat()
+                    state[relpath] = [st.st_mtime_ns, st.st_size, digest]
+                if done % 200 == 0:
+                    print(f"  📊 {done}/{len(pending)}")
+
+    if not dry_run:
+        write_text_atomic(STATE_FILE, json.dumps(state, ensure_ascii=False, sort_keys=True, separators=(',', ':')))
+
+    print(f"{'folder':<22}{'files':>7}{'smaller':>9}{'before':>14}{'after':>14}{'saved':>14}{'':>8}")
+    grand = [0, 0, 0, 0]
+    for folder in folders:
+        if folder not in totals:
+            continue
+        count, smaller, before, after = totals[folder]
+        grand = [g + v for g, v in zip(grand, totals[folder])]
+        print(f"{folder:<22}{count:>7}{smaller:>9}{before:>14,}{after:>14,}{before - after:>14,}"
+              f"{(before - after) / before * 100 if before else 0:>7.1f}%")
+    count, smaller, before, after = grand
+    print(f"{'合計':<20}{count:>7}{smaller:>9}{before:>14,}{after:>14,}{before - after:>14,}"
+          f"{(before - after) / before * 100 if before else 0:>7.1f}%")
+
+    messages = {
+        'gamma': 'sRGB 以外のガンマ値のため変更せず',
+        'icc': 'ICC プロファイル付きのため変更せず',
+        'unreadable': '画像として読めない',
+        'mismatch': '再圧縮後の画素が一致しないため変更せず',
+    }
+    for relpath, status in notes:
+        message = messages.get(status) or f"中身が PNG ではない（{status.split(':', 1)[1]}）"
+        print(f"  ⚠️ {relpath}: {message}")
+    print(f"✅ 完了 ({time.perf_counter() - started:.1f}秒)")
+    return grand
+
+
+def main():
+    ap = argparse.ArgumentParser(description='PNG 可逆再圧縮')
+    ap.add_argument('folders', nargs='*', help=f"対象フォルダ（{' / '.join(FOLDERS)}、省略時は全て）")
+    ap.add_argument('--jobs', type=int, default=None, help='並列プロセス数（既定: CPU コア数）')
+    ap.add_argument('--zopfli', action='store_true', help='zopflipng による再圧縮も試す（要 pip install zopfli）')
+    ap.add_argument('--dry-run', action='store_true', help='削減量を見積もるだけで書き換えない')
+    args = ap.parse_args()
+    unknown = [f for f in args.folders if f not in FOLDERS]
+    if unknown:
+        ap.error(f"未知のフォルダ: {', '.join(unknown)}")
+
+    optimize(tuple(args.folders) or FOLDERS, args.jobs, args.zopfli, args.dry_run)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+静的アセット事前圧縮ツール
+- JSON / HTML / CSS / JS の隣に .gz（と brotli があれば .br）を生成
+- server_engine.py が Accept-Encoding を見て圧縮版を返します
+- 元ファイルより新しい圧縮版が既にあればスキップ（差分ビルド）
+
+使い方:
+  python tools/utilities/precompress_assets.py
+  python tools/utilities/precompress_assets.py --force
+
+依存（任意）:
+  pip install brotli   # 無い場合は .gz のみ生成
+"""
+
+import argparse
+import gzip
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# 圧縮対象（ROOT からの glob）
+TARGET_PATTERNS = [
+    '*.html',
+    '*.css',
+    '*.js',
+    'data/**/*.json',
+    'pokemon_images/derived/manifest.json',
+]
+
+# 画像など既に圧縮済みの形式は対象外（拡張子で判定）
+COMPRESSIBLE_SUFFIXES = {'.html', '.css', '.js', '.json'}
+
+
+def iter_assets():
+    seen = set()
+    for pattern in TARGET_PATTERNS:
+        for p in sorted(ROOT.glob(pattern)):
+            if p.is_file() and p.suffix in COMPRESSIBLE_SUFFIXES and p not in seen:
+                seen.add(p)
+                yield p
+
+
+def encoders():
+    """(拡張子, 圧縮関数) の一覧"""
+    result = [('.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        result.append(('.br', lambda data: brotli.compress(data, quality=11)))
+    return result
+
+
+def is_fresh(src: Path, dst: Path) -> bool:
+    return dst.exists() and dst.stat().st_mtime_ns >= src.stat().st_mtime_ns
+
+
+def precompress(force=False):
+    """全アセットを圧縮し、ファイルごとの結果一覧を返す"""
+    results = []
+    for src in iter_assets():
+        data = None
+        sizes = {}
+        for suffix, compress in encoders():
+            dst = src.with_name(src.name + suffix)
+            if not force and is_fresh(src, dst):
+                sizes[suffix] = dst.stat().st_size
+                continue
+            if data is None:
+                data = src.read_bytes()
+            compressed = compress(data)
+            if len(compressed) >= len(data):
+                # 小さくならないなら置かない（サーバーは元ファイルを返す）
+                if dst.exists():
+                    dst.unlink()
+                continue
+            dst.write_bytes(compressed)
+            sizes[suffix] = len(compressed)
+        results.append((src, src.stat().st_size, sizes))
+    return results
+
+
+def print_report(results):
+    print(f"{'file':<48}{'original':>12}{'gzip':>12}{'brotli':>12}{'saved':>8}")
+    total_orig = total_best = 0
+    for src, orig, sizes in results:
+        best = min(sizes.values()) if sizes else orig
+        total_orig += orig
+        total_best += best
+        gz = f"{sizes['.gz']:,}" if '.gz' in sizes else '-'
+        br = f"{sizes['.br']:,}" if '.br' in sizes else '-'
+        saved = (1 - best / orig) * 100 if orig else 0
+        print(f"{str(src.relative_to(ROOT)):<48}{orig:>12,}{gz:>12}{br:>12}{saved:>7.1f}%")
+    print("-" * 92)
+    if total_orig:
+        print(f"合計: {total_orig:,} bytes -> {total_best:,} bytes "
+              f"({(1 - total_best / total_orig) * 100:.1f}% 削減)")
+
+
+def main():
+    ap = argparse.ArgumentParser(description='静的アセットの .gz/.br を生成')
+    ap.add_argument('--force', action='store_true', help='新しい圧縮版があっても作り直す')
+    ap.add_argument('--quiet', action='store_true', help='ファイル別の表を出さない')
+    args = ap.parse_args()
+
+    if brotli is None:
+        print("⚠️ brotli が見つからないため .gz のみ生成します（pip install brotli）")
+
+    results = precompress(force=args.force)
+    if not args.quiet:
+        print_report(results)
+    print(f"✅ {len(results)} ファイルを事前圧縮しました")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,19 +7,18 @@
 
 import json
 import os
+import sys
 from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pokedex_core  # noqa: E402
 
 def load_all_pokemon_data():
-    """全世代のポケモンデータを読み込み"""
-    all_pokemon = {}
-    
-    for gen in range(1, 10):
-        filename = f"gen{gen}_pokemon.json"
-        if os.path.exists(filename):
-            print(f"読み込み中: {filename}")
-            with open(filename, 'r', encoding='utf-8') as f:
-                gen_data = json.load(f)
-                all_pokemon.update(gen_data)
+    """全世代のポケモンデータを読み込み（カレントディレクトリの gen*_pokemon.json）"""
+    pokedex = pokedex_core.load(Path.cwd())
+    all_pokemon = {str(pid): info for pid, info in sorted(pokedex.by_id.items())}
     
     print(f"総ポケモン数: {len(all_pokemon)}")
     return all_pokemon